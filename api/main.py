@@ -1,23 +1,38 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import asyncio
+import base64
+import hashlib
+import json
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, List, Literal, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Literal, Optional
 from pathlib import Path
 from datetime import datetime
 
-from src.models import Filters, SearchFilters
-from src.graph.run_graph import run_review
-from src.search.semantic_search import semantic_search, hybrid_search
+from src.models import Filters, Paper, SearchFilters
+from src.config import get_settings, on_reload, watch_env_file
+from src.config_search import SearchConfig, get_search_config
+from src.jobs.store import get_job_store
+from src.jobs.worker import get_job_dispatcher
+from src.search.paper_resolver import classify_id, resolve_papers
+from src.search.query_cache import normalize_query
+from src.tools.circuit_breaker import breaker_states
+from src.tools.registry import source_names
+from src.utils.cache import TTLCache
 from src.agents.search_agent import run_search
-from src.agents.search_agent_v2 import run_search_v2
+from src.agents.search_agent_v2 import SearchEventHook, run_search_v2
+
+
+JobState = Literal["queued", "running", "done", "failed", "cancelled"]
 
 
 class JobStatus(BaseModel):
-	status: Literal["running", "done", "failed"]
+	status: JobState
 	message: Optional[str] = None
 
 
@@ -26,12 +41,19 @@ class Job(BaseModel):
 	topic: str
 	created_at: datetime
 	filters: Filters
-	status: Literal["running", "done", "failed"] = "running"
+	status: JobState = "queued"
+	priority: int = 0
+	stage: Optional[str] = None
+	progress: float = 0.0
 	markdown_path: Optional[str] = None
 	json_path: Optional[str] = None
 	csv_path: Optional[str] = None
 	message: Optional[str] = None
 
+	@classmethod
+	def from_record(cls, record: Dict[str, Any]) -> "Job":
+		return cls(**{**record, "created_at": datetime.utcfromtimestamp(record["created_at"])})
+
 
 class QARequest(BaseModel):
 	question: str
@@ -64,9 +86,33 @@ class RunPayload(BaseModel):
 	oa_only: bool = False
 	review_filter: Literal["off", "soft", "hard"] = "off"
 	enabled_sources: str | None = None  # Comma-separated list
+	# Job scheduling
+	priority: int = 0
+	stream: bool = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	# Seed the embedding store off the request path so semantic search is ready sooner
+	if get_search_config().warmup_on_startup:
+		from src.search.warmup import start_background_warmup
 
+		start_background_warmup()
+	# Settings are memoized; optionally pick up .env edits without a restart
+	if get_settings().config_hot_reload:
+		watch_env_file()
+	# Review jobs run off the event loop; jobs left running by a previous process are requeued
+	dispatcher = get_job_dispatcher()
+	dispatcher.start()
+	yield
+	dispatcher.stop()
+	# Search results still queued for the local corpus
+	from src.search.corpus_writer import flush_corpus_writers
 
-app = FastAPI(title="Literature Review Agent API")
+	flush_corpus_writers(timeout=5.0)
+
+
+app = FastAPI(title="Literature Review Agent API", lifespan=lifespan)
 
 app.add_middleware(
 	CORSMiddleware,
@@ -76,8 +122,6 @@ app.add_middleware(
 	allow_headers=["*"],
 )
 
-_JOBS: Dict[str, Job] = {}
-
 
 def _to_filters(p: RunPayload) -> Filters:
 	# Parse enabled sources
@@ -95,52 +139,72 @@ def _to_filters(p: RunPayload) -> Filters:
 	)
 
 
-async def _execute_job(job_id: str) -> None:
-	job = _JOBS.get(job_id)
-	if not job:
-		return
-	try:
-		md, js = run_review(job.topic, job.filters)
-		csv = str(Path(js).with_name(Path(js).name.replace("review_", "papers_").replace(".json", ".csv")))
-		# Update
-		job.status = "done"
-		job.markdown_path = md
-		job.json_path = js
-		job.csv_path = csv
-	except Exception as e:  # pragma: no cover - runtime safeguard
-		job.status = "failed"
-		job.message = str(e)
+def _get_job(job_id: str) -> Job:
+	record = get_job_store().get(job_id)
+	if not record:
+		raise HTTPException(status_code=404, detail="Job not found")
+	return Job.from_record(record)
 
 
 @app.post("/run", response_model=Job)
-async def run(payload: RunPayload, bg: BackgroundTasks):
+async def run(payload: RunPayload, request: Request):
 	filters = _to_filters(payload)
-	job_id = str(uuid4())
-	job = Job(job_id=job_id, topic=payload.topic, created_at=datetime.utcnow(), filters=filters)
-	_JOBS[job_id] = job
-	bg.add_task(_execute_job, job_id)
-	return job
+	record = get_job_store().create(
+		payload.topic,
+		filters,
+		priority=payload.priority,
+		client=request.client.host if request.client else "",
+		streaming=payload.stream,
+	)
+	get_job_dispatcher().notify()
+	return Job.from_record(record)
+
+
+@app.post("/cancel/{job_id}", response_model=Job)
+async def cancel(job_id: str):
+	job = _get_job(job_id)
+	if job.status not in ("queued", "running"):
+		raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+	return Job.from_record(get_job_store().request_cancel(job_id))
+
+
+@app.post("/resume/{job_id}", response_model=Job)
+async def resume(job_id: str):
+	job = _get_job(job_id)
+	if job.status not in ("failed", "cancelled"):
+		raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+	# The job id doubles as the checkpoint thread, so the requeued job resumes where it stopped
+	record = get_job_store().requeue(job_id)
+	get_job_dispatcher().notify()
+	return Job.from_record(record)
 
 
 @app.get("/result/{job_id}", response_model=Job)
 async def result(job_id: str):
-	job = _JOBS.get(job_id)
-	if not job:
-		raise HTTPException(status_code=404, detail="Job not found")
-	return job
+	return _get_job(job_id)
 
 
 @app.get("/jobs", response_model=List[Job])
 async def jobs():
 	# Most recent first
-	return sorted(_JOBS.values(), key=lambda j: j.created_at, reverse=True)
+	return [Job.from_record(r) for r in get_job_store().list()]
+
+
+@app.get("/health/sources")
+async def health_sources():
+	# Circuit breaker state and observed latency per source; open circuits are skipped by searches
+	from src.tools.http_client import hedge_stats
+
+	states = breaker_states(source_names())
+	for source, hedging in hedge_stats().items():
+		if source in states:
+			states[source]["hedging"] = hedging
+	return states
 
 
 @app.get("/download/{job_id}/{kind}")
 async def download(job_id: str, kind: Literal["md", "json", "csv"]):
-	job = _JOBS.get(job_id)
-	if not job:
-		raise HTTPException(status_code=404, detail="Job not found")
+	job = _get_job(job_id)
 	path = None
 	if kind == "md":
 		path = job.markdown_path
@@ -153,22 +217,18 @@ async def download(job_id: str, kind: Literal["md", "json", "csv"]):
 	return FileResponse(path, filename=Path(path).name)
 
 
-@app.get("/api/search")
-async def search_papers(
-    q: str,
-    description: Optional[str] = None,
-    mode: Literal["title", "semantic", "hybrid"] = "title",
-    k: int = 50,
-	start_year: Optional[int] = None,
-	end_year: Optional[int] = None,
-	include_keywords: Optional[str] = None,
-	exclude_keywords: Optional[str] = None,
-	venues: Optional[str] = None,
-	must_have_pdf: bool = False,
-	oa_only: bool = False,
-	review_filter: Literal["off", "soft", "hard"] = "off"
-):
-	"""Search for papers using different modes"""
+def _search_filters(
+	q: str,
+	start_year: Optional[int],
+	end_year: Optional[int],
+	include_keywords: Optional[str],
+	exclude_keywords: Optional[str],
+	venues: Optional[str],
+	k: int,
+	must_have_pdf: bool,
+	oa_only: bool,
+	review_filter: Literal["off", "soft", "hard"],
+) -> SearchFilters:
 	if not q or len(q.strip()) < 3:
 		raise HTTPException(status_code=400, detail="Query must be at least 3 characters long")
 	
@@ -215,60 +275,303 @@ async def search_papers(
 				norm.append(c)
 		if norm:
 			search_filters.include_keywords = list(dict.fromkeys(norm))
-	
+	return search_filters
+
+
+def _search_config(sources: Optional[str]) -> Optional[SearchConfig]:
+	"""Per-request SearchConfig limited to the given comma-separated sources (None = defaults)"""
+	if not sources:
+		return None
+	config = get_search_config()
+	requested = {s.strip().lower() for s in sources.split(",") if s.strip()}
+	unknown = requested - set(config.enable_sources)
+	if unknown:
+		raise HTTPException(status_code=400, detail=f"Unknown sources: {', '.join(sorted(unknown))}")
+	return config.with_overrides(enable_sources={name: name in requested for name in config.enable_sources})
+
+
+def _search(
+	q: str,
+	description: Optional[str],
+	mode: Literal["title", "semantic", "hybrid"],
+	search_filters: SearchFilters,
+	k: int,
+	on_event: Optional[SearchEventHook] = None,
+	config: Optional[SearchConfig] = None,
+) -> List[Paper]:
+	if mode == "title":
+		# Use V2 multi-source pipeline for better recall and ranking
+		papers, _diagnostics = run_search_v2(q, search_filters, on_event=on_event, config=config)
+		if not papers:
+			# Fallback to legacy title-based search if V2 returns empty
+			legacy_filters = Filters(
+				start_year=search_filters.start_year,
+				end_year=search_filters.end_year,
+				include_keywords=search_filters.include_keywords,
+				exclude_keywords=search_filters.exclude_keywords,
+				venues=search_filters.venues,
+				limit=k
+			)
+			papers = run_search(q, legacy_filters)
+		return papers
+	# Semantic modes pull in numpy and the embedding store, so load them on first use
+	if mode == "semantic":
+		from src.search.semantic_search import semantic_search
+
+		return semantic_search(q, search_filters, k=k)
+	if mode == "hybrid":
+		from src.search.semantic_search import hybrid_search
+
+		description_query = description or ""
+		return hybrid_search(q, description_query, search_filters, k=k)
+	raise HTTPException(status_code=400, detail="Invalid search mode")
+
+
+def _paper_result(paper: Paper) -> Dict[str, Any]:
+	return {
+		"id": paper.id,
+		"title": paper.title,
+		"abstract": paper.abstract,
+		"authors": paper.authors,
+		"year": paper.year,
+		"venue": paper.venue,
+		"doi": paper.doi,
+		"url": paper.url,
+		"pdf_url": paper.pdf_url,
+		"citations_count": paper.citations_count,
+		"source": paper.source,
+		"relevance_score": (paper.score_components.final if paper.score_components else 0.0),
+		"reasons": paper.reasons
+	}
+
+
+def _search_response(q: str, mode: str, papers: List[Paper]) -> Dict[str, Any]:
+	# Ensure results are already ranked by backend; do not resort here
+	results = [_paper_result(p) for p in papers]
+	return {
+		"query": q,
+		"mode": mode,
+		"total_results": len(results),
+		"papers": results
+	}
+
+
+_result_cache: Optional[TTLCache] = None
+
+
+def _get_result_cache() -> TTLCache:
+	global _result_cache
+	if _result_cache is None:
+		config = get_search_config()
+		_result_cache = TTLCache(maxsize=config.result_cache_size, ttl=config.result_cache_ttl)
+	return _result_cache
+
+
+def _reset_result_cache() -> None:
+	# Size/TTL and the source defaults may have changed
+	global _result_cache
+	_result_cache = None
+
+
+on_reload(_reset_result_cache)
+
+
+def _result_key(
+	q: str,
+	description: Optional[str],
+	mode: str,
+	search_filters: SearchFilters,
+	k: int,
+	config: Optional[SearchConfig] = None,
+) -> str:
+	"""Cache key for a ranked result set: normalized query text plus the effective filters"""
+	sources = sorted(name for name, enabled in config.enable_sources.items() if enabled) if config else None
+	raw = json.dumps(
+		[normalize_query(q), normalize_query(description or ""), mode, k, search_filters.model_dump(mode="json"), sources],
+		sort_keys=True,
+	)
+	return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _encode_cursor(key: str, offset: int) -> str:
+	return base64.urlsafe_b64encode(json.dumps({"k": key, "o": offset}).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, key: str) -> int:
 	try:
-		if mode == "title":
-			# Use V2 multi-source pipeline for better recall and ranking
-			papers, _diagnostics = run_search_v2(q, search_filters)
-			if not papers:
-				# Fallback to legacy title-based search if V2 returns empty
-				legacy_filters = Filters(
-					start_year=start_year,
-					end_year=end_year,
-					include_keywords=search_filters.include_keywords,
-					exclude_keywords=search_filters.exclude_keywords,
-					venues=search_filters.venues,
-					limit=k
-				)
-				papers = run_search(q, legacy_filters)
-		elif mode == "semantic":
-			papers = semantic_search(q, search_filters, k=k)
-		elif mode == "hybrid":
-			description_query = description or ""
-			papers = hybrid_search(q, description_query, search_filters, k=k)
-		else:
-			raise HTTPException(status_code=400, detail="Invalid search mode")
-		
-		# Convert papers to response format
-		results = []
-		for paper in papers:
-			result = {
-				"id": paper.id,
-				"title": paper.title,
-				"abstract": paper.abstract,
-				"authors": paper.authors,
-				"year": paper.year,
-				"venue": paper.venue,
-				"doi": paper.doi,
-				"url": paper.url,
-				"pdf_url": paper.pdf_url,
-				"citations_count": paper.citations_count,
-				"source": paper.source,
-				"relevance_score": (paper.score_components.final if paper.score_components else 0.0),
-				"reasons": paper.reasons
-			}
-			results.append(result)
-		
-		# Ensure results are already ranked by backend; do not resort here
-		return {
-			"query": q,
-			"mode": mode,
-			"total_results": len(results),
-			"papers": results
-		}
-		
-	except Exception as e:
-		raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+		data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+		offset = int(data["o"])
+	except Exception:
+		raise HTTPException(status_code=400, detail="Invalid cursor") from None
+	if data.get("k") != key or offset < 0:
+		raise HTTPException(status_code=400, detail="Cursor does not match this query")
+	return offset
+
+
+def _project(result: Dict[str, Any], fields: Optional[List[str]], include_abstract: bool) -> Dict[str, Any]:
+	if fields:
+		result = {f: result[f] for f in ["id", *fields] if f in result}
+	if not include_abstract:
+		result = {f: v for f, v in result.items() if f != "abstract"}
+	return result
+
+
+def _sse(event: str, data: Any) -> str:
+	return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+JOB_EVENTS_INTERVAL = 0.5
+
+
+@app.get("/api/search")
+async def search_papers(
+    request: Request,
+    q: str,
+    description: Optional[str] = None,
+    mode: Literal["title", "semantic", "hybrid"] = "title",
+    k: int = 50,
+	start_year: Optional[int] = None,
+	end_year: Optional[int] = None,
+	include_keywords: Optional[str] = None,
+	exclude_keywords: Optional[str] = None,
+	venues: Optional[str] = None,
+	must_have_pdf: bool = False,
+	oa_only: bool = False,
+	review_filter: Literal["off", "soft", "hard"] = "off",
+	sources: Optional[str] = None,
+	cursor: Optional[str] = None,
+	page_size: Optional[int] = None,
+	fields: Optional[str] = None,
+	include_abstract: bool = True,
+):
+	"""Search for papers using different modes.
+
+	`sources` (comma-separated) limits title search to those sources for this
+	request only. Ranked result sets are cached by normalized query and filters,
+	so later pages (`cursor` from `next_cursor`, `page_size`) and different
+	projections (`fields`, `include_abstract`) are cheap reads. Responses carry
+	an ETag for If-None-Match.
+	"""
+	search_filters = _search_filters(
+		q, start_year, end_year, include_keywords, exclude_keywords, venues, k, must_have_pdf, oa_only, review_filter
+	)
+	config = _search_config(sources)
+	key = _result_key(q, description, mode, search_filters, k, config)
+	offset = _decode_cursor(cursor, key) if cursor else 0
+	cache = _get_result_cache()
+	response = cache.get(key)
+	if response is None:
+		try:
+			papers = await run_in_threadpool(_search, q, description, mode, search_filters, k, None, config)
+		except HTTPException:
+			raise
+		except Exception as e:
+			raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+		response = _search_response(q, mode, papers)
+		cache.set(key, response)
+
+	ranked = response["papers"]
+	end = len(ranked) if page_size is None else offset + max(1, page_size)
+	field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+	body = {
+		**response,
+		"papers": [_project(r, field_list, include_abstract) for r in ranked[offset:end]],
+		"next_cursor": _encode_cursor(key, end) if end < len(ranked) else None,
+	}
+	etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()[:32] + '"'
+	if etag in [t.strip() for t in request.headers.get("if-none-match", "").split(",")]:
+		return Response(status_code=304, headers={"ETag": etag})
+	return JSONResponse(body, headers={"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"})
+
+
+@app.get("/api/search/stream")
+async def search_papers_stream(
+	q: str,
+	description: Optional[str] = None,
+	mode: Literal["title", "semantic", "hybrid"] = "title",
+	k: int = 50,
+	start_year: Optional[int] = None,
+	end_year: Optional[int] = None,
+	include_keywords: Optional[str] = None,
+	exclude_keywords: Optional[str] = None,
+	venues: Optional[str] = None,
+	must_have_pdf: bool = False,
+	oa_only: bool = False,
+	review_filter: Literal["off", "soft", "hard"] = "off",
+	sources: Optional[str] = None,
+):
+	"""Server-Sent Events version of /api/search.
+
+	Emits stage events as they happen (source, dedupe, provisional, ranking for
+	title mode), then `results` with the same payload as /api/search, or `error`.
+	"""
+	search_filters = _search_filters(
+		q, start_year, end_year, include_keywords, exclude_keywords, venues, k, must_have_pdf, oa_only, review_filter
+	)
+	config = _search_config(sources)
+	key = _result_key(q, description, mode, search_filters, k, config)
+	cached = _get_result_cache().get(key)
+	if cached is not None:
+		return StreamingResponse(iter([_sse("results", cached)]), media_type="text/event-stream", headers=SSE_HEADERS)
+
+	loop = asyncio.get_running_loop()
+	queue: asyncio.Queue = asyncio.Queue()
+
+	def on_event(name: str, data: Dict[str, Any]) -> None:
+		if name == "provisional":
+			# Serialize now: the same Paper objects are re-scored by later stages
+			data = {"papers": [_paper_result(p) for p in data["papers"]]}
+		loop.call_soon_threadsafe(queue.put_nowait, (name, data))
+
+	async def produce() -> None:
+		try:
+			papers = await loop.run_in_executor(None, _search, q, description, mode, search_filters, k, on_event, config)
+			response = _search_response(q, mode, papers)
+			_get_result_cache().set(key, response)
+			await queue.put(("results", response))
+		except Exception as e:
+			await queue.put(("error", {"detail": f"Search failed: {str(e)}"}))
+		finally:
+			await queue.put(None)
+
+	task = asyncio.create_task(produce())
+
+	async def events():
+		try:
+			while (item := await queue.get()) is not None:
+				yield _sse(*item)
+		finally:
+			task.cancel()
+
+	return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, request: Request):
+	"""Server-Sent Events stream of a job's status, stage and progress.
+
+	Sends a `progress` event whenever any of them changes and `end` once the job
+	reaches a terminal status, so clients do not need to poll /result.
+	"""
+	_get_job(job_id)
+	store = get_job_store()
+
+	async def events():
+		last = None
+		while not await request.is_disconnected():
+			# SQLite reads block; keep them off the event loop that serves every other request
+			job = Job.from_record(await run_in_threadpool(store.get, job_id))
+			snapshot = (job.status, job.stage, job.progress)
+			if snapshot != last:
+				last = snapshot
+				yield _sse("progress", job.model_dump(mode="json"))
+			if job.status in ("done", "failed", "cancelled"):
+				yield _sse("end", {"status": job.status})
+				break
+			await asyncio.sleep(JOB_EVENTS_INTERVAL)
+
+	return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @app.post("/api/qa", response_model=QAAnswer)
@@ -277,9 +580,13 @@ async def qa(payload: QARequest):
 	if not payload.paper_ids or not payload.question.strip():
 		raise HTTPException(status_code=400, detail="paper_ids and question are required")
 
-	# For simplicity, re-use title search to fetch paper metadata quickly
-	filters = Filters(limit=200)
-	papers = run_search(" ".join(payload.paper_ids), filters)
+	# Resolve the IDs directly (local corpus, then batched provider lookups)
+	resolved = await run_in_threadpool(resolve_papers, payload.paper_ids)
+	papers = list(resolved.values())
+	# IDs that are not identifiers (e.g. titles) can only be found by searching
+	unknown = [i for i in payload.paper_ids if i not in resolved and classify_id(i)[0] == "unknown"]
+	if unknown:
+		papers += await run_in_threadpool(run_search, " ".join(unknown), Filters(limit=200))
 	# Build small, focused synthesis
 	q_lower = payload.question.lower()
 	selected = []
@@ -325,9 +632,10 @@ async def related(payload: RelatedRequest):
     """Return related papers using either an explicit query or by resolving a paper_id.
 
     - If `query` is provided, we use it directly (prefer title + abstract from the client).
-    - Else, if `paper_id` is provided, we try to resolve metadata from the embedding store
-      to build a query from title + abstract. If that fails, we fall back to using the id
-      text itself as a query (legacy behavior).
+    - Else, if `paper_id` is provided, we try to resolve metadata by ID (local corpus, then
+      provider lookups), then from the embedding store, to build a query from
+      title + abstract. If that fails, we fall back to using the id text itself as a
+      query (legacy behavior).
     """
     if not payload.paper_id and not payload.query:
         raise HTTPException(status_code=400, detail="query or paper_id is required")
@@ -337,6 +645,10 @@ async def related(payload: RelatedRequest):
     if payload.query and payload.query.strip():
         q_text = payload.query.strip()
     elif payload.paper_id:
+        known = (await run_in_threadpool(resolve_papers, [payload.paper_id])).get(payload.paper_id)
+        if known:
+            q_text = f"{known.title} {known.abstract or ''}".strip()
+    if not q_text and payload.paper_id:
         # Try resolving from embedding store for richer context
         try:
             from src.search.embedding_store import get_embedding_store
@@ -1,4 +1,4 @@
-import { client } from './client'
+import { client, API_BASE } from './client'
 
 export type Filters = {
 	start_year?: number
@@ -14,7 +14,10 @@ export type Job = {
 	topic: string
 	created_at: string
 	filters: Filters
-	status: 'running' | 'done' | 'failed'
+	status: 'queued' | 'running' | 'done' | 'failed' | 'cancelled'
+	priority?: number
+	stage?: string
+	progress?: number
 	markdown_path?: string
 	json_path?: string
 	csv_path?: string
@@ -45,6 +48,16 @@ export async function getResult(jobId: string) {
 	return data
 }
 
+export async function cancelJob(jobId: string) {
+	const { data } = await client.post<Job>(`/cancel/${jobId}`)
+	return data
+}
+
+export async function resumeJob(jobId: string) {
+	const { data } = await client.post<Job>(`/resume/${jobId}`)
+	return data
+}
+
 export type SearchMode = 'title' | 'semantic' | 'hybrid'
 
 export type SearchResult = {
@@ -68,6 +81,7 @@ export type SearchResponse = {
 	mode: SearchMode
 	total_results: number
 	papers: SearchResult[]
+	next_cursor?: string | null
 }
 
 export async function searchPapers(
@@ -112,7 +126,7 @@ export function pollResult(jobId: string, onTick: (job: Job)=>void) {
 		try {
 			const job = await getResult(jobId)
 			onTick(job)
-			if (job.status === 'running') timer = setTimeout(tick, 3000)
+			if (job.status === 'queued' || job.status === 'running') timer = setTimeout(tick, 3000)
 		} catch(e) {
 			timer = setTimeout(tick, 5000)
 		}
@@ -120,3 +134,46 @@ export function pollResult(jobId: string, onTick: (job: Job)=>void) {
 	tick()
 	return ()=> timer && clearTimeout(timer)
 }
+
+// Server-Sent Events: the server pushes job progress, so no polling. Falls back to
+// pollResult if the stream cannot be opened.
+export function streamResult(jobId: string, onTick: (job: Job)=>void) {
+	if (typeof EventSource === 'undefined') return pollResult(jobId, onTick)
+	let stopPolling: (() => void) | null = null
+	const source = new EventSource(`${API_BASE}/jobs/${jobId}/events`)
+	source.addEventListener('progress', (e) => onTick(JSON.parse((e as MessageEvent).data)))
+	source.addEventListener('end', () => source.close())
+	source.onerror = () => {
+		source.close()
+		if (!stopPolling) stopPolling = pollResult(jobId, onTick)
+	}
+	return ()=> { source.close(); stopPolling && stopPolling() }
+}
+
+export type SearchStreamHandlers = {
+	onStage?: (event: string, data: any) => void
+	onProvisional?: (papers: SearchResult[]) => void
+	onResults: (response: SearchResponse) => void
+	onError?: (detail: string) => void
+}
+
+export function streamSearch(
+	query: string,
+	mode: SearchMode,
+	k: number,
+	handlers: SearchStreamHandlers,
+) {
+	const params = new URLSearchParams({ q: query, mode, k: k.toString() })
+	const source = new EventSource(`${API_BASE}/api/search/stream?${params}`)
+	for (const stage of ['source', 'dedupe', 'ranking']) {
+		source.addEventListener(stage, (e) => handlers.onStage?.(stage, JSON.parse((e as MessageEvent).data)))
+	}
+	source.addEventListener('provisional', (e) => handlers.onProvisional?.(JSON.parse((e as MessageEvent).data).papers))
+	source.addEventListener('results', (e) => { handlers.onResults(JSON.parse((e as MessageEvent).data)); source.close() })
+	source.addEventListener('error', (e) => {
+		const data = (e as MessageEvent).data
+		handlers.onError?.(data ? JSON.parse(data).detail : 'Search stream failed')
+		source.close()
+	})
+	return ()=> source.close()
+}
@@ -2,7 +2,7 @@ import { useEffect, useState } from 'react'
 import { useParams } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import { Download, FileText, Code, Table, Calendar, Clock, CheckCircle, XCircle, Loader2, AlertCircle } from 'lucide-react'
-import { getResult, pollResult, Job } from '../api/jobs'
+import { getResult, streamResult, Job } from '../api/jobs'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card'
 import { Button } from './ui/button'
 import { Badge } from './ui/badge'
@@ -49,14 +49,14 @@ export default function ReportView(){
 
 	useEffect(()=>{
 		if(!jobId) return
-		let stop = pollResult(jobId, (j)=> setJob(j))
+		let stop = streamResult(jobId, (j)=> setJob(j))
 		return ()=> stop()
 	},[jobId])
 
 	useEffect(()=>{ if(job && job.status==='failed') setError(job.message || 'Job failed') },[job])
 
 	if(!job) return <Loader />
-	if(job.status==='running') return <Loader />
+	if(job.status==='queued' || job.status==='running') return <Loader />
 	if(error) return <ErrorBanner message={error} />
 
 	const downloadFile = (kind: 'md'|'json'|'csv') => {
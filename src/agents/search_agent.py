@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Tuple
 
 from ..models import Paper, Filters
-from ..tools.arxiv_tool import search_arxiv
-from ..tools.pubmed_tool import search_pubmed
-from ..tools.crossref_tool import search_crossref, enrich_with_crossref
+from ..tools.registry import lazy_tool
 from ..utils.dedupe import dedupe_papers
 from ..utils.ranking import rank_papers
 from ..utils.logging import get_logger
@@ -66,18 +65,33 @@ def _apply_filters(papers: List[Paper], filters: Filters) -> List[Paper]:
     return [p for p in papers if ok(p)]
 
 
-def run_search(topic: str, filters: Filters) -> List[Paper]:
-    # Gather from all sources to get more papers before filtering
+SOURCES = [lazy_tool("arxiv"), lazy_tool("pubmed"), lazy_tool("crossref")]  # Always search Crossref for more results
+
+
+def enrich_papers_with_crossref(papers: List[Paper]) -> List[Paper]:
+    # Deferred like the search tools, so importing this module stays cheap
+    from ..tools.crossref_tool import enrich_papers_with_crossref as enrich
+
+    return enrich(papers)
+
+
+def _gather_sources(topic: str, filters: Filters) -> List[Paper]:
+    """Query arXiv, PubMed and Crossref concurrently (results kept in that order)"""
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+        futures = [executor.submit(search, topic, filters) for search in SOURCES]
     papers: List[Paper] = []
-    papers += search_arxiv(topic, filters)
-    papers += search_pubmed(topic, filters)
-    papers += search_crossref(topic, filters)  # Always search Crossref for more results
+    for future in futures:
+        try:
+            papers += future.result()
+        except Exception as e:
+            logger.warning(f"Legacy source search failed: {e}")
+    return papers
 
-    # Enrich
-    enriched = [enrich_with_crossref(p) for p in papers]
 
+def _select(papers: List[Paper], topic: str, filters: Filters) -> List[Paper]:
+    """Dedupe, filter (relaxing include keywords if too strict), rank and limit"""
     # Dedupe
-    deduped = dedupe_papers(enriched)
+    deduped = dedupe_papers(papers)
 
     # Filter
     filtered = _apply_filters(deduped, filters)
@@ -96,3 +110,41 @@ def run_search(topic: str, filters: Filters) -> List[Paper]:
     # Rank & limit
     ranked = rank_papers(filtered, topic, filters)
     return ranked[: filters.limit]
+
+
+def run_search(topic: str, filters: Filters) -> List[Paper]:
+    # Gather from all sources to get more papers before filtering
+    papers = _gather_sources(topic, filters)
+
+    # Enrich (bulk, cached, and only for papers missing metadata)
+    enriched = enrich_papers_with_crossref(papers)
+
+    return _select(enriched, topic, filters)
+
+
+def iter_search(topic: str, filters: Filters) -> Iterator[Tuple[List[Paper], bool]]:
+    """Stream provisional rankings as each source returns.
+
+    Yields (ranked top-`limit`, is_final). Provisional rankings cover the sources
+    seen so far without Crossref enrichment; the last yield matches `run_search`.
+    """
+    by_source: List[List[Paper]] = [[] for _ in SOURCES]
+    executor = ThreadPoolExecutor(max_workers=len(SOURCES))
+    try:
+        futures = {executor.submit(search, topic, filters): i for i, search in enumerate(SOURCES)}
+        pending = len(futures)
+        for future in as_completed(futures):
+            pending -= 1
+            try:
+                by_source[futures[future]] = future.result()
+            except Exception as e:
+                logger.warning(f"Legacy source search failed: {e}")
+                continue
+            if pending:
+                # Keep source order so dedupe picks the same representatives as run_search
+                yield _select([p for ps in by_source for p in ps], topic, filters), False
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    papers = [p for ps in by_source for p in ps]
+    yield _select(enrich_papers_with_crossref(papers), topic, filters), True
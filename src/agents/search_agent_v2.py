@@ -2,30 +2,23 @@ from __future__ import annotations
 
 import time
 import asyncio
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Optional
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..models import Paper, SearchFilters, SearchDiagnostics, QueryBundle
-from ..config_search import get_search_config
+from ..config_search import SearchConfig, get_search_config
 from ..utils.logging import get_logger
 from ..utils.text import slugify
 
-# Import search tools
-from ..tools.openalex_tool import search_openalex
-from ..tools.semantic_scholar_tool import search_semantic_scholar
-from ..tools.europe_pmc_tool import search_europe_pmc
-from ..tools.scholar_provider import search_scholar
-# from ..tools.unpaywall_tool import enrich_papers_with_oa  # Disabled for performance
-from ..tools.arxiv_tool import search_arxiv
-from ..tools.pubmed_tool import search_pubmed
-from ..tools.crossref_tool import search_crossref
-from ..tools.biorxiv_tool import search_biorxiv
-from ..tools.medrxiv_tool import search_medrxiv
-from ..tools.dblp_tool import search_dblp
-from ..tools.google_scholar_tool import search_google_scholar
+# Search tools are imported on first use, see tools.registry
+from ..tools.registry import get_tool
 
 # Import search modules
+from ..search.source_planner import SourcePlan, TopicCluster, plan_sources, topic_cluster
+from ..search.source_stats import get_source_stats
+from ..search.corpus_writer import get_corpus_writer
+from ..tools.circuit_breaker import get_breaker
 from ..search.query_builder import build_query_bundle, save_query_bundle
 from ..search.fusion import (
     dedupe_papers, reciprocal_rank_fusion, calculate_bm25_scores,
@@ -34,6 +27,11 @@ from ..search.fusion import (
 )
 
 logger = get_logger(__name__)
+
+# on_event(name, data) hook for progress streaming; called from worker threads too
+SearchEventHook = Callable[[str, Dict[str, Any]], None]
+
+
 def _normalize_text(text: str) -> str:
     import re
     t = (text or "").lower()
@@ -54,50 +52,44 @@ def _kw_variants(term: str) -> List[str]:
 def _search_source(source_name: str, query: str, filters: SearchFilters) -> List[Paper]:
     """Search a single source and return papers"""
     try:
-        if source_name == "openalex":
-            return search_openalex(query, filters)
-        elif source_name == "semanticscholar":
-            return search_semantic_scholar(query, filters)
-        elif source_name == "europe_pmc":
-            return search_europe_pmc(query, filters)
-        elif source_name == "scholar":
-            return search_scholar(query, filters)
-        elif source_name == "arxiv":
-            return search_arxiv(query, filters)
-        elif source_name == "pubmed":
-            return search_pubmed(query, filters)
-        elif source_name == "crossref":
-            return search_crossref(query, filters)
-        elif source_name == "biorxiv":
-            return search_biorxiv(query, filters)
-        elif source_name == "medrxiv":
-            return search_medrxiv(query, filters)
-        elif source_name == "dblp":
-            return search_dblp(query, filters)
-        elif source_name == "google_scholar":
-            return search_google_scholar(query, filters)
-        else:
-            logger.warning(f"Unknown source: {source_name}")
-            return []
+        search = get_tool(source_name)
+    except KeyError:
+        logger.warning(f"Unknown source: {source_name}")
+        return []
+    try:
+        return search(query, filters)
     except Exception as e:
         logger.error(f"Error searching {source_name}: {e}")
         return []
 
 
-def _search_all_sources(query: str, filters: SearchFilters) -> Dict[str, List[Paper]]:
-    """Search all enabled sources concurrently"""
-    config = get_search_config()
-    enabled_sources = [name for name, enabled in config.enable_sources.items() if enabled]
+def _search_all_sources(
+    query: str,
+    filters: SearchFilters,
+    on_source: Optional[Callable[[str, List[Paper]], None]] = None,
+    config: Optional[SearchConfig] = None,
+    plans: Optional[List[SourcePlan]] = None,
+    latencies: Optional[Dict[str, float]] = None,
+) -> Dict[str, List[Paper]]:
+    """Search the planned sources concurrently, calling `on_source` as each one returns.
+
+    `latencies`, if given, is updated with the slowest call seen per source.
+    """
+    if plans is None:
+        plans = plan_sources(filters, config)
     
     papers_by_source = {}
+    if not plans:
+        return papers_by_source
     
     # Use ThreadPoolExecutor for concurrent searches
-    with ThreadPoolExecutor(max_workers=len(enabled_sources)) as executor:
-        # Submit all search tasks
+    with ThreadPoolExecutor(max_workers=len(plans)) as executor:
+        # Submit all search tasks, each with the filters planned for its source
         future_to_source = {
-            executor.submit(_search_source, source, query, filters): source
-            for source in enabled_sources
+            executor.submit(_search_source, plan.name, query, plan.filters): plan.name
+            for plan in plans
         }
+        started = time.monotonic()
         
         # Collect results as they complete
         for future in as_completed(future_to_source):
@@ -109,13 +101,19 @@ def _search_all_sources(query: str, filters: SearchFilters) -> Dict[str, List[Pa
             except Exception as e:
                 logger.error(f"Search failed for {source}: {e}")
                 papers_by_source[source] = []
+            if latencies is not None:
+                latencies[source] = max(latencies.get(source, 0.0), time.monotonic() - started)
+            if on_source:
+                on_source(source, papers_by_source[source])
     
     return papers_by_source
 
 
-def _apply_soft_filters(papers: List[Paper], filters: SearchFilters) -> List[Paper]:
+def _apply_soft_filters(
+    papers: List[Paper], filters: SearchFilters, config: Optional[SearchConfig] = None
+) -> List[Paper]:
     """Apply soft filters with penalties instead of hard exclusions"""
-    config = get_search_config()
+    config = config or get_search_config()
     if config.strict_filters:
         # Use original hard filtering logic
         return _apply_hard_filters(papers, filters)
@@ -225,15 +223,68 @@ def _apply_hard_filters(papers: List[Paper], filters: SearchFilters) -> List[Pap
     return [p for p in papers if ok(p)]
 
 
-def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], SearchDiagnostics]:
-    """Run the new multi-source search pipeline"""
+def _paper_key(paper: Paper) -> str:
+    return (paper.doi or "").lower().strip() or " ".join((paper.title or "").lower().split())
+
+
+def _record_source_stats(
+    cluster: TopicCluster,
+    papers_by_source: Dict[str, List[Paper]],
+    latencies: Dict[str, float],
+    final_papers: List[Paper],
+    config: SearchConfig,
+) -> None:
+    """Credit each queried source with the share of final results it returned (duplicates count for all)"""
+    if not final_papers:
+        return
+    stats = get_source_stats(config.source_stats_path)
+    if stats is None:
+        return
+    final_keys = {_paper_key(p) for p in final_papers}
+    contributions = {
+        source: len(final_keys & {_paper_key(p) for p in papers}) / len(final_keys)
+        for source, papers in papers_by_source.items()
+    }
+    yields = {source: len({_paper_key(p) for p in papers}) for source, papers in papers_by_source.items()}
+    try:
+        stats.record(cluster.key, yields, latencies, contributions)
+    except Exception as e:  # statistics must never fail a search
+        logger.warning(f"Could not record source statistics: {e}")
+
+
+def _emit(on_event: Optional[SearchEventHook], name: str, data: Dict[str, Any]) -> None:
+    if on_event is None:
+        return
+    try:
+        on_event(name, data)
+    except Exception as e:  # a broken listener must not fail the search
+        logger.warning(f"Search event hook failed on {name}: {e}")
+
+
+def run_search_v2(
+    topic: str,
+    filters: SearchFilters,
+    on_event: Optional[SearchEventHook] = None,
+    config: Optional[SearchConfig] = None,
+) -> Tuple[List[Paper], SearchDiagnostics]:
+    """Run the new multi-source search pipeline.
+
+    `on_event(name, data)` receives stage events as they happen: "source"
+    (source, query_type, count), "dedupe" (before, after), "provisional" (papers
+    ranked before dense re-ranking) and "ranking" (count). `config` overrides the
+    process-wide SearchConfig for this search (e.g. a narrower set of sources).
+    """
     start_time = time.time()
-    config = get_search_config()
+    config = config or get_search_config()
     
     logger.info(f"Starting search for topic: {topic}")
     
-    # Step 1: Build query bundle
+    # Step 1: Build query bundle and decide which sources get which filters
     query_bundle = build_query_bundle(topic, filters)
+    cluster = topic_cluster(topic)
+    skipped_sources: Dict[str, str] = {}
+    plans = plan_sources(filters, config, skipped_sources, cluster)
+    latencies: Dict[str, float] = {}
     
     # Step 2: Search all sources with all queries (two-pass: precision then recall)
     all_papers = []
@@ -251,7 +302,16 @@ def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], Sear
         logger.info(f"Searching with {query_type} query: {query}")
         
         # Search all sources for this query
-        source_results = _search_all_sources(query, filters)
+        source_results = _search_all_sources(
+            query,
+            filters,
+            on_source=lambda source, papers, query_type=query_type: _emit(
+                on_event, "source", {"source": source, "query_type": query_type, "count": len(papers)}
+            ),
+            config=config,
+            plans=plans,
+            latencies=latencies,
+        )
         
         # Add provenance information
         for source, papers in source_results.items():
@@ -278,16 +338,17 @@ def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], Sear
     logger.info(f"Before deduplication: {len(all_papers)} papers")
     deduped_papers, dedupe_stats = dedupe_papers(all_papers)
     logger.info(f"After deduplication: {len(deduped_papers)} papers")
+    _emit(on_event, "dedupe", {"before": len(all_papers), "after": len(deduped_papers)})
     
     # Step 4: Skip Unpaywall enrichment for performance
     # Unpaywall enrichment is disabled to improve search speed
     
     # Step 5: Apply filters
-    filtered_papers = _apply_soft_filters(deduped_papers, filters)
+    filtered_papers = _apply_soft_filters(deduped_papers, filters, config)
     
     # Step 6: Ranking pipeline
     # Stage 1: RRF fusion (use configurable top_k)
-    fusion_k = get_search_config().fusion_top_k
+    fusion_k = config.fusion_top_k
     fusion_results = reciprocal_rank_fusion(papers_by_source, k=fusion_k)
     
     # Stage 2: BM25 scoring + prompt coverage boost
@@ -324,6 +385,7 @@ def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], Sear
     
     # Stage 3: Recency scoring
     recency_results = calculate_recency_scores(bm25_results)
+    _emit(on_event, "provisional", {"papers": recency_results[:filters.limit]})
     
     # Stage 4: Dense re-ranking (top window derived from fusion_k, capped)
     dense_window = min(400, max(200, fusion_k))
@@ -338,9 +400,15 @@ def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], Sear
     
     # Step 7: Apply limit
     final_papers = ranked_papers[:filters.limit]
+    _emit(on_event, "ranking", {"count": len(final_papers)})
     
-    # Step 8: Create diagnostics
+    # Step 8: Create diagnostics and update the per-cluster source statistics
     per_source_counts = {source: len(papers) for source, papers in papers_by_source.items()}
+    if config.adaptive_sources:
+        _record_source_stats(cluster, papers_by_source, latencies, final_papers, config)
+    if config.ingest_search_results:
+        # Written to the local corpus in the background, off the request path
+        get_corpus_writer(config.local_corpus_path, config.ingest_flush_seconds).submit(deduped_papers)
     
     diagnostics = SearchDiagnostics(
         query_bundle=query_bundle,
@@ -348,7 +416,10 @@ def run_search_v2(topic: str, filters: SearchFilters) -> Tuple[List[Paper], Sear
         dedupe_stats=dedupe_stats,
         fusion_params={"k": fusion_k, "weights": {"rrf": 0.6, "dense": 0.25, "recency": 0.15}},
         search_duration=time.time() - start_time,
-        api_retries=api_retries
+        api_retries=api_retries,
+        source_plan={plan.name: plan.describe() for plan in plans},
+        skipped_sources=skipped_sources,
+        open_circuits=[name for name in skipped_sources if get_breaker(name).state == "open"],
     )
     
     # Step 9: Save debug information
@@ -1,27 +1,64 @@
 from __future__ import annotations
 
-from typing import List
+import json
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 
 from ..models import Paper, Summary, Quote
 from ..config import get_settings
+from ..llm import get_chat_model
+from ..utils.logging import get_logger
+from .summary_cache import get_summary_cache, paper_cache_key, prompt_fingerprint
+
+logger = get_logger(__name__)
 
 
 PROMPT = ChatPromptTemplate.from_messages([
-    ("system", "You are an expert scientific summarizer. Extract TL;DR, methods, results, limitations, citations. Include up to 3 short grounded quotes from the abstract or main text if available. Respond in strict JSON with keys: tldr, methods, results, limitations, citations, grounding_score, quotes=[{text, section}]."),
+    ("system", "You are an expert scientific summarizer. Extract TL;DR, methods, results, limitations, citations. Include up to 3 short grounded quotes from the abstract or main text if available. Respond in strict JSON with keys: tldr, methods, results, limitations, citations, grounding_score, quotes=[{{text, section}}]."),
     ("human", "Paper Title: {title}\nAbstract: {abstract}\nIf you cannot find specific details, be concise and conservative.")
 ])
 
 
 def _get_llm():
     s = get_settings()
-    if s.llm_provider == "anthropic":
-        return ChatAnthropic(model="claude-3-5-sonnet-20240620", temperature=0)
-    else:
-        return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    # Shared per (provider, model): reuses the client and its HTTP connection pool
+    return get_chat_model(s.llm_provider, s.chat_model(), timeout=s.summary_timeout)
+
+
+# Several papers per request: the system prompt is paid once per batch instead of per paper
+BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are an expert scientific summarizer. For each numbered paper, extract TL;DR, methods, results, limitations, citations. Include up to 3 short grounded quotes from its abstract if available. Respond in strict JSON: an array with one object per paper, each with keys: index (the paper number), tldr, methods, results, limitations, citations, grounding_score, quotes=[{{text, section}}]."),
+    ("human", "{papers}\nIf you cannot find specific details, be concise and conservative.")
+])
+
+# Cached summaries are keyed by the prompt that produced them
+PROMPT_HASH = prompt_fingerprint(PROMPT)
+BATCH_PROMPT_HASH = prompt_fingerprint(BATCH_PROMPT)
+
+# Rough token accounting for packing batches (~4 characters per token)
+CHARS_PER_TOKEN = 4
+BATCH_OUTPUT_TOKENS_PER_PAPER = 300
+
+
+# prompt | llm composed once per (client, prompt)
+_chains: Dict[Tuple[int, int], Tuple[Any, Any, Any]] = {}
+_chains_lock = threading.Lock()
+
+
+def _get_chain(prompt: Any = None):
+    prompt = prompt if prompt is not None else PROMPT
+    llm = _get_llm()
+    key = (id(llm), id(prompt))
+    entry = _chains.get(key)
+    if entry is None or entry[0] is not llm or entry[1] is not prompt:
+        with _chains_lock:
+            entry = (llm, prompt, prompt | llm)
+            _chains[key] = entry
+    return entry[2]
 
 
 def _heuristic_summary(paper: Paper) -> Summary:
@@ -44,27 +81,378 @@ def _heuristic_summary(paper: Paper) -> Summary:
     )
 
 
-def summarize_paper(paper: Paper) -> Summary:
-    abstract = paper.abstract or ""
-    if not abstract:
-        return _heuristic_summary(paper)
-    llm = _get_llm()
-    chain = PROMPT | llm
+def _summary_from_data(data: Dict[str, Any]) -> Summary:
+    quotes = [Quote(**q) for q in (data.get("quotes") or [])][:3]
+    return Summary(
+        tldr=data.get("tldr", ""),
+        methods=data.get("methods"),
+        results=data.get("results"),
+        limitations=data.get("limitations"),
+        citations=data.get("citations"),
+        grounding_score=float(data.get("grounding_score", 0.0)),
+        quotes=quotes,
+    )
+
+
+def _message_text(msg: Any) -> str:
+    return msg.content if hasattr(msg, "content") else str(msg)
+
+
+def _llm_summary(paper: Paper, chain: Any = None) -> Summary:
+    """Summarize with the LLM; raises if the call or JSON parsing fails"""
+    chain = chain or _get_chain()
+    msg = chain.invoke({"title": paper.title, "abstract": paper.abstract or ""})
+    return _summary_from_data(json.loads(_message_text(msg)))
+
+
+def _estimate_tokens(paper: Paper) -> int:
+    return (len(paper.title or "") + len(paper.abstract or "")) // CHARS_PER_TOKEN + BATCH_OUTPUT_TOKENS_PER_PAPER
+
+
+def _pack_batches(indices: List[int], papers: List[Paper], token_budget: int) -> List[List[int]]:
+    """Group paper indices into batches whose estimated prompt+output tokens fit the budget"""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for i in indices:
+        cost = _estimate_tokens(papers[i])
+        if current and used + cost > token_budget:
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _llm_summaries_batch(papers: List[Paper], chain: Any = None) -> List[Optional[Summary]]:
+    """Summarize several papers in one request; elements that are missing or invalid come back as None"""
+    chain = chain or _get_chain(BATCH_PROMPT)
+    block = "\n\n".join(
+        f"[{n}] Paper Title: {p.title}\nAbstract: {p.abstract or ''}" for n, p in enumerate(papers)
+    )
+    data = json.loads(_message_text(chain.invoke({"papers": block})))
+    if isinstance(data, dict):
+        data = data.get("summaries") or data.get("papers") or []
+    out: List[Optional[Summary]] = [None] * len(papers)
+    for pos, item in enumerate(data if isinstance(data, list) else []):
+        if not isinstance(item, dict):
+            continue
+        n = item.get("index", pos)
+        if not isinstance(n, int) or not 0 <= n < len(papers) or out[n] is not None:
+            continue
+        try:
+            out[n] = _summary_from_data(item)
+        except Exception:
+            continue
+    return out
+
+
+def _summarize_one(paper: Paper, chain: Any = None) -> Tuple[Summary, bool]:
+    """Return (summary, came_from_llm); only LLM summaries are worth caching"""
+    if not paper.abstract:
+        return _heuristic_summary(paper), False
     try:
-        msg = chain.invoke({"title": paper.title, "abstract": abstract})
-        content = msg.content if hasattr(msg, "content") else str(msg)
-        import json
-
-        data = json.loads(content)
-        quotes = [Quote(**q) for q in (data.get("quotes") or [])][:3]
-        return Summary(
-            tldr=data.get("tldr", ""),
-            methods=data.get("methods"),
-            results=data.get("results"),
-            limitations=data.get("limitations"),
-            citations=data.get("citations"),
-            grounding_score=float(data.get("grounding_score", 0.0)),
-            quotes=quotes,
-        )
+        return _llm_summary(paper, chain), True
     except Exception:
-        return _heuristic_summary(paper)
+        return _heuristic_summary(paper), False
+
+
+def summarize_paper(paper: Paper, chain: Any = None) -> Summary:
+    return _summarize_one(paper, chain)[0]
+
+
+def _summarize_batch(
+    papers: List[Paper], chain: Any = None, batch_chain: Any = None
+) -> List[Tuple[Summary, Optional[str]]]:
+    """Summarize a packed batch, retrying failed elements one paper at a time.
+
+    Each summary comes with the fingerprint of the prompt that produced it
+    (None for heuristic summaries, which are not worth caching).
+    """
+    with_abstract = [n for n, p in enumerate(papers) if p.abstract]
+    batch: List[Optional[Summary]] = [None] * len(papers)
+    if len(with_abstract) > 1:
+        try:
+            for n, summary in zip(with_abstract, _llm_summaries_batch([papers[n] for n in with_abstract], batch_chain)):
+                batch[n] = summary
+        except Exception as e:
+            logger.warning("Batched summary request failed (%s); retrying papers individually", e)
+    out: List[Tuple[Summary, Optional[str]]] = []
+    for p, summary in zip(papers, batch):
+        if summary:
+            out.append((summary, BATCH_PROMPT_HASH))
+        else:
+            summary, from_llm = _summarize_one(p, chain)
+            out.append((summary, PROMPT_HASH if from_llm else None))
+    return out
+
+
+def _summary_cache() -> Any:
+    s = get_settings()
+    # Opened with both prompts so neither one's entries are purged as stale
+    return get_summary_cache(s.summary_cache_path, PROMPT, BATCH_PROMPT) if s.summary_cache_enabled else None
+
+
+def _summarize_via_batch_api(papers: List[Paper], indices: List[int]) -> Dict[int, Summary]:
+    """Submit papers as a provider batch job; returns the summaries that came back valid"""
+    from ..llm_batch import run_chat_batch
+
+    s = get_settings()
+    requests = {}
+    for i in indices:
+        if papers[i].abstract:
+            system, human = PROMPT.format_messages(title=papers[i].title, abstract=papers[i].abstract)
+            requests[f"paper-{i}"] = (system.content, human.content)
+    try:
+        contents = run_chat_batch(
+            requests,
+            s.llm_provider,
+            s.chat_model(),
+            api_key=s.anthropic_api_key if s.llm_provider == "anthropic" else s.openai_api_key,
+            base_url=s.anthropic_base_url if s.llm_provider == "anthropic" else s.openai_base_url,
+            poll_interval=s.summary_batch_poll_interval,
+            timeout=s.summary_batch_timeout,
+        )
+    except Exception as e:
+        logger.warning("Batch API summarization failed (%s); falling back to live requests", e)
+        return {}
+    summaries: Dict[int, Summary] = {}
+    for custom_id, content in contents.items():
+        try:
+            summaries[int(custom_id.rsplit("-", 1)[1])] = _summary_from_data(json.loads(content))
+        except Exception:
+            continue
+    return summaries
+
+
+def summarize_papers(
+    papers: List[Paper],
+    max_concurrency: Optional[int] = None,
+    on_summary: Optional[Callable[[int, Summary], None]] = None,
+) -> List[Summary]:
+    """Summarize papers with bounded concurrency, returning summaries in input order.
+
+    Papers already in the summary cache (same content, model and prompt) skip the
+    LLM. With SUMMARY_BATCH_MODE=prompt, papers are packed into multi-paper requests
+    up to SUMMARY_BATCH_TOKENS; with batch_api they go through the provider batch
+    API first. Concurrency defaults to the provider limit from settings. Papers whose
+    call errors or does not finish within the time budget get `_heuristic_summary`.
+    `on_summary(index, summary)` is called as each paper completes.
+    """
+    if not papers:
+        return []
+    s = get_settings()
+    results: List[Optional[Summary]] = [None] * len(papers)
+
+    model = f"{s.llm_provider}:{s.chat_model()}"
+    cache = _summary_cache()
+    if cache:
+        # Batch-prompt summaries are only acceptable to runs that would produce them anyway
+        prompts = [PROMPT_HASH, BATCH_PROMPT_HASH] if s.summary_batch_mode == "prompt" else [PROMPT_HASH]
+        for i, summary in cache.get_many(papers, model, prompts).items():
+            results[i] = summary
+            if on_summary:
+                on_summary(i, summary)
+        stats = cache.stats()
+        logger.info(
+            "Summary cache: %d/%d papers hit (lifetime hit rate %.0f%%)",
+            sum(r is not None for r in results), len(papers), 100 * stats["hit_rate"],
+        )
+    pending = [i for i, r in enumerate(results) if r is None]
+    # Newly generated summaries to cache, grouped by the prompt that produced them
+    fresh: Dict[str, List[Tuple[Paper, Summary]]] = {}
+
+    if pending and s.summary_batch_mode == "batch_api":
+        for i, summary in _summarize_via_batch_api(papers, pending).items():
+            results[i] = summary
+            fresh.setdefault(PROMPT_HASH, []).append((papers[i], summary))
+            if on_summary:
+                on_summary(i, summary)
+        # Whatever the batch job did not return goes through live requests below
+        pending = [i for i in pending if results[i] is None]
+
+    if s.summary_batch_mode == "prompt":
+        units = _pack_batches(pending, papers, s.summary_batch_tokens)
+    else:
+        units = [[i] for i in pending]
+
+    workers = max(1, min(max_concurrency or s.summary_concurrency(), len(units) or 1))
+    # Every request gets at most summary_timeout once it starts; queued ones wait for a slot
+    waves = -(-len(units) // workers)
+    budget = s.summary_timeout * (waves + 1)
+
+    # Resolve the client and chains once for the whole run
+    chain = batch_chain = None
+    if units:
+        try:
+            chain = _get_chain()
+            if any(len(unit) > 1 for unit in units):
+                batch_chain = _get_chain(BATCH_PROMPT)
+        except Exception as e:
+            logger.warning("LLM unavailable (%s); using heuristic summaries", e)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize")
+    futures = {
+        executor.submit(_summarize_batch, [papers[i] for i in unit], chain, batch_chain): unit for unit in units
+    }
+    try:
+        for future in as_completed(futures, timeout=budget):
+            unit = futures[future]
+            try:
+                outcomes = future.result()
+            except Exception:
+                outcomes = [(_heuristic_summary(papers[i]), None) for i in unit]
+            for i, (summary, prompt_hash) in zip(unit, outcomes):
+                results[i] = summary
+                if prompt_hash:
+                    fresh.setdefault(prompt_hash, []).append((papers[i], summary))
+                if on_summary:
+                    on_summary(i, summary)
+    except FuturesTimeout:
+        logger.warning("Summarization budget of %.0fs exceeded; using heuristic summaries for the rest", budget)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for i in pending:
+        if results[i] is None:
+            results[i] = _heuristic_summary(papers[i])
+            if on_summary:
+                on_summary(i, results[i])
+
+    if cache and fresh:
+        try:
+            for prompt_hash, items in fresh.items():
+                cache.put_many(items, model, prompt_hash)
+        except Exception as e:  # pragma: no cover - filesystem
+            logger.warning("Could not store summaries in cache: %s", e)
+    return results  # type: ignore[return-value]
+
+
+def _stream_key(paper: Paper) -> str:
+    # Identity, not content: the final ranking's Crossref enrichment rewrites title, venue and year
+    return paper.id or (paper.doi or "").lower() or paper_cache_key(paper)
+
+
+class StreamingSummarizer:
+    """Summarize papers while search is still ranking them.
+
+    `update(ranked)` starts summaries for the confident head of each provisional
+    ranking and cancels queued ones that dropped out of it; `finish(final)` fills
+    in whatever the final ranking still needs and returns summaries in its order;
+    `close()` drops queued work if the search fails before then. Papers are
+    tracked by id (or DOI) across rankings; the content hash is only used for
+    the persistent summary cache.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, confident_fraction: float = 0.5):
+        s = get_settings()
+        self.settings = s
+        self.confident_fraction = confident_fraction
+        self.model = f"{s.llm_provider}:{s.chat_model()}"
+        self.cache = _summary_cache()
+        self.workers = max(1, max_concurrency or s.summary_concurrency())
+        self.cancelled = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="summarize-stream")
+        self._futures: Dict[str, Future] = {}
+        self._cached: Dict[str, Summary] = {}
+        self._chain: Any = None
+        self._chain_resolved = False
+
+    def _get_run_chain(self) -> Any:
+        if not self._chain_resolved:
+            self._chain_resolved = True
+            try:
+                self._chain = _get_chain()
+            except Exception as e:
+                logger.warning("LLM unavailable (%s); using heuristic summaries", e)
+        return self._chain
+
+    def _submit(self, papers: List[Paper]) -> None:
+        new = {}
+        for p in papers:
+            key = _stream_key(p)
+            if key not in self._futures and key not in self._cached:
+                new[key] = p
+        if not new:
+            return
+        if self.cache:
+            keys = list(new)
+            for i, summary in self.cache.get_many([new[k] for k in keys], self.model).items():
+                self._cached[keys[i]] = summary
+        chain = self._get_run_chain()
+        for key, p in new.items():
+            if key not in self._cached:
+                self._futures[key] = self._executor.submit(_summarize_one, p, chain)
+
+    def _cancel_missing(self, papers: List[Paper]) -> None:
+        keep = {_stream_key(p) for p in papers}
+        for key, future in list(self._futures.items()):
+            # Only queued work can be cancelled; finished summaries stay reusable
+            if key not in keep and future.cancel():
+                del self._futures[key]
+                self.cancelled += 1
+
+    def update(self, ranked: List[Paper]) -> None:
+        self._cancel_missing(ranked)
+        confident = math.ceil(len(ranked) * self.confident_fraction)
+        self._submit(ranked[:confident])
+
+    def finish(
+        self, final: List[Paper], on_summary: Optional[Callable[[int, Summary], None]] = None
+    ) -> List[Summary]:
+        try:
+            self._cancel_missing(final)
+            self._submit(final)
+            keys = [_stream_key(p) for p in final]
+            results: List[Optional[Summary]] = [None] * len(final)
+            indices: Dict[str, List[int]] = {}
+            for i, key in enumerate(keys):
+                indices.setdefault(key, []).append(i)
+                if key in self._cached:
+                    results[i] = self._cached[key]
+                    if on_summary:
+                        on_summary(i, results[i])
+
+            futures = {self._futures[k]: k for k in dict.fromkeys(keys) if k in self._futures}
+            waves = -(-len(futures) // self.workers)
+            budget = self.settings.summary_timeout * (waves + 1)
+            fresh: List[Tuple[Paper, Summary]] = []
+            try:
+                for future in as_completed(futures, timeout=budget):
+                    key = futures[future]
+                    try:
+                        summary, from_llm = future.result()
+                    except Exception:
+                        continue
+                    if from_llm:
+                        fresh.append((final[indices[key][0]], summary))
+                    for i in indices[key]:
+                        results[i] = summary
+                        if on_summary:
+                            on_summary(i, summary)
+            except FuturesTimeout:
+                logger.warning("Summarization budget of %.0fs exceeded; using heuristic summaries for the rest", budget)
+
+            for i, p in enumerate(final):
+                if results[i] is None:
+                    results[i] = _heuristic_summary(p)
+                    if on_summary:
+                        on_summary(i, results[i])
+            if self.cache and fresh:
+                try:
+                    self.cache.put_many(fresh, self.model)
+                except Exception as e:  # pragma: no cover - filesystem
+                    logger.warning("Could not store summaries in cache: %s", e)
+            logger.info(
+                "Streaming summarization: %d papers, %d cached, %d cancelled at the margin",
+                len(final), sum(k in self._cached for k in keys), self.cancelled,
+            )
+            return results  # type: ignore[return-value]
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Cancel queued summaries without waiting for running ones (safe to call more than once)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
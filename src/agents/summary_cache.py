@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..models import Paper, Summary
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def paper_cache_key(paper: Paper) -> str:
+    """Content hash of title + abstract, so re-fetched or enriched papers still hit"""
+    text = f"{' '.join((paper.title or '').split())}\n{' '.join((paper.abstract or '').split())}"
+    return hashlib.sha256(text.lower().encode("utf-8")).hexdigest()
+
+
+def prompt_fingerprint(prompt: Any) -> str:
+    """Stable hash of a ChatPromptTemplate's message templates"""
+    parts = []
+    for message in getattr(prompt, "messages", []):
+        template = getattr(getattr(message, "prompt", None), "template", None)
+        parts.append(f"{type(message).__name__}:{template if template is not None else message}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class SummaryCache:
+    """SQLite store of LLM summaries keyed by (paper content hash, model, prompt hash).
+
+    `prompt_hash` is the prompt reads and writes use by default; `other_prompts`
+    are further live prompts (e.g. the multi-paper batch prompt) whose entries
+    are kept apart under their own hash. Entries from any other prompt are
+    dropped when the cache is opened.
+    """
+
+    def __init__(self, path: str | Path, prompt_hash: str, other_prompts: Sequence[str] = ()):
+        self.path = Path(path)
+        self.prompt_hash = prompt_hash
+        self.prompt_hashes = (prompt_hash, *other_prompts)
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " paper_key TEXT, model TEXT, prompt_hash TEXT, summary TEXT, created_at REAL,"
+            " PRIMARY KEY (paper_key, model, prompt_hash))"
+        )
+        # Summaries produced by an older version of the prompts can never hit again
+        purged = self._conn.execute(
+            f"DELETE FROM summaries WHERE prompt_hash NOT IN ({','.join('?' * len(self.prompt_hashes))})",
+            self.prompt_hashes,
+        ).rowcount
+        self._conn.commit()
+        if purged:
+            logger.info(f"Summary cache: dropped {purged} entries from previous prompt versions")
+
+    def get_many(
+        self, papers: List[Paper], model: str, prompt_hashes: Optional[Sequence[str]] = None
+    ) -> Dict[int, Summary]:
+        """Return {index: Summary} for the papers that are cached.
+
+        Only summaries produced by one of `prompt_hashes` (default: the cache's
+        own prompt) count; when several match, the earlier prompt wins.
+        """
+        prompt_hashes = list(prompt_hashes or [self.prompt_hash])
+        keys = [paper_cache_key(p) for p in papers]
+        found: Dict[str, Summary] = {}
+        rank: Dict[str, int] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT paper_key, prompt_hash, summary FROM summaries WHERE model = ?"
+                    f" AND prompt_hash IN ({','.join('?' * len(prompt_hashes))})"
+                    f" AND paper_key IN ({','.join('?' * len(chunk))})",
+                    (model, *prompt_hashes, *chunk),
+                ).fetchall()
+                for key, prompt_hash, payload in rows:
+                    preference = prompt_hashes.index(prompt_hash)
+                    if rank.get(key, len(prompt_hashes)) <= preference:
+                        continue
+                    try:
+                        found[key] = Summary.model_validate_json(payload)
+                    except Exception:
+                        continue
+                    rank[key] = preference
+            hits = {i: found[key] for i, key in enumerate(keys) if key in found}
+            self.hits += len(hits)
+            self.misses += len(papers) - len(hits)
+        return hits
+
+    def put_many(self, items: List[tuple[Paper, Summary]], model: str, prompt_hash: Optional[str] = None) -> None:
+        """Store summaries produced by the prompt with `prompt_hash` (default: the cache's own)"""
+        if not items:
+            return
+        prompt_hash = prompt_hash or self.prompt_hash
+        now = time.time()
+        rows = [
+            (paper_cache_key(paper), model, prompt_hash, summary.model_dump_json(), now)
+            for paper, summary in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO summaries (paper_key, model, prompt_hash, summary, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "prompt_hash": self.prompt_hash,
+            }
+
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache(path: str | Path, prompt: Any, *other_prompts: Any) -> Optional[SummaryCache]:
+    """Process-wide summary cache for the current prompts (None if it cannot be opened)"""
+    global _cache
+    prompt_hashes = tuple(prompt_fingerprint(p) for p in (prompt, *other_prompts))
+    with _cache_lock:
+        if _cache is None or _cache.path != Path(path) or _cache.prompt_hashes != prompt_hashes:
+            try:
+                _cache = SummaryCache(path, prompt_hashes[0], prompt_hashes[1:])
+            except Exception as e:  # pragma: no cover - filesystem
+                logger.warning(f"Summary cache unavailable: {e}")
+                return None
+        return _cache
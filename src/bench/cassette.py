@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+CassetteMode = Literal["record", "replay"]
+
+# Query parameters that carry credentials or contact details; never stored or matched on
+REDACTED_PARAMS = {"api_key", "apikey", "key", "mailto", "email", "tool"}
+# Headers worth keeping on replayed responses (the body is stored decoded)
+KEPT_HEADERS = {"content-type", "retry-after", "x-ratelimit-remaining"}
+# Environment variables whose presence (never value) is recorded, so replays take the same code paths
+KEY_ENV_PATTERN = re.compile(r"^[A-Z0-9_]*(API_KEY|_KEY)$")
+
+
+def request_key(method: str, url: httpx.URL, body: bytes) -> str:
+    """Stable identity of a request: method, URL without credentials (sorted query), body hash"""
+    query = sorted((k, v) for k, v in parse_qsl(url.query.decode()) if k.lower() not in REDACTED_PARAMS)
+    key = f"{method} {url.scheme}://{url.host}{url.path}"
+    if query:
+        key += "?" + urlencode(query)
+    if body:
+        key += " #" + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+class Cassette:
+    """Recorded HTTP interactions for one benchmark topic (a JSON file).
+
+    In "record" mode requests go out and their responses are stored; in
+    "replay" mode they are answered from the file, after `latency` seconds or,
+    with `recorded_latency`, after the time the live call took (times
+    `latency_scale`). Requests with no recording fail like a network error
+    and are counted in `misses`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: CassetteMode = "replay",
+        latency: float = 0.0,
+        recorded_latency: bool = False,
+        latency_scale: float = 1.0,
+    ):
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self.latency_scale = latency_scale
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.env_keys: List[str] = []
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses: List[str] = []
+        if mode == "replay" or self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"No cassette at {self.path}; record one with `litrev bench --record`")
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        self.interactions = data.get("interactions", {})
+        self.env_keys = data.get("env_keys", [])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        env_keys = sorted(set(self.env_keys) | {k for k in os.environ if KEY_ENV_PATTERN.match(k)})
+        data = {"env_keys": env_keys, "interactions": self.interactions}
+        self.path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+
+    def reset(self) -> None:
+        """Serve recordings from the start again and clear the counters (between runs)"""
+        with self._lock:
+            self._served.clear()
+            self.hits = 0
+            self.misses = []
+
+    def record(self, key: str, response: httpx.Response, elapsed: float) -> None:
+        content = response.content
+        try:
+            body: Dict[str, str] = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        entry = {
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS},
+            "elapsed": round(elapsed, 4),
+            **body,
+        }
+        with self._lock:
+            self.interactions.setdefault(key, []).append(entry)
+
+    def play(self, key: str) -> Optional[Dict[str, Any]]:
+        """Next recording for this request (repeated requests cycle through theirs), or None"""
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                self.misses.append(key)
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            self.hits += 1
+            return entries[index % len(entries)]
+
+    def delay(self, entry: Dict[str, Any]) -> float:
+        if self.recorded_latency:
+            return entry.get("elapsed", 0.0) * self.latency_scale
+        return self.latency
+
+    @staticmethod
+    def to_response(entry: Dict[str, Any]) -> httpx.Response:
+        content = base64.b64decode(entry["base64"]) if "base64" in entry else entry.get("text", "").encode("utf-8")
+        return httpx.Response(entry["status"], headers=entry.get("headers", {}), content=content)
+
+
+@contextmanager
+def use_cassette(cassette: Cassette) -> Iterator[Cassette]:
+    """Route every httpx request in the process (adapters, Crossref enrichment, LLM SDKs) through `cassette`"""
+    sync_send = httpx.HTTPTransport.handle_request
+    async_send = httpx.AsyncHTTPTransport.handle_async_request
+
+    def handle_request(transport: httpx.HTTPTransport, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, request.url, request.read())
+        if cassette.mode == "record":
+            start = time.perf_counter()
+            response = sync_send(transport, request)
+            response.read()
+            cassette.record(key, response, time.perf_counter() - start)
+            return Cassette.to_response(cassette.interactions[key][-1])
+        entry = cassette.play(key)
+        if entry is None:
+            raise httpx.ConnectError(f"No recorded response for {key}", request=request)
+        time.sleep(cassette.delay(entry))
+        return Cassette.to_response(entry)
+
+    async def handle_async_request(transport: httpx.AsyncHTTPTransport, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, request.url, await request.aread())
+        if cassette.mode == "record":
+            start = time.perf_counter()
+            response = await async_send(transport, request)
+            await response.aread()
+            cassette.record(key, response, time.perf_counter() - start)
+            return Cassette.to_response(cassette.interactions[key][-1])
+        entry = cassette.play(key)
+        if entry is None:
+            raise httpx.ConnectError(f"No recorded response for {key}", request=request)
+        await asyncio.sleep(cassette.delay(entry))
+        return Cassette.to_response(entry)
+
+    # Replays take the same code paths as the recording, which depend on which API keys were set
+    placeholders = [k for k in cassette.env_keys if cassette.mode == "replay" and not os.environ.get(k)]
+    for name in placeholders:
+        os.environ[name] = "replay"
+    httpx.HTTPTransport.handle_request = handle_request  # type: ignore[method-assign]
+    httpx.AsyncHTTPTransport.handle_async_request = handle_async_request  # type: ignore[method-assign]
+    try:
+        yield cassette
+    finally:
+        httpx.HTTPTransport.handle_request = sync_send  # type: ignore[method-assign]
+        httpx.AsyncHTTPTransport.handle_async_request = async_send  # type: ignore[method-assign]
+        for name in placeholders:
+            os.environ.pop(name, None)
+        if cassette.mode == "record":
+            cassette.save()
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from ..utils.logging import get_logger
+from .cassette import Cassette, CassetteMode, use_cassette
+
+logger = get_logger(__name__)
+
+# Fixed topic set; each has its own cassette under the fixture directory
+BENCH_TOPICS = [
+    "graph neural networks for molecular property prediction",
+    "single-cell RNA sequencing cell type annotation",
+    "retrieval-augmented generation for question answering",
+]
+TARGETS = ("search_v2", "semantic", "hybrid", "review")
+# The committed cassettes hold provider responses only, no LLM calls, so "review" runs when asked for
+DEFAULT_TARGETS = ("search_v2", "semantic", "hybrid")
+BENCH_LIMIT = 20
+
+# Relative slowdown of wall or CPU time that counts as a regression
+DEFAULT_TOLERANCE = 0.2
+# Differences below this many seconds are noise, whatever the ratio
+NOISE_FLOOR = 0.005
+
+# Every run starts cold: no adaptive statistics, no caches carried over, nothing written back
+BENCH_ENV = {
+    "ADAPTIVE_SOURCES": "false",
+    "INGEST_SEARCH_RESULTS": "false",
+    "SUMMARY_CACHE": "false",
+    "EMBEDDING_WARMUP_ON_STARTUP": "false",
+    "EMBEDDING_WARMUP_TOPICS": "",
+}
+
+# (papers, {stage: seconds}) for one run of a target
+RunResult = Tuple[int, Dict[str, float]]
+
+
+def topic_slug(topic: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")[:60]
+
+
+def _reset_process_state() -> None:
+    """Drop the process-wide singletons that would otherwise carry state from one run into the next"""
+    from ..graph import run_graph
+    from ..search import embedding_store, warmup
+    from ..search.query_cache import clear_query_caches
+    from ..tools import circuit_breaker, crossref_tool, http_client
+
+    clear_query_caches()
+    circuit_breaker._breakers.clear()
+    http_client._budgets.clear()
+    crossref_tool._doi_cache = None
+    embedding_store._embedding_store = None
+    warmup._ready.clear()
+    warmup._warmup_thread = None
+    run_graph._graphs.clear()
+
+
+@contextmanager
+def _cold_start() -> Iterator[Path]:
+    """A scratch working directory and environment for one run (stores use relative paths)"""
+    from .. import config
+
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="litrev-bench-") as workdir:
+        root = Path(workdir)
+        os.environ.update(BENCH_ENV)
+        os.environ.update({
+            "LOCAL_CORPUS_PATH": str(root / "corpus.sqlite"),
+            "SOURCE_STATS_PATH": str(root / "source_stats.json"),
+            "CROSSREF_CACHE_PATH": str(root / "crossref.sqlite"),
+            "CHECKPOINT_PATH": str(root / "checkpoints.sqlite"),
+        })
+        os.chdir(root)
+        try:
+            config.reload()
+            _reset_process_state()
+            yield root
+        finally:
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            config.reload()
+            _reset_process_state()
+
+
+def _timed_events() -> Tuple[Callable[[str, Dict[str, Any]], None], Dict[str, float]]:
+    """A run_search_v2 on_event hook recording when each pipeline event first fired"""
+    start = time.perf_counter()
+    marks: Dict[str, float] = {}
+
+    def on_event(name: str, data: Dict[str, Any]) -> None:
+        marks.setdefault(name, time.perf_counter() - start)
+
+    return on_event, marks
+
+
+def _run_search_v2(topic: str) -> RunResult:
+    from ..agents.search_agent_v2 import run_search_v2
+    from ..models import SearchFilters
+
+    on_event, marks = _timed_events()
+    start = time.perf_counter()
+    papers, _ = run_search_v2(topic, SearchFilters(limit=BENCH_LIMIT), on_event=on_event)
+    total = time.perf_counter() - start
+    # Pipeline stages, delimited by the events run_search_v2 emits
+    bounds = [("sources", "dedupe"), ("rank_provisional", "provisional"), ("rank_dense", "ranking")]
+    stages: Dict[str, float] = {}
+    previous = 0.0
+    for stage, event in bounds:
+        if event in marks:
+            stages[stage] = marks[event] - previous
+            previous = marks[event]
+    stages["finalize"] = total - previous
+    return len(papers), stages
+
+
+def _warm_store(topic: str) -> None:
+    from ..search.warmup import warm_embedding_store
+
+    warm_embedding_store(topics=[topic], limit_per_topic=BENCH_LIMIT * 2)
+
+
+def _run_semantic(topic: str) -> RunResult:
+    from ..models import SearchFilters
+    from ..search.semantic_search import semantic_search
+
+    return len(semantic_search(topic, SearchFilters(limit=BENCH_LIMIT), k=BENCH_LIMIT)), {}
+
+
+def _run_hybrid(topic: str) -> RunResult:
+    from ..models import SearchFilters
+    from ..search.semantic_search import hybrid_search
+
+    return len(hybrid_search(topic, "", SearchFilters(limit=BENCH_LIMIT), k=BENCH_LIMIT)), {}
+
+
+def _run_review(topic: str) -> RunResult:
+    from ..graph.run_graph import review_state, stream_review
+    from ..models import Filters
+
+    thread_id = uuid4().hex
+    stages: Dict[str, float] = {}
+    last = time.perf_counter()
+    # Nodes may run concurrently; each is charged the time since the previous one finished
+    for node in stream_review(topic, Filters(limit=BENCH_LIMIT), thread_id):
+        now = time.perf_counter()
+        stages[node] = stages.get(node, 0.0) + now - last
+        last = now
+    return len(review_state(thread_id).get("raw_papers", [])), stages
+
+
+# target -> (untimed setup, timed run)
+RUNNERS: Dict[str, Tuple[Optional[Callable[[str], None]], Callable[[str], RunResult]]] = {
+    "search_v2": (None, _run_search_v2),
+    "semantic": (_warm_store, _run_semantic),
+    "hybrid": (_warm_store, _run_hybrid),
+    "review": (None, _run_review),
+}
+
+
+def _measure(target: str, topic: str, cassette: Cassette, trace: bool) -> Dict[str, Any]:
+    setup, run = RUNNERS[target]
+    cassette.reset()
+    with _cold_start():
+        if setup is not None:
+            setup(topic)
+        hits, misses = cassette.hits, len(cassette.misses)
+        if trace:
+            tracemalloc.start()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            papers, stages = run(topic)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            peak = tracemalloc.get_traced_memory()[1] if trace else None
+        finally:
+            if trace:
+                tracemalloc.stop()
+    return {
+        "wall": wall, "cpu": cpu, "peak": peak, "papers": papers, "stages": stages,
+        "requests": cassette.hits - hits, "misses": cassette.misses[misses:],
+    }
+
+
+def run_benchmarks(
+    fixture_dir: str | Path,
+    topics: Sequence[str] = BENCH_TOPICS,
+    targets: Sequence[str] = DEFAULT_TARGETS,
+    mode: CassetteMode = "replay",
+    repeat: int = 3,
+    latency: float = 0.0,
+    recorded_latency: bool = False,
+    latency_scale: float = 1.0,
+) -> Dict[str, Any]:
+    """Run each target end to end for each topic against recorded provider responses.
+
+    Timings are medians over `repeat` cold runs; allocation peaks come from one
+    extra run under tracemalloc, so tracing overhead stays out of the timings.
+    In "record" mode each topic runs once against the live providers and its
+    cassette is (re)written instead.
+    """
+    unknown = [t for t in targets if t not in RUNNERS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark targets: {', '.join(unknown)}")
+    fixture_dir = Path(fixture_dir)
+    results: Dict[str, Dict[str, Any]] = {}
+    for topic in topics:
+        path = fixture_dir / f"{topic_slug(topic)}.json"
+        if mode == "record" and path.exists():
+            path.unlink()
+        cassette = Cassette(path, mode, latency, recorded_latency, latency_scale)
+        with use_cassette(cassette):
+            for target in targets:
+                runs = [_measure(target, topic, cassette, trace=False) for _ in range(1 if mode == "record" else repeat)]
+                traced = _measure(target, topic, cassette, trace=True) if mode == "replay" else runs[0]
+                wall = statistics.median(r["wall"] for r in runs)
+                stage_names = dict.fromkeys(name for r in runs for name in r["stages"])
+                results[f"{target}:{topic_slug(topic)}"] = {
+                    "wall": round(wall, 4),
+                    "cpu": round(statistics.median(r["cpu"] for r in runs), 4),
+                    "peak_kib": round(traced["peak"] / 1024, 1) if traced["peak"] is not None else None,
+                    "papers": runs[0]["papers"],
+                    "papers_per_s": round(runs[0]["papers"] / wall, 2) if wall > 0 else None,
+                    "stages": {
+                        name: round(statistics.median(r["stages"].get(name, 0.0) for r in runs), 4)
+                        for name in stage_names
+                    },
+                    "requests": runs[0]["requests"],
+                    "misses": sorted(set(runs[0]["misses"])),
+                }
+    return {
+        "mode": mode,
+        "repeat": repeat if mode == "replay" else 1,
+        "latency": "recorded" if recorded_latency else latency,
+        "latency_scale": latency_scale,
+        "results": results,
+    }
+
+
+def load_baseline(path: str | Path) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(report: Dict[str, Any], path: str | Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """Regressions against a stored report: wall or CPU time (overall or per stage) beyond `tolerance`, fewer papers"""
+    regressions: List[str] = []
+
+    def check(name: str, current: Optional[float], before: Optional[float]) -> None:
+        if current is None or before is None:
+            return
+        if current - before > NOISE_FLOOR and current > before * (1 + tolerance):
+            change = f" (+{(current / before - 1) * 100:.0f}%)" if before else ""
+            regressions.append(f"{name}: {before:.3f}s -> {current:.3f}s{change}")
+
+    previous = baseline.get("results", {})
+    for key, result in report.get("results", {}).items():
+        old = previous.get(key)
+        if old is None:
+            continue
+        check(f"{key} wall", result["wall"], old.get("wall"))
+        check(f"{key} cpu", result["cpu"], old.get("cpu"))
+        for stage, seconds in result.get("stages", {}).items():
+            check(f"{key} {stage}", seconds, old.get("stages", {}).get(stage))
+        if result["papers"] < old.get("papers", 0):
+            regressions.append(f"{key} papers: {old['papers']} -> {result['papers']}")
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<60} {'wall s':>8} {'cpu s':>8} {'peak KiB':>10} {'papers':>7} {'papers/s':>9}"]
+    for key, r in report["results"].items():
+        peak = f"{r['peak_kib']:.0f}" if r["peak_kib"] is not None else "-"
+        rate = f"{r['papers_per_s']:.1f}" if r["papers_per_s"] is not None else "-"
+        lines.append(f"{key:<60} {r['wall']:>8.3f} {r['cpu']:>8.3f} {peak:>10} {r['papers']:>7} {rate:>9}")
+        for stage, seconds in r["stages"].items():
+            lines.append(f"  {stage:<58} {seconds:>8.3f}")
+        if r["misses"]:
+            lines.append(f"  {len(r['misses'])} requests had no recording, e.g. {r['misses'][0]}")
+    return "\n".join(lines)
@@ -1,8 +1,11 @@
 import typer
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 from ..models import Filters
-from ..graph.run_graph import run_review
+
+# The review graph (langgraph, LLM SDKs) and the embedding store are imported
+# inside the commands that need them, so --help and startup stay fast
 
 app = typer.Typer(help="Literature Review Agent CLI")
 
@@ -17,6 +20,7 @@ def run(
     venues: Optional[str] = typer.Option(None, help="Comma-separated venues"),
     limit: int = typer.Option(20, help="Max number of papers"),
     provider: str = typer.Option("openai", help="LLM provider: openai or anthropic"),
+    stream: bool = typer.Option(False, "--stream", help="Start summarizing while sources are still returning"),
 ):
     filters = Filters(
         start_year=start_year,
@@ -26,11 +30,104 @@ def run(
         venues=[s.strip() for s in (venues.split(",") if venues else []) if s.strip()],
         limit=limit,
     )
-    md_path, json_path = run_review(topic, filters)
+    from ..graph.run_graph import run_review
+
+    md_path, json_path = run_review(topic, filters, streaming=stream)
     typer.echo(f"Markdown: {md_path}")
     typer.echo(f"JSON: {json_path}")
 
 
+@app.command()
+def warmup(
+    topics: Optional[str] = typer.Option(None, help="Comma-separated seed topics (default: EMBEDDING_WARMUP_TOPICS)"),
+    corpus: Optional[Path] = typer.Option(None, help="Offline corpus file of papers (JSON array or JSONL)"),
+    limit: int = typer.Option(100, help="Papers to fetch per seed topic"),
+):
+    """Build or extend the semantic search embedding index"""
+    from ..search.warmup import warm_embedding_store
+
+    topic_list = [s.strip() for s in topics.split(",") if s.strip()] if topics else None
+    total = warm_embedding_store(
+        topics=topic_list,
+        corpus_path=corpus,
+        limit_per_topic=limit,
+        only_if_empty=False,
+    )
+    typer.echo(f"Embedding store: {total} papers")
+
+
+@app.command()
+def ingest(
+    paths: List[Path] = typer.Argument(..., help="Dump files or directories (OpenAlex snapshot, Crossref, PubMed XML)"),
+    format: Optional[str] = typer.Option(None, help="openalex, crossref, pubmed or papers (default: detect)"),
+    force: bool = typer.Option(False, "--force", help="Re-ingest files that were already ingested"),
+    corpus: Optional[Path] = typer.Option(None, help="Corpus database (default: LOCAL_CORPUS_PATH)"),
+):
+    """Add papers from dump files to the offline corpus searched as the "local" source"""
+    from ..config_search import get_search_config
+    from ..search.corpus_ingest import READERS, ingest_paths
+    from ..search.local_corpus import get_local_corpus
+
+    if format and format not in READERS:
+        raise typer.BadParameter(f"Unknown format: {format}", param_hint="--format")
+    store = get_local_corpus(corpus or get_search_config().local_corpus_path, create=True)
+    if store is None:
+        raise typer.Exit(1)
+    written = ingest_paths(store, paths, format, force)
+    typer.echo(f"Ingested {written} papers; corpus holds {store.count()}")
+
+
+@app.command()
+def bench(
+    targets: Optional[str] = typer.Option(None, help="Comma-separated: search_v2, semantic, hybrid, review (default: all but review)"),
+    topics: Optional[str] = typer.Option(None, help="Comma-separated topics (default: the fixed benchmark set)"),
+    fixtures: Path = typer.Option(Path("benchmarks/cassettes"), help="Directory of recorded provider responses"),
+    record: bool = typer.Option(False, "--record", help="Call the live providers and (re)write the cassettes"),
+    repeat: int = typer.Option(3, help="Cold runs per benchmark; timings are medians"),
+    latency: float = typer.Option(0.0, help="Seconds added to every replayed response"),
+    recorded_latency: bool = typer.Option(False, "--recorded-latency", help="Replay each response after its recorded latency"),
+    latency_scale: float = typer.Option(1.0, help="Multiplier for --recorded-latency"),
+    baseline: Path = typer.Option(Path("benchmarks/baseline.json"), help="Stored report to compare against"),
+    tolerance: float = typer.Option(0.2, help="Relative slowdown that counts as a regression"),
+    update_baseline: bool = typer.Option(False, "--update-baseline", help="Store this run as the new baseline"),
+    strict: bool = typer.Option(False, "--strict", help="Fail when a request has no recorded response"),
+):
+    """Benchmark the search and review pipelines offline against recorded provider responses"""
+    from ..bench.harness import (
+        BENCH_TOPICS, DEFAULT_TARGETS, compare_to_baseline, format_report, load_baseline, run_benchmarks, save_baseline,
+    )
+
+    report = run_benchmarks(
+        fixtures,
+        topics=[s.strip() for s in topics.split(",") if s.strip()] if topics else BENCH_TOPICS,
+        targets=[s.strip() for s in targets.split(",") if s.strip()] if targets else DEFAULT_TARGETS,
+        mode="record" if record else "replay",
+        repeat=repeat,
+        latency=latency,
+        recorded_latency=recorded_latency,
+        latency_scale=latency_scale,
+    )
+    typer.echo(format_report(report))
+    if record:
+        typer.echo(f"Cassettes written to {fixtures}")
+        return
+    if update_baseline:
+        save_baseline(report, baseline)
+        typer.echo(f"Baseline written to {baseline}")
+        return
+    failed = strict and any(r["misses"] for r in report["results"].values())
+    previous = load_baseline(baseline)
+    if previous is None:
+        typer.echo(f"No baseline at {baseline}; store one with --update-baseline")
+    else:
+        regressions = compare_to_baseline(report, previous, tolerance)
+        for line in regressions:
+            typer.echo(f"REGRESSION {line}")
+        failed = failed or bool(regressions)
+    if failed:
+        raise typer.Exit(1)
+
+
 def main():
     app()
 
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Literal, Optional
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
+
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 @dataclass(frozen=True)
@@ -12,19 +18,168 @@ class Settings:
 	llm_provider: Literal["openai", "anthropic"]
 	openai_api_key: Optional[str]
 	anthropic_api_key: Optional[str]
+	openai_model: str
+	anthropic_model: str
 	http_timeout: int
 	checkpoint_path: str
+	summary_concurrency_openai: int
+	summary_concurrency_anthropic: int
+	summary_timeout: float
+	summary_cache_enabled: bool
+	summary_cache_path: str
+	summary_batch_mode: Literal["off", "prompt", "batch_api"]
+	summary_batch_tokens: int
+	summary_batch_poll_interval: float
+	summary_batch_timeout: float
+	openai_base_url: Optional[str]
+	anthropic_base_url: Optional[str]
+	job_db_path: str
+	job_max_concurrent: int
+	job_worker_mode: Literal["process", "thread"]
+	config_hot_reload: bool
 
+	def chat_model(self, provider: Optional[str] = None) -> str:
+		"""Chat model name for the given (or configured) provider"""
+		provider = provider or self.llm_provider
+		return self.anthropic_model if provider == "anthropic" else self.openai_model
 
-def get_settings() -> Settings:
-	load_dotenv()
+	def summary_concurrency(self, provider: Optional[str] = None) -> int:
+		"""Max in-flight summarization calls for the given (or configured) provider"""
+		provider = provider or self.llm_provider
+		limit = self.summary_concurrency_anthropic if provider == "anthropic" else self.summary_concurrency_openai
+		return max(1, limit)
+
+	def with_overrides(self, **changes: Any) -> "Settings":
+		"""Copy with some fields replaced, for per-request/job settings passed explicitly"""
+		return replace(self, **changes)
+
+
+# Values this process copied from .env, so a reload can update them without
+# clobbering variables that were set in the real environment
+_dotenv_values: Dict[str, str] = {}
+_env_lock = threading.Lock()
+
+
+def env_file_path() -> Optional[Path]:
+	path = find_dotenv()
+	return Path(path) if path else None
+
+
+def load_env_file() -> None:
+	"""Copy .env into os.environ; the real environment wins, except over earlier .env values"""
+	path = env_file_path()
+	with _env_lock:
+		for key, value in (dotenv_values(path) if path else {}).items():
+			if value is None:
+				continue
+			if key not in os.environ or os.environ[key] == _dotenv_values.get(key):
+				os.environ[key] = value
+				_dotenv_values[key] = value
+
+
+def _load_settings() -> Settings:
 	provider = os.getenv("LLM_PROVIDER", "openai").lower()
 	if provider not in {"openai", "anthropic"}:
 		provider = "openai"
+	batch_mode = os.getenv("SUMMARY_BATCH_MODE", "off").lower()
+	if batch_mode not in {"off", "prompt", "batch_api"}:
+		batch_mode = "off"
 	return Settings(
 		llm_provider=provider,
 		openai_api_key=os.getenv("OPENAI_API_KEY"),
 		anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
+		openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+		anthropic_model=os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20240620"),
 		http_timeout=int(os.getenv("HTTP_TIMEOUT", "30")),
 		checkpoint_path=os.getenv("CHECKPOINT_PATH", ".checkpoints/litrev.sqlite"),
+		summary_concurrency_openai=int(os.getenv("SUMMARY_CONCURRENCY_OPENAI", "8")),
+		summary_concurrency_anthropic=int(os.getenv("SUMMARY_CONCURRENCY_ANTHROPIC", "4")),
+		summary_timeout=float(os.getenv("SUMMARY_TIMEOUT", "60")),
+		summary_cache_enabled=os.getenv("SUMMARY_CACHE", "true").lower() == "true",
+		summary_cache_path=os.getenv("SUMMARY_CACHE_PATH", ".cache/summaries.sqlite"),
+		summary_batch_mode=batch_mode,
+		summary_batch_tokens=int(os.getenv("SUMMARY_BATCH_TOKENS", "6000")),
+		summary_batch_poll_interval=float(os.getenv("SUMMARY_BATCH_POLL_INTERVAL", "30")),
+		summary_batch_timeout=float(os.getenv("SUMMARY_BATCH_TIMEOUT", str(24 * 3600))),
+		openai_base_url=os.getenv("OPENAI_BASE_URL"),
+		anthropic_base_url=os.getenv("ANTHROPIC_BASE_URL"),
+		job_db_path=os.getenv("JOB_DB_PATH", ".jobs/jobs.sqlite"),
+		job_max_concurrent=int(os.getenv("JOB_MAX_CONCURRENT", "2")),
+		job_worker_mode="thread" if os.getenv("JOB_WORKER_MODE", "process").lower() == "thread" else "process",
+		config_hot_reload=os.getenv("CONFIG_HOT_RELOAD", "false").lower() == "true",
 	)
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+	"""Process-wide settings, read from the environment (and .env) once; see reload()"""
+	global _settings
+	settings = _settings
+	if settings is None:
+		with _settings_lock:
+			if _settings is None:
+				load_env_file()
+				_settings = _load_settings()
+			settings = _settings
+	return settings
+
+
+_reload_hooks: List[Callable[[], None]] = []
+
+
+def on_reload(hook: Callable[[], None]) -> None:
+	"""Register a callback run after reload() (e.g. to drop clients built from old settings)"""
+	_reload_hooks.append(hook)
+
+
+def reload() -> Settings:
+	"""Re-read .env and the environment for Settings and SearchConfig"""
+	global _settings
+	from .config_search import reload_search_config
+
+	load_env_file()
+	with _settings_lock:
+		_settings = _load_settings()
+		settings = _settings
+	reload_search_config()
+	for hook in list(_reload_hooks):
+		hook()
+	return settings
+
+
+_watcher: Optional[threading.Thread] = None
+
+
+def watch_env_file(interval: float = 2.0) -> threading.Thread:
+	"""Start a daemon thread that calls reload() whenever .env changes (idempotent)"""
+	global _watcher
+	if _watcher is not None and _watcher.is_alive():
+		return _watcher
+
+	def _mtime() -> Optional[float]:
+		path = env_file_path()
+		try:
+			return path.stat().st_mtime if path else None
+		except OSError:
+			return None
+
+	def _watch() -> None:
+		last = _mtime()
+		tick = threading.Event()
+		while True:
+			tick.wait(interval)
+			current = _mtime()
+			if current != last:
+				last = current
+				# A half-written or invalid .env must not stop the watcher; the next save is picked up
+				try:
+					reload()
+				except Exception as e:
+					logger.warning(f"Reloading settings from .env failed: {e!r}")
+
+	_watcher = threading.Thread(target=_watch, name="env-watcher", daemon=True)
+	_watcher.start()
+	return _watcher
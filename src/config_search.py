@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Literal, Optional
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Literal, Optional
 
-from dotenv import load_dotenv
+from .config import load_env_file
+from .tools.registry import source_names
 
 
 @dataclass(frozen=True)
@@ -30,24 +32,62 @@ class SearchConfig:
     requests_per_minute: int
     retry_attempts: int
     retry_delay: float
+    
+    # Per-source circuit breakers (shared HTTP layer, src/tools/http_client.py)
+    breaker_failure_rate: float
+    breaker_min_calls: int
+    breaker_window: int
+    breaker_slow_call: float
+    breaker_open_seconds: float
+    # Duplicate a GET that outlives the source's p90 latency, for at most hedge_budget of its requests
+    hedge_sources: List[str]
+    hedge_budget: float
+    
+    # Crossref enrichment
+    crossref_cache_path: str
+    crossref_cache_ttl: float
+    crossref_concurrency: int
+    
+    # Hybrid search execution
+    hybrid_fusion: Literal["linear", "rrf"]
+    hybrid_latency_budget: float
+    
+    # Query translation / embedding memo cache
+    query_cache_size: int
+    query_cache_ttl: float
+    
+    # /api/search result-set cache (pagination and re-fetches)
+    result_cache_size: int
+    result_cache_ttl: float
+    
+    # Adaptive source selection (per topic cluster yield/latency/contribution stats)
+    adaptive_sources: bool
+    source_stats_path: str
+    source_min_runs: int
+    source_skip_contribution: float
+    source_downbudget_contribution: float
+    source_explore_every: int
+    
+    # Offline paper corpus (SQLite FTS5), searched as the "local" source
+    local_corpus_path: str
+    # Write-behind of every deduped search result into that corpus
+    ingest_search_results: bool
+    ingest_flush_seconds: float
+    
+    # Embedding store warm-up
+    warmup_on_startup: bool
+    warmup_topics: List[str]
+    warmup_corpus_path: Optional[str]
 
+    def with_overrides(self, **changes: Any) -> "SearchConfig":
+        """Copy with some fields replaced, for per-request config passed explicitly"""
+        return replace(self, **changes)
 
-def get_search_config() -> SearchConfig:
-    load_dotenv()
-    
-    # Source configuration - optimized for speed and reliability
+
+def _load_search_config() -> SearchConfig:
+    # One ENABLE_<NAME> switch per registered source adapter (see tools.registry)
     enable_sources = {
-        "openalex": os.getenv("ENABLE_OPENALEX", "true").lower() == "true",
-        "semanticscholar": os.getenv("ENABLE_SEMANTICSCHOLAR", "true").lower() == "true",
-        "crossref": os.getenv("ENABLE_CROSSREF", "true").lower() == "true",
-        "arxiv": os.getenv("ENABLE_ARXIV", "true").lower() == "true",
-        "europe_pmc": os.getenv("ENABLE_EUROPE_PMC", "true").lower() == "true",
-        "biorxiv": os.getenv("ENABLE_BIORXIV", "true").lower() == "true",
-        "medrxiv": os.getenv("ENABLE_MEDRXIV", "true").lower() == "true",
-        "dblp": os.getenv("ENABLE_DBLP", "true").lower() == "true",
-        "scholar": os.getenv("ENABLE_SCHOLAR", "true").lower() == "true",
-        "google_scholar": os.getenv("ENABLE_GOOGLE_SCHOLAR", "true").lower() == "true",
-        "pubmed": os.getenv("ENABLE_PUBMED", "true").lower() == "true",
+        name: os.getenv(f"ENABLE_{name.upper()}", "true").lower() == "true" for name in source_names()
     }
     
     return SearchConfig(
@@ -65,4 +105,61 @@ def get_search_config() -> SearchConfig:
         requests_per_minute=int(os.getenv("REQUESTS_PER_MINUTE", "60")),
         retry_attempts=int(os.getenv("RETRY_ATTEMPTS", "3")),
         retry_delay=float(os.getenv("RETRY_DELAY", "1.0")),
+        breaker_failure_rate=float(os.getenv("BREAKER_FAILURE_RATE", "0.5")),
+        breaker_min_calls=int(os.getenv("BREAKER_MIN_CALLS", "5")),
+        breaker_window=int(os.getenv("BREAKER_WINDOW", "20")),
+        breaker_slow_call=float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "10")),
+        breaker_open_seconds=float(os.getenv("BREAKER_OPEN_SECONDS", "30")),
+        hedge_sources=[
+            s.strip() for s in os.getenv("HEDGE_SOURCES", "openalex,semanticscholar").split(",") if s.strip()
+        ],
+        hedge_budget=float(os.getenv("HEDGE_BUDGET", "0.1")),
+        crossref_cache_path=os.getenv("CROSSREF_CACHE_PATH", ".cache/crossref.sqlite"),
+        crossref_cache_ttl=float(os.getenv("CROSSREF_CACHE_TTL", str(7 * 24 * 3600))),
+        crossref_concurrency=int(os.getenv("CROSSREF_CONCURRENCY", "4")),
+        hybrid_fusion="rrf" if os.getenv("HYBRID_FUSION", "linear").lower() == "rrf" else "linear",
+        hybrid_latency_budget=float(os.getenv("HYBRID_LATENCY_BUDGET", "20")),
+        query_cache_size=int(os.getenv("QUERY_CACHE_SIZE", "512")),
+        query_cache_ttl=float(os.getenv("QUERY_CACHE_TTL", "3600")),
+        result_cache_size=int(os.getenv("RESULT_CACHE_SIZE", "128")),
+        result_cache_ttl=float(os.getenv("RESULT_CACHE_TTL", "600")),
+        adaptive_sources=os.getenv("ADAPTIVE_SOURCES", "true").lower() == "true",
+        source_stats_path=os.getenv("SOURCE_STATS_PATH", ".cache/source_stats.sqlite"),
+        source_min_runs=int(os.getenv("SOURCE_MIN_RUNS", "5")),
+        source_skip_contribution=float(os.getenv("SOURCE_SKIP_CONTRIBUTION", "0.02")),
+        source_downbudget_contribution=float(os.getenv("SOURCE_DOWNBUDGET_CONTRIBUTION", "0.1")),
+        source_explore_every=int(os.getenv("SOURCE_EXPLORE_EVERY", "10")),
+        local_corpus_path=os.getenv("LOCAL_CORPUS_PATH", "data/corpus.sqlite"),
+        ingest_search_results=os.getenv("INGEST_SEARCH_RESULTS", "true").lower() == "true",
+        ingest_flush_seconds=float(os.getenv("INGEST_FLUSH_SECONDS", "2")),
+        warmup_on_startup=os.getenv("EMBEDDING_WARMUP_ON_STARTUP", "true").lower() == "true",
+        warmup_topics=[
+            t.strip() for t in os.getenv("EMBEDDING_WARMUP_TOPICS", "machine learning").split(",") if t.strip()
+        ],
+        warmup_corpus_path=os.getenv("EMBEDDING_WARMUP_CORPUS") or None,
     )
+
+
+_config: Optional[SearchConfig] = None
+_config_lock = threading.Lock()
+
+
+def get_search_config() -> SearchConfig:
+    """Process-wide search config, read from the environment (and .env) once"""
+    global _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            if _config is None:
+                load_env_file()
+                _config = _load_search_config()
+            config = _config
+    return config
+
+
+def reload_search_config() -> SearchConfig:
+    """Re-read the environment (call src.config.reload() to also re-read .env)"""
+    global _config
+    with _config_lock:
+        _config = _load_search_config()
+        return _config
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, END
 
 try:
 	from langgraph.checkpoint.sqlite import SqliteSaver  # type: ignore
 except Exception:  # pragma: no cover
 	SqliteSaver = None  # type: ignore
+from langgraph.checkpoint.memory import MemorySaver
 
-from ..models import Paper, MiniReview, Summary, ReviewResult, ReviewArtifacts
+from ..models import Paper, MiniReview, Summary, Critique, ReviewResult, ReviewArtifacts
 from ..models import ReviewRequest
-from ..agents.search_agent import run_search
-from ..agents.summarize_agent import summarize_paper
+from ..agents.search_agent import iter_search, run_search
+from ..agents.summarize_agent import StreamingSummarizer, summarize_papers
 from ..agents.critic_agent import critique_paper
 from ..agents.comparator_agent import build_comparative_matrix, synthesize
 from ..utils.text import slugify
@@ -33,22 +37,65 @@ def search_node(state: ReviewState) -> ReviewState:
 	return {"raw_papers": papers}
 
 
-def summarize_node(state: ReviewState) -> ReviewState:
-	papers: List[Paper] = state["raw_papers"]
+def _progress_writer() -> Callable[[Dict[str, Any]], None]:
+	"""Custom stream writer for per-paper progress (no-op outside a graph run)"""
+	try:
+		return get_stream_writer()
+	except Exception:
+		return lambda _: None
+
+
+def _review(papers: List[Paper], summarize: Callable[..., List[Summary]]) -> List[MiniReview]:
+	critiques: List[Optional[Critique]] = [None] * len(papers)
+	write = _progress_writer()
+
+	def _critique(i: int, summary: Summary) -> None:
+		# Critique each paper as soon as its summary lands, while the rest are still in flight
+		critiques[i] = critique_paper(papers[i], summary)
+		write({
+			"event": "paper_summarized",
+			"paper_id": papers[i].id,
+			"done": sum(c is not None for c in critiques),
+			"total": len(papers),
+		})
+
+	summaries = summarize(papers, on_summary=_critique)
 	reviews: List[MiniReview] = []
-	for p in papers:
-		s = summarize_paper(p)
-		c = critique_paper(p, s)
-		reviews.append(MiniReview(paper_id=p.id, summary=s, critique=c))
-	return {"reviews": reviews}
+	for p, s, c in zip(papers, summaries, critiques):
+		reviews.append(MiniReview(paper_id=p.id, summary=s, critique=c or critique_paper(p, s)))
+	return reviews
+
+
+def summarize_node(state: ReviewState) -> ReviewState:
+	# LLM calls fan out with bounded concurrency; summaries come back in input order
+	return {"reviews": _review(state["raw_papers"], summarize_papers)}
+
+
+def stream_search_summarize_node(state: ReviewState) -> ReviewState:
+	"""Search and summarize together: summaries start on provisional rankings"""
+	summarizer = StreamingSummarizer()
+	papers: List[Paper] = []
+	try:
+		for ranked, final in iter_search(state["topic"], state["filters"]):
+			if final:
+				papers = ranked
+			else:
+				summarizer.update(ranked)
+		return {"raw_papers": papers, "reviews": _review(papers, summarizer.finish)}
+	finally:
+		# A failed search must not leave the summaries it started running
+		summarizer.close()
+
+
+def matrix_node(state: ReviewState) -> ReviewState:
+	return {"matrix": build_comparative_matrix(state["raw_papers"], state["reviews"])}
 
 
-def compare_node(state: ReviewState) -> ReviewState:
-	papers: List[Paper] = state["raw_papers"]
-	reviews: List[MiniReview] = state["reviews"]
-	matrix = build_comparative_matrix(papers, reviews)
-	syn = synthesize(papers, reviews)
+def synthesis_node(state: ReviewState) -> ReviewState:
+	return {"synthesis": synthesize(state["raw_papers"], state["reviews"])}
 
+
+def assemble_node(state: ReviewState) -> ReviewState:
 	slug = slugify(state["topic"]) or "review"
 	out_dir = Path("outputs")
 	md_path = out_dir / f"review_{slug}.md"
@@ -58,35 +105,89 @@ def compare_node(state: ReviewState) -> ReviewState:
 	result = ReviewResult(
 		topic=state["topic"],
 		filters=state["filters"],
-		raw_papers=papers,
-		reviews=reviews,
-		matrix=matrix,
-		synthesis=syn,
+		raw_papers=state["raw_papers"],
+		reviews=state["reviews"],
+		matrix=state["matrix"],
+		synthesis=state["synthesis"],
 		artifacts=ReviewArtifacts(
 			markdown_path=str(md_path), json_path=str(json_path), csv_path=str(csv_path)
 		),
 	)
+	return {"result": result}
+
+
+def export_markdown_node(state: ReviewState) -> ReviewState:
+	result = state["result"]
+	export_markdown(result, Path(result.artifacts.markdown_path))
+	return {"report_md": result.artifacts.markdown_path}
+
+
+def export_json_node(state: ReviewState) -> ReviewState:
+	result = state["result"]
+	export_json(result, Path(result.artifacts.json_path))
+	return {"report_json": result.artifacts.json_path}
+
+
+def export_csv_node(state: ReviewState) -> ReviewState:
+	result = state["result"]
+	export_csv(result.raw_papers, Path(result.artifacts.csv_path))
+	return {"report_csv": result.artifacts.csv_path}
+
+
+EXPORT_NODES = {
+	"export_markdown_node": export_markdown_node,
+	"export_json_node": export_json_node,
+	"export_csv_node": export_csv_node,
+}
+
+
+# One checkpointer per database for the whole process; SqliteSaver serializes access itself
+_checkpointers: Dict[str, Any] = {}
+_checkpointers_lock = threading.Lock()
 
-	export_markdown(result, md_path)
-	export_json(result, json_path)
-	export_csv(papers, csv_path)
 
-	return {"report_md": str(md_path), "report_json": str(json_path)}
+def get_checkpointer(checkpoint_path: Optional[str] = None) -> Any:
+	"""Shared checkpointer on a WAL-mode SQLite connection (in-memory if SQLite support is missing)"""
+	path = checkpoint_path or ".checkpoints/litrev.sqlite"
+	with _checkpointers_lock:
+		saver = _checkpointers.get(path)
+		if saver is None:
+			if SqliteSaver:
+				Path(path).parent.mkdir(parents=True, exist_ok=True)
+				conn = sqlite3.connect(path, check_same_thread=False)
+				conn.execute("PRAGMA journal_mode=WAL")
+				conn.execute("PRAGMA synchronous=NORMAL")
+				saver = SqliteSaver(conn)
+			else:
+				logger.warning("langgraph-checkpoint-sqlite not installed; checkpoints are kept in memory")
+				saver = MemorySaver()
+			_checkpointers[path] = saver
+		return saver
 
 
-def build_graph(checkpoint_path: Optional[str] = None):
+def build_graph(checkpoint_path: Optional[str] = None, streaming: bool = False):
 	sg = StateGraph(ReviewState)
-	sg.add_node("search_node", search_node)
-	sg.add_node("summarize_node", summarize_node)
-	sg.add_node("compare_node", compare_node)
-
-	sg.set_entry_point("search_node")
-	sg.add_edge("search_node", "summarize_node")
-	sg.add_edge("summarize_node", "compare_node")
-	sg.add_edge("compare_node", END)
-
-	if SqliteSaver:
-		Path(".checkpoints").mkdir(parents=True, exist_ok=True)
-		memory = SqliteSaver.from_conn_string(checkpoint_path or ".checkpoints/litrev.sqlite")  # type: ignore
-		return sg.compile(checkpointer=memory)
-	return sg.compile()
+	if streaming:
+		sg.add_node("summarize_node", stream_search_summarize_node)
+		sg.set_entry_point("summarize_node")
+	else:
+		sg.add_node("search_node", search_node)
+		sg.add_node("summarize_node", summarize_node)
+		sg.set_entry_point("search_node")
+		sg.add_edge("search_node", "summarize_node")
+	sg.add_node("matrix_node", matrix_node)
+	sg.add_node("synthesis_node", synthesis_node)
+	sg.add_node("assemble_node", assemble_node)
+	for name, node in EXPORT_NODES.items():
+		sg.add_node(name, node)
+
+	# Matrix and synthesis only depend on the reviews, so they run in the same step
+	sg.add_edge("summarize_node", "matrix_node")
+	sg.add_edge("summarize_node", "synthesis_node")
+	sg.add_edge(["matrix_node", "synthesis_node"], "assemble_node")
+	# The three exporters write independent files
+	for name in EXPORT_NODES:
+		sg.add_edge("assemble_node", name)
+		sg.add_edge(name, END)
+
+	return sg.compile(checkpointer=get_checkpointer(checkpoint_path))
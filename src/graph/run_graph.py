@@ -1,15 +1,97 @@
 from __future__ import annotations
 
-from typing import Tuple
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from uuid import uuid4
 
 from ..models import Filters, SearchFilters, ReviewRequest
 from ..config import get_settings
+from ..utils.logging import get_logger
 from .build_graph import build_graph
 
+logger = get_logger(__name__)
 
-def run_review(topic: str, filters: Filters) -> Tuple[str, str]:
-    settings = get_settings()
-    graph = build_graph(settings.checkpoint_path)
-    state = {"topic": topic, "filters": filters}
-    final = graph.invoke(state)
+# Compiled graphs are immutable and thread-safe; build each variant once per process
+_graphs: Dict[Tuple[str, bool], Any] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_compiled_graph(streaming: bool = False) -> Any:
+    checkpoint_path = get_settings().checkpoint_path
+    key = (checkpoint_path, streaming)
+    graph = _graphs.get(key)
+    if graph is None:
+        with _graphs_lock:
+            graph = _graphs.get(key)
+            if graph is None:
+                graph = build_graph(checkpoint_path, streaming=streaming)
+                _graphs[key] = graph
+    return graph
+
+
+def _config(thread_id: str) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def stream_review(
+    topic: str,
+    filters: Filters,
+    thread_id: str,
+    streaming: bool = False,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Iterator[str]:
+    """Run (or resume) a review under a checkpoint thread, yielding node names as they finish.
+
+    A run that stopped part-way continues from its last completed step; a finished
+    run yields nothing. `on_progress` receives in-node events such as
+    {"event": "paper_summarized", "done": 3, "total": 20}.
+    """
+    graph = get_compiled_graph(streaming)
+    config = _config(thread_id)
+    snapshot = graph.get_state(config)
+    if snapshot.values and not snapshot.next:
+        return
+    if snapshot.values:
+        logger.info(f"Resuming review {thread_id} at {', '.join(snapshot.next)}")
+        graph_input = None
+    else:
+        graph_input = {"topic": topic, "filters": filters}
+    for mode, chunk in graph.stream(graph_input, config, stream_mode=["updates", "custom"]):
+        if mode == "updates":
+            yield from chunk
+        elif on_progress:
+            on_progress(chunk)
+
+
+def review_state(thread_id: str, streaming: bool = False) -> Dict[str, Any]:
+    """Latest checkpointed state values for a review thread"""
+    return get_compiled_graph(streaming).get_state(_config(thread_id)).values
+
+
+def review_stage_count(streaming: bool = False) -> int:
+    """Number of nodes a full run goes through (for progress reporting)"""
+    return len([name for name in get_compiled_graph(streaming).nodes if not name.startswith("__")])
+
+
+def run_review(
+    topic: str, filters: Filters, streaming: bool = False, thread_id: Optional[str] = None
+) -> Tuple[str, str]:
+    """Run a review under a checkpoint thread.
+
+    Pass the same `thread_id` again (e.g. a job id) to resume: a run that stopped
+    part-way continues from its last completed step, and a finished run returns
+    its existing reports without redoing search or summarization.
+    """
+    thread_id = thread_id or uuid4().hex
+    for _ in stream_review(topic, filters, thread_id, streaming):
+        pass
+    final = review_state(thread_id, streaming)
     return final.get("report_md", ""), final.get("report_json", "")
+
+
+def resume_review(thread_id: str, streaming: bool = False) -> Tuple[str, str]:
+    """Resume a checkpointed review by thread id (it must have been started)"""
+    values = review_state(thread_id, streaming)
+    if not values:
+        raise KeyError(f"No checkpoint for review {thread_id}")
+    return run_review(values["topic"], values["filters"], streaming, thread_id)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TypedDict, List, Optional
 
-from ..models import Paper, MiniReview, Filters, SearchFilters, ComparativeMatrix, Synthesis, SearchDiagnostics
+from ..models import Paper, MiniReview, Filters, SearchFilters, ComparativeMatrix, Synthesis, SearchDiagnostics, ReviewResult
 
 
 class ReviewState(TypedDict, total=False):
@@ -11,7 +11,10 @@ class ReviewState(TypedDict, total=False):
 	raw_papers: List[Paper]
 	reviews: List[MiniReview]
 	matrix: ComparativeMatrix
+	synthesis: Synthesis
+	result: ReviewResult
 	search_diagnostics: Optional[SearchDiagnostics]
 	report_md: Optional[str]
 	report_json: Optional[str]
+	report_csv: Optional[str]
 	errors: List[str]
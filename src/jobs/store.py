@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from ..models import Filters
+
+ACTIVE_STATUSES = ("queued", "running")
+# A running job whose dispatcher has not reported for this long is treated as orphaned
+STALE_HEARTBEAT_SECONDS = 60.0
+
+_COLUMNS = (
+    "job_id TEXT PRIMARY KEY, topic TEXT NOT NULL, filters TEXT NOT NULL, streaming INTEGER DEFAULT 0,"
+    " status TEXT NOT NULL, priority INTEGER DEFAULT 0, client TEXT DEFAULT '',"
+    " created_at REAL, started_at REAL, finished_at REAL,"
+    " stage TEXT, progress REAL DEFAULT 0, message TEXT,"
+    " markdown_path TEXT, json_path TEXT, csv_path TEXT, cancel_requested INTEGER DEFAULT 0,"
+    " owner TEXT, heartbeat_at REAL"
+)
+# Columns added after the first release, for databases created before them
+_ADDED_COLUMNS = {"owner": "TEXT", "heartbeat_at": "REAL"}
+
+
+def process_owner() -> str:
+    """Identity recorded on the jobs this process claims ("host:pid")"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """False only when the owner is known to be gone: a process on this host that no longer exists"""
+    if not owner:
+        return False
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit() or os.name != "posix":
+        # Other hosts (and platforms without a signal-0 probe) are judged by heartbeat alone
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """Durable review job records in SQLite (WAL), shared by the API and job workers"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({_COLUMNS})")
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in _ADDED_COLUMNS.items():
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, priority, created_at)")
+
+    @staticmethod
+    def _row(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["filters"] = Filters.model_validate_json(job["filters"])
+        job["streaming"] = bool(job["streaming"])
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def create(
+        self, topic: str, filters: Filters, priority: int = 0, client: str = "", streaming: bool = False
+    ) -> Dict[str, Any]:
+        job_id = str(uuid4())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, topic, filters, streaming, status, priority, client, created_at)"
+                " VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, topic, filters.model_dump_json(), int(streaming), priority, client or "", time.time()),
+            )
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row(row)
+
+    def list(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """Most recent first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._row(r) for r in rows]  # type: ignore[misc]
+
+    def count_running(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'running'").fetchone()[0]
+
+    def claim_next(self, owner: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Atomically move the next queued job to running, on behalf of `owner`.
+
+        Highest priority first; among equal priorities the client with the fewest
+        running jobs goes first (so one client cannot starve the others), then FIFO.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT j.job_id FROM jobs j WHERE j.status = 'queued' ORDER BY j.priority DESC,"
+                    " (SELECT COUNT(*) FROM jobs r WHERE r.status = 'running' AND r.client = j.client) ASC,"
+                    " j.created_at ASC LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                now = time.time()
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, stage = 'starting', message = NULL,"
+                    " owner = ?, heartbeat_at = ? WHERE job_id = ?",
+                    (now, owner, now, row["job_id"]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row["job_id"])
+
+    def unclaim(self, job_id: str, owner: Optional[str]) -> None:
+        """Put a job `owner` claimed but never started back at the head of its place in the queue"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, stage = NULL, owner = NULL,"
+                " heartbeat_at = NULL WHERE job_id = ? AND status = 'running' AND owner IS ?",
+                (job_id, owner),
+            )
+
+    def heartbeat(self, owner: str) -> None:
+        """Mark every job `owner` is running as still alive"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running'", (time.time(), owner)
+            )
+
+    def update_progress(self, job_id: str, stage: str, progress: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET stage = ?, progress = ? WHERE job_id = ?", (stage, min(1.0, progress), job_id)
+            )
+
+    def finish(self, job_id: str, status: str, message: Optional[str] = None, **paths: Optional[str]) -> None:
+        """Record a terminal status (done, failed or cancelled) and any report paths"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, finished_at = ?, progress = CASE WHEN ? = 'done'"
+                " THEN 1.0 ELSE progress END, markdown_path = COALESCE(?, markdown_path),"
+                " json_path = COALESCE(?, json_path), csv_path = COALESCE(?, csv_path) WHERE job_id = ?",
+                (
+                    status, message, time.time(), status,
+                    paths.get("markdown_path"), paths.get("json_path"), paths.get("csv_path"), job_id,
+                ),
+            )
+
+    def request_cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued job now; flag a running one so its worker stops at the next stage"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE job_id = ? AND status = 'queued'",
+                (time.time(), job_id),
+            )
+            self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = 'running'", (job_id,)
+            )
+        return self.get(job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def requeue(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Queue a failed or cancelled job again; it resumes from its checkpoint"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', cancel_requested = 0, message = NULL, finished_at = NULL"
+                " WHERE job_id = ? AND status IN ('failed', 'cancelled')",
+                (job_id,),
+            )
+        return self.get(job_id)
+
+    def requeue_interrupted(self, stale_after: float = STALE_HEARTBEAT_SECONDS) -> int:
+        """Put running jobs whose dispatcher is gone back in the queue.
+
+        A dispatcher is gone when its process no longer exists on this host, or
+        when it has not sent a heartbeat for `stale_after` seconds. Jobs that
+        live dispatchers (other API workers, a process being reloaded next to
+        this one) are running are left alone.
+        """
+        cutoff = time.time() - stale_after
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, owner, heartbeat_at FROM jobs WHERE status = 'running'"
+            ).fetchall()
+            requeued = 0
+            for row in rows:
+                if _owner_alive(row["owner"]) and (row["heartbeat_at"] or 0) >= cutoff:
+                    continue
+                # Guarded on the owner so a job re-claimed in the meantime is not touched
+                requeued += self._conn.execute(
+                    "UPDATE jobs SET status = 'queued', stage = 'interrupted', owner = NULL, heartbeat_at = NULL"
+                    " WHERE job_id = ? AND status = 'running' AND owner IS ?",
+                    (row["job_id"], row["owner"]),
+                ).rowcount
+            return requeued
+
+
+_stores: Dict[str, JobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_job_store(path: Optional[str | Path] = None) -> JobStore:
+    """Process-wide JobStore for a database path (defaults to JOB_DB_PATH)"""
+    if path is None:
+        from ..config import get_settings
+
+        path = get_settings().job_db_path
+    key = str(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = JobStore(key)
+            _stores[key] = store
+        return store
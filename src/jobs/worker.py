@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Literal, Optional
+
+from ..search.corpus_writer import flush_corpus_writers
+from ..utils.logging import get_logger
+from .store import STALE_HEARTBEAT_SECONDS, JobStore, get_job_store, process_owner
+
+logger = get_logger(__name__)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def execute_job(db_path: str, job_id: str) -> str:
+    """Run one claimed job to a terminal status; returns that status.
+
+    Module-level so it can run in a worker process. The job id is the checkpoint
+    thread, so a requeued job resumes where it stopped. Cancellation is checked
+    between graph stages.
+    """
+    from ..graph.run_graph import review_stage_count, review_state, stream_review
+
+    store = get_job_store(db_path)
+    job = store.get(job_id)
+    if job is None:
+        return "missing"
+    try:
+        total = max(1, review_stage_count(job["streaming"]))
+        done = 0
+
+        def on_progress(event: Dict[str, Any]) -> None:
+            # Per-paper progress inside the summarize stage
+            if event.get("event") == "paper_summarized" and event.get("total"):
+                stage = f"summarizing {event['done']}/{event['total']}"
+                store.update_progress(job_id, stage, (done + event["done"] / event["total"]) / total)
+
+        for stage in stream_review(job["topic"], job["filters"], job_id, job["streaming"], on_progress):
+            done += 1
+            store.update_progress(job_id, stage, done / total)
+            if store.is_cancel_requested(job_id):
+                raise JobCancelled()
+        final = review_state(job_id, job["streaming"])
+        result = final.get("result")
+        store.finish(
+            job_id,
+            "done",
+            markdown_path=final.get("report_md"),
+            json_path=final.get("report_json"),
+            csv_path=final.get("report_csv") or (result.artifacts.csv_path if result else None),
+        )
+        return "done"
+    except JobCancelled:
+        store.finish(job_id, "cancelled", message="Cancelled")
+        return "cancelled"
+    except Exception as e:
+        logger.warning(f"Job {job_id} failed: {e}")
+        store.finish(job_id, "failed", message=str(e))
+        return "failed"
+    finally:
+        # Worker processes exit without running atexit hooks, so write the job's search results out now
+        flush_corpus_writers()
+
+
+class JobDispatcher:
+    """Claims queued jobs from the store and runs up to `max_concurrent` at a time.
+
+    Jobs run in a process pool by default so long reviews never hold the API's
+    event loop or GIL; `mode="thread"` keeps them in-process. Claimed jobs are
+    recorded under this process and kept alive by a heartbeat every poll, so
+    other dispatchers on the same database only requeue them once this one is
+    gone.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_concurrent: int = 2,
+        mode: Literal["process", "thread"] = "process",
+        poll_interval: float = 2.0,
+    ):
+        self.store = store
+        self.max_concurrent = max(1, max_concurrent)
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.owner = process_owner()
+        self._executor: Optional[Executor] = None
+        self._running: Dict[str, Future] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_sweep = 0.0
+
+    def _requeue_orphans(self) -> None:
+        try:
+            requeued = self.store.requeue_interrupted()
+        except Exception as e:  # pragma: no cover - database locked for too long
+            logger.warning(f"Could not requeue interrupted jobs: {e}")
+            return
+        if requeued:
+            logger.info(f"Requeued {requeued} job(s) whose worker process is gone")
+
+    def _new_executor(self) -> Executor:
+        if self.mode == "process":
+            return ProcessPoolExecutor(max_workers=self.max_concurrent, mp_context=multiprocessing.get_context("spawn"))
+        return ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="review-job")
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._executor = self._new_executor()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-dispatcher", daemon=True)
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the dispatcher (e.g. after a job is queued)"""
+        self._wake.set()
+
+    def stop(self, wait: bool = False) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _on_done(self, job_id: str, future: Future) -> None:
+        self._running.pop(job_id, None)
+        exc = future.exception()
+        if exc is not None:
+            # The worker process died or the call could not be delivered
+            logger.warning(f"Job {job_id} worker error: {exc}")
+            self.store.finish(job_id, "failed", message=str(exc))
+        self._wake.set()
+
+    def _submit(self, job_id: str) -> bool:
+        """Hand a claimed job to the pool; False (job back in the queue) if the pool had to be rebuilt"""
+        try:
+            future = self._executor.submit(execute_job, str(self.store.path), job_id)  # type: ignore[union-attr]
+        except (BrokenProcessPool, RuntimeError) as e:
+            # A worker process died (crash, OOM kill) and took the pool down with it
+            logger.warning(f"Job pool unusable ({e!r}); starting a new one")
+            self.store.unclaim(job_id, self.owner)
+            broken, self._executor = self._executor, self._new_executor()
+            broken.shutdown(wait=False, cancel_futures=True)  # type: ignore[union-attr]
+            self._wake.set()
+            return False
+        self._running[job_id] = future
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+        return True
+
+    def _tick(self) -> None:
+        try:
+            self.store.heartbeat(self.owner)
+        except Exception as e:  # pragma: no cover - database locked for too long
+            logger.warning(f"Could not record job heartbeat: {e}")
+        # Jobs of dispatchers that died (here at startup, or elsewhere later) go back in the queue
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + STALE_HEARTBEAT_SECONDS / 2
+            self._requeue_orphans()
+        while len(self._running) < self.max_concurrent and not self._stop.is_set():
+            try:
+                job = self.store.claim_next(self.owner)
+            except Exception as e:  # pragma: no cover - database locked for too long
+                logger.warning(f"Could not claim job: {e}")
+                break
+            if job is None or not self._submit(job["job_id"]):
+                break
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._tick()
+            except Exception as e:
+                # Whatever went wrong, keep heartbeating, sweeping and claiming
+                logger.warning(f"Job dispatcher error: {e!r}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
+_dispatcher: Optional[JobDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_job_dispatcher() -> JobDispatcher:
+    """Process-wide dispatcher configured from settings (not started)"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            from ..config import get_settings
+
+            s = get_settings()
+            _dispatcher = JobDispatcher(
+                get_job_store(s.job_db_path), max_concurrent=s.job_max_concurrent, mode=s.job_worker_mode
+            )
+        return _dispatcher
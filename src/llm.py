@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .config import on_reload
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MODELS = {
+	"openai": "gpt-4o-mini",
+	"anthropic": "claude-3-5-sonnet-20240620",
+}
+
+# One client per (provider, model, timeout) for the whole process, so HTTP connection
+# pools are reused across papers and jobs instead of being rebuilt per call
+_clients: Dict[Tuple[str, str, float], Any] = {}
+_lock = threading.Lock()
+
+
+def _build_chat_model(provider: str, model: str, timeout: float) -> Any:
+	if provider == "anthropic":
+		from langchain_anthropic import ChatAnthropic
+
+		return ChatAnthropic(model=model, temperature=0, timeout=timeout, max_retries=1)
+	from langchain_openai import ChatOpenAI
+
+	return ChatOpenAI(model=model, temperature=0, timeout=timeout, max_retries=1)
+
+
+def get_chat_model(provider: str, model: Optional[str] = None, timeout: float = 60.0) -> Any:
+	"""Return the shared chat model client for a provider/model, creating it on first use"""
+	provider = provider if provider in DEFAULT_MODELS else "openai"
+	key = (provider, model or DEFAULT_MODELS[provider], float(timeout))
+	client = _clients.get(key)
+	if client is None:
+		with _lock:
+			client = _clients.get(key)
+			if client is None:
+				client = _build_chat_model(*key)
+				_clients[key] = client
+				logger.info(f"Created {provider} chat client for {key[1]}")
+	return client
+
+
+def clear_chat_models() -> None:
+	"""Drop cached clients (e.g. after API keys or models change)"""
+	with _lock:
+		_clients.clear()
+
+
+# Keys, models or timeouts may have changed
+on_reload(clear_chat_models)
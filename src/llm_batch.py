@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URLS = {
+	"openai": "https://api.openai.com/v1",
+	"anthropic": "https://api.anthropic.com",
+}
+ANTHROPIC_VERSION = "2023-06-01"
+MAX_OUTPUT_TOKENS = 1024
+
+# (system, user) message pair per custom_id
+BatchRequests = Dict[str, Tuple[str, str]]
+
+
+class BatchJobError(RuntimeError):
+	"""A provider batch job failed, expired or did not finish in time"""
+
+
+def _openai_batch(
+	client: httpx.Client, requests: BatchRequests, model: str, poll_interval: float, deadline: float
+) -> Dict[str, str]:
+	lines = []
+	for custom_id, (system, user) in requests.items():
+		lines.append(json.dumps({
+			"custom_id": custom_id,
+			"method": "POST",
+			"url": "/v1/chat/completions",
+			"body": {
+				"model": model,
+				"temperature": 0,
+				"max_tokens": MAX_OUTPUT_TOKENS,
+				"messages": [{"role": "system", "content": system}, {"role": "user", "content": user}],
+			},
+		}))
+	upload = client.post(
+		"/files",
+		data={"purpose": "batch"},
+		files={"file": ("summaries.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl")},
+	)
+	upload.raise_for_status()
+	created = client.post(
+		"/batches",
+		json={"input_file_id": upload.json()["id"], "endpoint": "/v1/chat/completions", "completion_window": "24h"},
+	)
+	created.raise_for_status()
+	batch = created.json()
+	logger.info(f"Submitted OpenAI batch {batch['id']} with {len(requests)} requests")
+
+	while batch.get("status") not in {"completed", "failed", "expired", "cancelled"}:
+		if time.monotonic() > deadline:
+			client.post(f"/batches/{batch['id']}/cancel")
+			raise BatchJobError(f"OpenAI batch {batch['id']} did not finish in time")
+		time.sleep(poll_interval)
+		polled = client.get(f"/batches/{batch['id']}")
+		polled.raise_for_status()
+		batch = polled.json()
+	if batch["status"] != "completed" or not batch.get("output_file_id"):
+		raise BatchJobError(f"OpenAI batch {batch['id']} ended with status {batch['status']}")
+
+	output = client.get(f"/files/{batch['output_file_id']}/content")
+	output.raise_for_status()
+	contents: Dict[str, str] = {}
+	for line in output.text.splitlines():
+		if not line.strip():
+			continue
+		item = json.loads(line)
+		response = item.get("response") or {}
+		if item.get("error") or response.get("status_code") != 200:
+			continue
+		try:
+			contents[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+		except (KeyError, IndexError, TypeError):
+			continue
+	return contents
+
+
+def _anthropic_batch(
+	client: httpx.Client, requests: BatchRequests, model: str, poll_interval: float, deadline: float
+) -> Dict[str, str]:
+	payload = {
+		"requests": [
+			{
+				"custom_id": custom_id,
+				"params": {
+					"model": model,
+					"max_tokens": MAX_OUTPUT_TOKENS,
+					"temperature": 0,
+					"system": system,
+					"messages": [{"role": "user", "content": user}],
+				},
+			}
+			for custom_id, (system, user) in requests.items()
+		]
+	}
+	created = client.post("/v1/messages/batches", json=payload)
+	created.raise_for_status()
+	batch = created.json()
+	logger.info(f"Submitted Anthropic batch {batch['id']} with {len(requests)} requests")
+
+	while batch.get("processing_status") != "ended":
+		if time.monotonic() > deadline:
+			client.post(f"/v1/messages/batches/{batch['id']}/cancel")
+			raise BatchJobError(f"Anthropic batch {batch['id']} did not finish in time")
+		time.sleep(poll_interval)
+		polled = client.get(f"/v1/messages/batches/{batch['id']}")
+		polled.raise_for_status()
+		batch = polled.json()
+	if not batch.get("results_url"):
+		raise BatchJobError(f"Anthropic batch {batch['id']} has no results")
+
+	output = client.get(batch["results_url"])
+	output.raise_for_status()
+	contents: Dict[str, str] = {}
+	for line in output.text.splitlines():
+		if not line.strip():
+			continue
+		item = json.loads(line)
+		result = item.get("result") or {}
+		if result.get("type") != "succeeded":
+			continue
+		text = "".join(
+			block.get("text", "") for block in result.get("message", {}).get("content", []) if block.get("type") == "text"
+		)
+		contents[item["custom_id"]] = text
+	return contents
+
+
+def run_chat_batch(
+	requests: BatchRequests,
+	provider: str,
+	model: str,
+	api_key: Optional[str],
+	base_url: Optional[str] = None,
+	poll_interval: float = 30.0,
+	timeout: float = 24 * 3600.0,
+) -> Dict[str, str]:
+	"""Run chat requests through the provider's asynchronous batch API.
+
+	Blocks until the batch ends (or `timeout` passes, cancelling it) and returns
+	{custom_id: response text} for the requests that succeeded. Batch jobs are
+	cheaper but can take hours, so this is meant for offline review runs.
+	"""
+	if not requests:
+		return {}
+	provider = provider if provider in DEFAULT_BASE_URLS else "openai"
+	if provider == "anthropic":
+		headers = {"anthropic-version": ANTHROPIC_VERSION}
+		if api_key:
+			headers["x-api-key"] = api_key
+		run = _anthropic_batch
+	else:
+		headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+		run = _openai_batch
+	deadline = time.monotonic() + timeout
+	with httpx.Client(base_url=base_url or DEFAULT_BASE_URLS[provider], headers=headers, timeout=60) as client:
+		return run(client, requests, model, poll_interval, deadline)
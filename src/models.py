@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional, Literal, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class SearchFilters(BaseModel):
@@ -33,6 +33,8 @@ class ScoreComponents(BaseModel):
 	rrf: float = 0.0
 	dense: float = 0.0
 	recency: float = 0.0
+	semantic: float = 0.0
+	hybrid: float = 0.0
 	final: float = 0.0
 
 
@@ -44,7 +46,7 @@ class Provenance(BaseModel):
 
 class Paper(BaseModel):
 	id: str
-	source: Literal["arxiv", "pubmed", "crossref", "openalex", "semanticscholar", "europe_pmc", "biorxiv", "medrxiv", "dblp", "scholar"]
+	source: str
 	title: str
 	abstract: Optional[str] = None
 	authors: List[str] = Field(default_factory=list)
@@ -59,6 +61,16 @@ class Paper(BaseModel):
 	reasons: List[str] = Field(default_factory=list)
 	provenance: List[Provenance] = Field(default_factory=list)
 
+	@field_validator("source")
+	@classmethod
+	def _known_source(cls, value: str) -> str:
+		# Valid sources come from the adapter registry (src/tools/registry.py)
+		from .tools.registry import paper_sources
+
+		if value not in paper_sources():
+			raise ValueError(f"Unknown paper source: {value}")
+		return value
+
 
 class Quote(BaseModel):
 	text: str
@@ -157,3 +169,6 @@ class SearchDiagnostics(BaseModel):
 	fusion_params: Dict[str, Any]
 	search_duration: float
 	api_retries: Dict[str, int]
+	source_plan: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+	skipped_sources: Dict[str, str] = Field(default_factory=dict)
+	open_circuits: List[str] = Field(default_factory=list)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Literal, Optional
+from xml.etree import ElementTree as ET
+
+from ..models import Paper
+from ..utils.logging import get_logger
+from .local_corpus import LocalCorpus
+
+logger = get_logger(__name__)
+
+DumpFormat = Literal["openalex", "crossref", "pubmed", "papers"]
+
+# Papers written per transaction
+INGEST_BATCH_SIZE = 2000
+
+
+def _open(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def _json_records(path: Path, list_key: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Records from JSONL, a JSON array, or a JSON object holding the array under `list_key`"""
+    with _open(path) as f:
+        first_line = f.readline()
+        try:
+            data = json.loads(first_line)
+        except ValueError:
+            data = None  # a pretty-printed document
+        if isinstance(data, dict) and not (list_key and list_key in data):
+            yield data
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        if data is None:
+            data = json.loads(first_line + f.read())
+    if isinstance(data, dict):
+        data = data.get(list_key, []) if list_key and list_key in data else [data]
+    yield from data
+
+
+def _parse_each(records: Iterable[Dict[str, Any]], parse: Callable[[Dict[str, Any]], Optional[Paper]], path: Path):
+    for record in records:
+        try:
+            paper = parse(record)
+        except Exception as e:
+            logger.debug(f"Skipping unparseable record in {path}: {e}")
+            continue
+        if paper is not None and paper.title:
+            yield paper
+
+
+def read_openalex(path: Path) -> Iterator[Paper]:
+    """Works from an OpenAlex snapshot part file (JSONL, usually gzipped)"""
+    from ..tools.openalex_tool import parse_openalex_work
+
+    yield from _parse_each(_json_records(path), parse_openalex_work, path)
+
+
+def read_crossref(path: Path) -> Iterator[Paper]:
+    """Works from a Crossref public data file ({"items": [...]}) or JSONL of work items"""
+    from ..tools.crossref_tool import parse_crossref_item
+
+    yield from _parse_each(_json_records(path, list_key="items"), parse_crossref_item, path)
+
+
+def read_pubmed(path: Path) -> Iterator[Paper]:
+    """Articles from a PubMed baseline or update file (PubmedArticleSet XML, usually gzipped)"""
+    from ..tools.pubmed_tool import parse_pubmed_article
+
+    with _open(path) as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag != "PubmedArticle":
+                continue
+            try:
+                paper = parse_pubmed_article(elem)
+            except Exception as e:
+                logger.debug(f"Skipping unparseable article in {path}: {e}")
+                paper = None
+            elem.clear()
+            if paper is not None:
+                yield paper
+
+
+def read_papers(path: Path) -> Iterator[Paper]:
+    """Paper records as written by this project (JSON array or JSONL)"""
+    yield from _parse_each(_json_records(path), lambda record: Paper(**record), path)
+
+
+READERS: Dict[str, Callable[[Path], Iterator[Paper]]] = {
+    "openalex": read_openalex,
+    "crossref": read_crossref,
+    "pubmed": read_pubmed,
+    "papers": read_papers,
+}
+
+
+def detect_format(path: Path) -> DumpFormat:
+    """Guess a dump's format from its name, then from its first bytes"""
+    name = path.name.lower()
+    for fmt in ("openalex", "crossref", "pubmed"):
+        if fmt in str(path).lower():
+            return fmt
+    with _open(path) as f:
+        head = f.read(4096)
+    if "<PubmedArticle" in head:
+        return "pubmed"
+    if '"abstract_inverted_index"' in head or '"authorships"' in head or "openalex.org/W" in head:
+        return "openalex"
+    if '"container-title"' in head or '"DOI"' in head:
+        return "crossref"
+    if name.endswith((".json", ".jsonl", ".json.gz", ".jsonl.gz")):
+        return "papers"
+    raise ValueError(f"Cannot tell the format of {path}; pass it explicitly")
+
+
+def ingest_file(
+    corpus: LocalCorpus,
+    path: str | Path,
+    fmt: Optional[DumpFormat] = None,
+    force: bool = False,
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> int:
+    """Stream one dump file into the corpus in batches; returns papers written.
+
+    Files already ingested and unchanged since (same size and mtime) are
+    skipped unless `force`, so re-running over a snapshot directory only
+    picks up new or updated parts.
+    """
+    path = Path(path)
+    if not force and corpus.file_ingested(path):
+        logger.info(f"Skipping {path} (already ingested)")
+        return 0
+    papers = READERS[fmt or detect_format(path)](path)
+    written = 0
+    while True:
+        batch: List[Paper] = list(islice(papers, batch_size))
+        if not batch:
+            break
+        written += corpus.upsert(batch)
+    corpus.mark_ingested(path, written)
+    logger.info(f"Ingested {written} papers from {path}")
+    return written
+
+
+def ingest_paths(
+    corpus: LocalCorpus,
+    paths: Iterable[str | Path],
+    fmt: Optional[DumpFormat] = None,
+    force: bool = False,
+) -> int:
+    """Ingest files, and every file under directories, then optimize the index"""
+    files: List[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file() and not p.name.startswith(".")))
+        else:
+            files.append(path)
+    written = 0
+    for path in files:
+        try:
+            written += ingest_file(corpus, path, fmt, force)
+        except Exception as e:
+            logger.warning(f"Could not ingest {path}: {e}")
+    if written:
+        corpus.optimize()
+    return written
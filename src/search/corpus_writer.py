@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from ..models import Paper
+from ..utils.logging import get_logger
+from .local_corpus import get_local_corpus
+
+logger = get_logger(__name__)
+
+# Papers written per transaction
+WRITE_BATCH_SIZE = 500
+# Searches whose papers may wait for the writer; further ones are dropped, not queued
+MAX_PENDING = 256
+
+
+class CorpusWriter:
+    """Write-behind upserts of search results into the local corpus.
+
+    `submit` only enqueues; a daemon thread collects submissions for up to
+    `flush_seconds` (or WRITE_BATCH_SIZE papers) and writes them in one
+    transaction, so searches never wait on SQLite.
+    """
+
+    def __init__(self, path: str | Path, flush_seconds: float = 2.0):
+        self.path = Path(path)
+        self.flush_seconds = flush_seconds
+        self._queue: "queue.Queue[List[Paper]]" = queue.Queue(maxsize=MAX_PENDING)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+    def submit(self, papers: Sequence[Paper]) -> None:
+        if not papers:
+            return
+        self._start()
+        try:
+            # Copies: callers keep mutating their papers (scores, reasons) after submitting
+            self._queue.put_nowait([p.model_copy() for p in papers])
+        except queue.Full:
+            with self._lock:
+                self.dropped += len(papers)
+            logger.warning(f"Corpus writer is behind; dropped {len(papers)} papers")
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until everything submitted so far is written (False on timeout)"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="corpus-writer", daemon=True)
+                self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            batches = [self._queue.get()]
+            size = len(batches[0])
+            deadline = time.monotonic() + self.flush_seconds
+            while size < WRITE_BATCH_SIZE:
+                try:
+                    batch = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                batches.append(batch)
+                size += len(batch)
+            try:
+                self._write([p for batch in batches for p in batch])
+            except Exception as e:
+                logger.warning(f"Could not write {size} papers to the local corpus: {e}")
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
+
+    def _write(self, papers: List[Paper]) -> None:
+        corpus = get_local_corpus(self.path, create=True)
+        if corpus is None:
+            return
+        for start in range(0, len(papers), WRITE_BATCH_SIZE):
+            self.written += corpus.upsert(papers[start:start + WRITE_BATCH_SIZE])
+
+
+_writers: Dict[Path, CorpusWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_corpus_writer(path: str | Path, flush_seconds: float = 2.0) -> CorpusWriter:
+    """Process-wide writer for the corpus at `path` (flushed at interpreter exit)"""
+    path = Path(path)
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None:
+            writer = _writers[path] = CorpusWriter(path, flush_seconds)
+            atexit.register(writer.flush)
+        return writer
+
+
+def flush_corpus_writers(timeout: float = 10.0) -> None:
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush(timeout)
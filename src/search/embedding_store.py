@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import pickle
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
@@ -209,13 +210,20 @@ class EmbeddingStore:
         }
 
 
-def get_embedding_store() -> EmbeddingStore:
-    """Get global embedding store instance"""
-    global _embedding_store
-    if '_embedding_store' not in globals():
-        _embedding_store = EmbeddingStore()
-    return _embedding_store
-
-
 # Global instance
 _embedding_store: Optional[EmbeddingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """Get global embedding store instance (None if FAISS is unavailable)"""
+    global _embedding_store
+    if _embedding_store is None:
+        with _store_lock:
+            if _embedding_store is None:
+                try:
+                    _embedding_store = EmbeddingStore()
+                except Exception as e:
+                    logger.warning(f"Embedding store unavailable: {e}")
+                    return None
+    return _embedding_store
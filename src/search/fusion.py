@@ -198,12 +198,9 @@ def calculate_dense_scores(papers: List[Paper], query: str) -> List[Paper]:
             logger.warning("OpenAI API key not available, skipping dense scoring")
             return papers
         
-        # Get query embedding
-        query_response = openai.embeddings.create(
-            model="text-embedding-3-large",
-            input=query
-        )
-        query_embedding = query_response.data[0].embedding
+        # Get query embedding (shared memo cache with semantic/hybrid search)
+        from .query_cache import embed_text
+        query_embedding = embed_text(query, "text-embedding-3-large")
         
         # Get paper embeddings
         paper_texts = []
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..models import Paper, SearchFilters
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Column weights for bm25(): title, abstract, authors, venue
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 1.0)
+# Words that carry no lexical signal in a query (or are query-syntax operators)
+QUERY_STOPWORDS = {
+    "a", "an", "and", "or", "not", "near", "the", "of", "in", "on", "for", "to", "with", "by", "from", "at", "as",
+    "is", "are", "via", "using", "based",
+}
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS papers ("
+    " key TEXT PRIMARY KEY, id TEXT NOT NULL, origin TEXT NOT NULL, title TEXT NOT NULL, abstract TEXT,"
+    " authors TEXT, year INTEGER, venue TEXT, doi TEXT, url TEXT, pdf_url TEXT, citations_count INTEGER,"
+    " updated_at REAL)",
+    "CREATE INDEX IF NOT EXISTS papers_doi ON papers (doi)",
+    "CREATE INDEX IF NOT EXISTS papers_year ON papers (year)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5("
+    " title, abstract, authors, venue, content='papers', content_rowid='rowid',"
+    " tokenize='porter unicode61 remove_diacritics 2')",
+    # Keep the external-content index in step with the papers table
+    "CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN"
+    " INSERT INTO papers_fts (rowid, title, abstract, authors, venue)"
+    " VALUES (new.rowid, new.title, new.abstract, new.authors, new.venue); END",
+    "CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN"
+    " INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors, venue)"
+    " VALUES ('delete', old.rowid, old.title, old.abstract, old.authors, old.venue); END",
+    "CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN"
+    " INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors, venue)"
+    " VALUES ('delete', old.rowid, old.title, old.abstract, old.authors, old.venue);"
+    " INSERT INTO papers_fts (rowid, title, abstract, authors, venue)"
+    " VALUES (new.rowid, new.title, new.abstract, new.authors, new.venue); END",
+    "CREATE INDEX IF NOT EXISTS papers_id ON papers (id)",
+    # Every source ID a paper was seen under, so merged records are found by any of them
+    "CREATE TABLE IF NOT EXISTS paper_ids (id TEXT, source TEXT, key TEXT, PRIMARY KEY (id, source))",
+    "CREATE TABLE IF NOT EXISTS provenance ("
+    " key TEXT, source TEXT, query_id TEXT, rank_in_source INTEGER, seen_at REAL,"
+    " PRIMARY KEY (key, source, query_id))",
+    "CREATE TABLE IF NOT EXISTS ingested_files ("
+    " path TEXT PRIMARY KEY, size INTEGER, mtime REAL, papers INTEGER, ingested_at REAL)",
+]
+
+# Newer records win, but never blank out a field an earlier source filled in
+_UPSERT = (
+    "INSERT INTO papers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET"
+    " title = excluded.title,"
+    " abstract = COALESCE(excluded.abstract, papers.abstract),"
+    " authors = CASE WHEN excluded.authors = '[]' THEN papers.authors ELSE excluded.authors END,"
+    " year = COALESCE(excluded.year, papers.year),"
+    " venue = COALESCE(excluded.venue, papers.venue),"
+    " doi = COALESCE(excluded.doi, papers.doi),"
+    " url = COALESCE(excluded.url, papers.url),"
+    " pdf_url = COALESCE(excluded.pdf_url, papers.pdf_url),"
+    " citations_count = COALESCE(excluded.citations_count, papers.citations_count),"
+    " updated_at = excluded.updated_at"
+)
+_COLUMNS = "key, id, origin, title, abstract, authors, year, venue, doi, url, pdf_url, citations_count"
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Bare lower-case DOI ("https://doi.org/10.1/X" -> "10.1/x")"""
+    if not doi:
+        return None
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", doi.strip(), flags=re.IGNORECASE)
+    return doi.lower() or None
+
+
+def paper_key(paper: Paper) -> str:
+    """Canonical corpus key: the DOI when there is one, else the source's own ID"""
+    doi = normalize_doi(paper.doi)
+    return f"doi:{doi}" if doi else f"{paper.source}:{paper.id}"
+
+
+def fts_query(query: str) -> str:
+    """FTS5 MATCH expression for a free-text or boolean search query (any term matches, bm25 ranks)"""
+    terms = []
+    for word in re.findall(r"[^\W_]+", query.lower()):
+        if word not in QUERY_STOPWORDS and len(word) > 1 and word not in terms:
+            terms.append(word)
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+class LocalCorpus:
+    """SQLite FTS5 index of papers ingested from dumps or earlier searches"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def upsert(self, papers: Iterable[Paper]) -> int:
+        """Insert or merge papers, their source IDs and provenance (one transaction); returns papers written"""
+        papers = [p for p in papers if p.title]
+        if not papers:
+            return 0
+        now = time.time()
+        rows = [
+            (
+                paper_key(p), p.id, p.source, p.title, p.abstract or None, json.dumps(p.authors), p.year,
+                p.venue or None, normalize_doi(p.doi), p.url, p.pdf_url, p.citations_count, now,
+            )
+            for p in papers
+        ]
+        aliases = [(p.id, p.source, paper_key(p)) for p in papers]
+        provenance = [
+            (paper_key(p), prov.source, prov.query_id, prov.rank_in_source, now)
+            for p in papers
+            for prov in p.provenance
+        ]
+        with self._lock:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.executemany("INSERT OR REPLACE INTO paper_ids VALUES (?, ?, ?)", aliases)
+            self._conn.executemany("INSERT OR REPLACE INTO provenance VALUES (?, ?, ?, ?, ?)", provenance)
+            self._conn.commit()
+        return len(rows)
+
+    def search(self, query: str, filters: SearchFilters, limit: Optional[int] = None) -> List[Paper]:
+        """Best bm25 matches with year, venue (substring) and OA (has a PDF) filters applied in SQL"""
+        match = fts_query(query)
+        if not match:
+            return []
+        sql = [
+            f"SELECT {', '.join('p.' + c for c in _COLUMNS.split(', '))},"
+            f" bm25(papers_fts, {', '.join(map(str, BM25_WEIGHTS))}) AS rank"
+            " FROM papers_fts JOIN papers p ON p.rowid = papers_fts.rowid WHERE papers_fts MATCH ?"
+        ]
+        params: List[Any] = [match]
+        if filters.start_year:
+            sql.append("AND p.year >= ?")
+            params.append(filters.start_year)
+        if filters.end_year:
+            sql.append("AND p.year <= ?")
+            params.append(filters.end_year)
+        if filters.venues:
+            sql.append("AND (" + " OR ".join("instr(lower(p.venue), ?) > 0" for _ in filters.venues) + ")")
+            params.extend(venue.lower() for venue in filters.venues)
+        if filters.oa_only or filters.must_have_pdf:
+            sql.append("AND p.pdf_url IS NOT NULL")
+        sql.append("ORDER BY rank LIMIT ?")
+        params.append(limit or filters.limit)
+        with self._lock:
+            rows = self._conn.execute(" ".join(sql), params).fetchall()
+        return [self._to_paper(row, reason=f"Local corpus bm25: {-row['rank']:.2f}") for row in rows]
+
+    def get(self, keys: Iterable[str]) -> Dict[str, Paper]:
+        """Papers by corpus key (see paper_key)"""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Paper] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM papers WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                found.update((row["key"], self._to_paper(row)) for row in rows)
+        return found
+
+    def lookup(self, ids: Iterable[str]) -> Dict[str, Paper]:
+        """Papers by the IDs clients hold: any source ID a paper was seen under, or its DOI"""
+        ids = [i for i in dict.fromkeys(ids) if i]
+        keys: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ", ".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT id, key FROM paper_ids WHERE id IN ({marks})"
+                    f" UNION ALL SELECT id, key FROM papers WHERE id IN ({marks})",
+                    chunk + chunk,
+                ):
+                    keys.setdefault(row["id"], row["key"])
+        for paper_id in ids:
+            doi = normalize_doi(paper_id)
+            if paper_id not in keys and doi and doi.startswith("10."):
+                keys[paper_id] = f"doi:{doi}"
+        found = self.get(keys.values())
+        return {paper_id: found[key] for paper_id, key in keys.items() if key in found}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def file_ingested(self, path: Path) -> bool:
+        """True if this file, unchanged since, was already ingested"""
+        stat = path.stat()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime FROM ingested_files WHERE path = ?", (str(path.resolve()),)
+            ).fetchone()
+        return row is not None and row["size"] == stat.st_size and row["mtime"] == stat.st_mtime
+
+    def mark_ingested(self, path: Path, papers: int) -> None:
+        stat = path.stat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?, ?)",
+                (str(path.resolve()), stat.st_size, stat.st_mtime, papers, time.time()),
+            )
+            self._conn.commit()
+
+    def optimize(self) -> None:
+        """Merge FTS index segments after a bulk load"""
+        with self._lock:
+            self._conn.execute("INSERT INTO papers_fts (papers_fts) VALUES ('optimize')")
+            self._conn.commit()
+
+    @staticmethod
+    def _to_paper(row: sqlite3.Row, reason: Optional[str] = None) -> Paper:
+        return Paper(
+            id=row["id"],
+            source=row["origin"],
+            title=row["title"],
+            abstract=row["abstract"],
+            authors=json.loads(row["authors"] or "[]"),
+            year=row["year"],
+            venue=row["venue"],
+            doi=row["doi"],
+            url=row["url"],
+            pdf_url=row["pdf_url"],
+            citations_count=row["citations_count"],
+            reasons=[reason] if reason else [],
+        )
+
+
+_corpora: Dict[Path, LocalCorpus] = {}
+_corpora_lock = threading.Lock()
+
+
+def get_local_corpus(path: str | Path, create: bool = False) -> Optional[LocalCorpus]:
+    """Process-wide corpus at `path`; None if it does not exist (and `create` is off) or cannot be opened"""
+    path = Path(path)
+    with _corpora_lock:
+        corpus = _corpora.get(path)
+        if corpus is None:
+            if not create and not path.exists():
+                return None
+            try:
+                corpus = _corpora[path] = LocalCorpus(path)
+            except Exception as e:  # pragma: no cover - filesystem
+                logger.warning(f"Local corpus unavailable: {e}")
+                return None
+        return corpus
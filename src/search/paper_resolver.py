@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from ..config_search import SearchConfig, get_search_config
+from ..models import Paper
+from ..utils.logging import get_logger
+from .corpus_writer import get_corpus_writer
+from .local_corpus import get_local_corpus, normalize_doi
+
+logger = get_logger(__name__)
+
+IdKind = Literal["openalex", "doi", "pmid", "arxiv", "s2", "unknown"]
+
+_OPENALEX_ID = re.compile(r"^(?:https?://openalex\.org/)?(W\d+)$", re.IGNORECASE)
+_ARXIV_ID = re.compile(
+    r"^(?:arxiv:|https?://arxiv\.org/(?:abs|pdf)/)?(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?$",
+    re.IGNORECASE,
+)
+_PMID = re.compile(r"^(?:pmid:|https?://pubmed\.ncbi\.nlm\.nih\.gov/)?(\d{1,9})/?$", re.IGNORECASE)
+_S2_ID = re.compile(r"^(?:https?://www\.semanticscholar\.org/paper/(?:[^/]+/)?)?([0-9a-f]{40})$")
+
+
+def classify_id(paper_id: str) -> Tuple[IdKind, str]:
+    """What kind of identifier a client-held paper ID is, and its bare form for the provider"""
+    paper_id = paper_id.strip()
+    doi = normalize_doi(paper_id)
+    if doi and doi.startswith("10."):
+        return "doi", doi
+    for kind, pattern in (("openalex", _OPENALEX_ID), ("arxiv", _ARXIV_ID), ("pmid", _PMID), ("s2", _S2_ID)):
+        match = pattern.match(paper_id)
+        if match:
+            value = match.group(1)
+            return kind, value.upper() if kind == "openalex" else value
+    return "unknown", paper_id
+
+
+def _by_openalex(wanted: Dict[str, List[str]]) -> Dict[str, Paper]:
+    from ..tools.openalex_tool import fetch_openalex_works
+
+    return _match(wanted, fetch_openalex_works("ids.openalex", list(wanted)), lambda p: p.id.upper())
+
+
+def _by_doi(wanted: Dict[str, List[str]]) -> Dict[str, Paper]:
+    from ..tools.openalex_tool import fetch_openalex_works
+
+    return _match(wanted, fetch_openalex_works("doi", list(wanted)), lambda p: normalize_doi(p.doi))
+
+
+def _by_pmid(wanted: Dict[str, List[str]]) -> Dict[str, Paper]:
+    from ..tools.pubmed_tool import fetch_pubmed_articles
+
+    return _match(wanted, fetch_pubmed_articles(list(wanted)), lambda p: p.id)
+
+
+def _by_arxiv(wanted: Dict[str, List[str]]) -> Dict[str, Paper]:
+    from ..tools.arxiv_tool import fetch_arxiv_papers
+
+    return _match(wanted, fetch_arxiv_papers(list(wanted)), lambda p: classify_id(p.id)[1])
+
+
+def _by_s2(wanted: Dict[str, List[str]]) -> Dict[str, Paper]:
+    from ..tools.semantic_scholar_tool import fetch_s2_papers
+
+    values = list(wanted)
+    found: Dict[str, Paper] = {}
+    # The batch endpoint answers in request order, with null for unknown IDs
+    for value, paper in zip(values, fetch_s2_papers(values)):
+        if paper is not None and paper.title:
+            found.update((requested, paper) for requested in wanted[value])
+    return found
+
+
+def _match(
+    wanted: Dict[str, List[str]], papers: List[Paper], key: Callable[[Paper], Optional[str]]
+) -> Dict[str, Paper]:
+    found: Dict[str, Paper] = {}
+    for paper in papers:
+        for requested in wanted.get(key(paper) or "", []):
+            found[requested] = paper
+    return found
+
+
+# Which source answers each kind of ID, and how
+LOOKUPS: Dict[str, Tuple[str, Callable[[Dict[str, List[str]]], Dict[str, Paper]]]] = {
+    "openalex": ("openalex", _by_openalex),
+    "doi": ("openalex", _by_doi),
+    "pmid": ("pubmed", _by_pmid),
+    "arxiv": ("arxiv", _by_arxiv),
+    "s2": ("semanticscholar", _by_s2),
+}
+
+
+def _lookup(groups: Dict[str, Dict[str, List[str]]], config: SearchConfig) -> Dict[str, Paper]:
+    """One batched provider lookup per ID kind, run concurrently"""
+    jobs = {
+        kind: LOOKUPS[kind][1]
+        for kind in groups
+        if kind in LOOKUPS and config.enable_sources.get(LOOKUPS[kind][0], True)
+    }
+    found: Dict[str, Paper] = {}
+    if not jobs:
+        return found
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {kind: executor.submit(lookup, groups[kind]) for kind, lookup in jobs.items()}
+        for kind, future in futures.items():
+            try:
+                found.update(future.result())
+            except Exception as e:
+                logger.warning(f"Resolving {kind} IDs failed: {e}")
+    return found
+
+
+def resolve_papers(paper_ids: Sequence[str], config: Optional[SearchConfig] = None) -> Dict[str, Paper]:
+    """Papers for client-held IDs, without searching.
+
+    The local corpus answers first. The rest are grouped by kind and looked up
+    in bulk: OpenAlex IDs and DOIs through OpenAlex filters, PMIDs through
+    PubMed efetch, arXiv IDs through id_list, S2 paper IDs through
+    /paper/batch. DOIs OpenAlex does not know get a second try at S2. IDs
+    that are not recognisable identifiers (titles, URLs) are left out.
+    Newly resolved papers are written back to the local corpus.
+    """
+    config = config or get_search_config()
+    ids = [paper_id for paper_id in dict.fromkeys(paper_ids) if paper_id and paper_id.strip()]
+    found: Dict[str, Paper] = {}
+    corpus = get_local_corpus(config.local_corpus_path)
+    if corpus is not None:
+        try:
+            found.update(corpus.lookup(ids))
+        except Exception as e:
+            logger.warning(f"Local corpus lookup failed: {e}")
+
+    groups: Dict[str, Dict[str, List[str]]] = {}
+    for paper_id in ids:
+        if paper_id not in found:
+            kind, value = classify_id(paper_id)
+            groups.setdefault(kind, {}).setdefault(value, []).append(paper_id)
+    resolved = _lookup(groups, config)
+
+    # DOIs OpenAlex does not know get a second chance at Semantic Scholar
+    retry: Dict[str, List[str]] = {}
+    for doi, requested in groups.get("doi", {}).items():
+        missing = [paper_id for paper_id in requested if paper_id not in resolved]
+        if missing:
+            retry[f"DOI:{doi}"] = missing
+    if retry:
+        resolved.update(_lookup({"s2": retry}, config))
+
+    unresolved = [paper_id for paper_id in ids if paper_id not in found and paper_id not in resolved]
+    if unresolved:
+        logger.info(f"Could not resolve {len(unresolved)} of {len(ids)} paper IDs")
+    if resolved and config.ingest_search_results:
+        get_corpus_writer(config.local_corpus_path, config.ingest_flush_seconds).submit(list(resolved.values()))
+    found.update(resolved)
+    return found
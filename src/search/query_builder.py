@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import List, Dict, Any
 from pathlib import Path
 
@@ -9,29 +10,43 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Load MeSH terms from JSON file
-import json
-from pathlib import Path
-
 MESH_TERMS_FILE = Path(__file__).parent.parent / "resources" / "mesh_terms.json"
 
-try:
-    with open(MESH_TERMS_FILE, "r", encoding="utf-8") as f:
-        MESH_TERMS = json.load(f)
-except FileNotFoundError:
-    # Fallback to basic terms if file not found
-    MESH_TERMS = {
-        "machine learning": ["machine learning", "artificial intelligence", "deep learning", "neural networks"],
-        "healthcare": ["healthcare", "medical", "clinical", "health", "medicine"],
-        "cancer": ["cancer", "oncology", "tumor", "neoplasm", "carcinoma"],
-        "diabetes": ["diabetes", "diabetic", "glucose", "insulin"],
-        "cardiovascular": ["cardiovascular", "heart", "cardiac", "vascular"],
-        "mental health": ["mental health", "psychiatry", "psychology", "depression", "anxiety"],
-        "covid": ["covid", "sars-cov-2", "coronavirus", "pandemic"],
-        "drug": ["drug", "pharmaceutical", "medication", "therapy", "treatment"],
-        "diagnosis": ["diagnosis", "diagnostic", "screening", "detection"],
-        "treatment": ["treatment", "therapy", "intervention", "management"]
-    }
+# Fallback to basic terms if the file is missing
+_FALLBACK_MESH_TERMS = {
+    "machine learning": ["machine learning", "artificial intelligence", "deep learning", "neural networks"],
+    "healthcare": ["healthcare", "medical", "clinical", "health", "medicine"],
+    "cancer": ["cancer", "oncology", "tumor", "neoplasm", "carcinoma"],
+    "diabetes": ["diabetes", "diabetic", "glucose", "insulin"],
+    "cardiovascular": ["cardiovascular", "heart", "cardiac", "vascular"],
+    "mental health": ["mental health", "psychiatry", "psychology", "depression", "anxiety"],
+    "covid": ["covid", "sars-cov-2", "coronavirus", "pandemic"],
+    "drug": ["drug", "pharmaceutical", "medication", "therapy", "treatment"],
+    "diagnosis": ["diagnosis", "diagnostic", "screening", "detection"],
+    "treatment": ["treatment", "therapy", "intervention", "management"]
+}
+
+
+@lru_cache(maxsize=1)
+def _mesh_terms() -> Dict[str, List[str]]:
+    """MeSH expansions, read from disk on first use rather than at import"""
+    try:
+        with open(MESH_TERMS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return _FALLBACK_MESH_TERMS
+
+
+def __getattr__(name: str) -> Any:
+    if name == "MESH_TERMS":
+        return _mesh_terms()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def mesh_concepts(query: str) -> List[str]:
+    """MeSH concepts (keys of mesh_terms.json) mentioned in the query"""
+    query_lower = query.lower()
+    return [concept for concept in _mesh_terms() if concept in query_lower]
 
 
 def _expand_with_mesh_terms(query: str) -> List[str]:
@@ -39,7 +54,7 @@ def _expand_with_mesh_terms(query: str) -> List[str]:
     query_lower = query.lower()
     expanded_terms = []
     
-    for concept, terms in MESH_TERMS.items():
+    for concept, terms in _mesh_terms().items():
         if concept in query_lower:
             expanded_terms.extend(terms)
     
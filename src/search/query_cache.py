@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+from ..config_search import get_search_config
+from ..utils.cache import TTLCache
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = get_logger(__name__)
+
+# Shared by semantic_search, hybrid_search and fusion.calculate_dense_scores
+_translation_cache: Optional[TTLCache] = None
+_embedding_cache: Optional[TTLCache] = None
+_init_lock = threading.Lock()
+
+
+def _caches() -> tuple[TTLCache, TTLCache]:
+    global _translation_cache, _embedding_cache
+    if _translation_cache is None or _embedding_cache is None:
+        with _init_lock:
+            if _translation_cache is None or _embedding_cache is None:
+                config = get_search_config()
+                _translation_cache = TTLCache(maxsize=config.query_cache_size, ttl=config.query_cache_ttl)
+                _embedding_cache = TTLCache(maxsize=config.query_cache_size, ttl=config.query_cache_ttl)
+    return _translation_cache, _embedding_cache
+
+
+def normalize_query(text: str) -> str:
+    """Normalize query text for cache keys (case and whitespace insensitive)"""
+    return " ".join((text or "").lower().split())
+
+
+def cached_translation(query: str, translate: Callable[[str], str]) -> str:
+    """Return the translated query, calling `translate` only on a cache miss"""
+    translations, _ = _caches()
+    key = normalize_query(query)
+    translated = translations.get(key)
+    if translated is None:
+        translated = translate(query)
+        # Identity results (English queries, failed translations) are cheap or worth retrying
+        if translated != query:
+            translations.set(key, translated)
+    return translated
+
+
+def embed_text(text: str, model: str = "text-embedding-3-large") -> np.ndarray:
+    """Embed a query with OpenAI, memoized by (model, text with whitespace collapsed).
+
+    Unlike the other caches the key keeps case: embeddings are case-sensitive
+    ("AI" and "ai" land apart), and the text that gets embedded is exactly the
+    key, so a cached vector never depends on which spelling was seen first.
+    """
+    _, embeddings = _caches()
+    collapsed = " ".join((text or "").split())
+
+    def _embed() -> np.ndarray:
+        import numpy as np
+        import openai
+
+        response = openai.embeddings.create(model=model, input=collapsed)
+        vector = np.array(response.data[0].embedding)
+        vector.setflags(write=False)  # shared between callers
+        return vector
+
+    return embeddings.get_or_set((model, collapsed), _embed)
+
+
+def clear_query_caches() -> None:
+    """Drop all cached translations and query embeddings"""
+    translations, embeddings = _caches()
+    translations.clear()
+    embeddings.clear()
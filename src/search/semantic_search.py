@@ -1,39 +1,41 @@
 from __future__ import annotations
 
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import numpy as np
 
-from ..models import Paper, SearchFilters
+from ..models import Paper, SearchFilters, ScoreComponents
+from ..config_search import get_search_config
 from ..utils.logging import get_logger
 from .embedding_store import get_embedding_store, EmbeddingRecord
 from .fusion import calculate_bm25_scores
+from .query_cache import cached_translation, embed_text
+from .warmup import is_embedding_store_ready, start_background_warmup, warm_embedding_store
 
 logger = get_logger(__name__)
 
+# Normalized score of a leg's weakest hit, so being found at all outranks being absent (0)
+LEG_SCORE_FLOOR = 0.1
+
 
 def get_query_embedding(query: str, model: str = "text-embedding-3-large") -> np.ndarray:
-    """Get embedding for a query using OpenAI API"""
+    """Get embedding for a query using OpenAI API (cached, see query_cache)"""
     try:
-        import openai
         from ..config import get_settings
         
         settings = get_settings()
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not available")
         
-        # Translate non-English queries if needed
-        translated_query = _translate_query_if_needed(query)
+        # Translate non-English queries if needed (memoized per normalized query)
+        translated_query = cached_translation(query, _translate_query_if_needed)
         
         # Enhance query for better semantic matching
         enhanced_query = _enhance_query_for_semantic_search(translated_query)
         
-        response = openai.embeddings.create(
-            model=model,
-            input=enhanced_query
-        )
-        
-        return np.array(response.data[0].embedding)
+        return embed_text(enhanced_query, model)
         
     except Exception as e:
         logger.error(f"Failed to get query embedding: {e}")
@@ -88,8 +90,11 @@ def semantic_search(query: str, filters: SearchFilters, k: int = 20) -> List[Pap
     start_time = time.time()
     
     try:
-        # Ensure embedding store is populated
-        ensure_embedding_store_populated()
+        # Never block the request on seeding the store; warm it in the background instead
+        if not is_embedding_store_ready():
+            start_background_warmup()
+            logger.info("Embedding store is still warming up, falling back to traditional search")
+            return _fallback_to_traditional_search(query, filters, k)
         
         # Get embedding store
         embedding_store = get_embedding_store()
@@ -118,6 +123,7 @@ def semantic_search(query: str, filters: SearchFilters, k: int = 20) -> List[Pap
                 doi=record.doi,
                 year=record.year,
                 venue=record.venue,
+                score_components=ScoreComponents(semantic=score),
                 reasons=[f"Semantic similarity: {score:.3f}"]
             )
             papers.append(paper)
@@ -176,36 +182,53 @@ def _apply_semantic_filters(papers: List[Paper], filters: SearchFilters) -> List
     return filtered
 
 
-def _rank_semantic_results(papers: List[Paper], query: str) -> List[Paper]:
-    """Rank semantic search results using combined scoring"""
-    for paper in papers:
+def _score_array(papers: List[Paper], field: str) -> np.ndarray:
+    """Collect one ScoreComponents field across papers as a float array"""
+    return np.fromiter(
+        (getattr(p.score_components, field) if p.score_components else 0.0 for p in papers),
+        dtype=float,
+        count=len(papers),
+    )
+
+
+def _sort_by_scores(papers: List[Paper], scores: np.ndarray) -> List[Paper]:
+    """Write scores to score_components.final and return papers sorted by them (stable)"""
+    for paper, score in zip(papers, scores.tolist()):
         if not paper.score_components:
-            from ..models import ScoreComponents
             paper.score_components = ScoreComponents()
-        
-        # Extract semantic score from reasons
-        semantic_score = 0.0
-        for reason in paper.reasons:
-            if "Semantic similarity:" in reason:
-                try:
-                    semantic_score = float(reason.split(":")[1].strip())
-                    break
-                except (ValueError, IndexError):
-                    pass
-        
-        # Combine semantic and BM25 scores
-        bm25_score = paper.score_components.bm25 if paper.score_components else 0.0
-        combined_score = 0.7 * semantic_score + 0.3 * bm25_score
-        
-        paper.score_components.final = combined_score
+        paper.score_components.final = score
+    order = np.argsort(-scores, kind="stable")
+    return [papers[i] for i in order]
+
+
+def _rank_semantic_results(papers: List[Paper], query: str) -> List[Paper]:
+    """Rank semantic search results using combined scoring"""
+    if not papers:
+        return papers
     
-    # Sort by final score
-    return sorted(papers, key=lambda p: p.score_components.final if p.score_components else 0, reverse=True)
+    # Combine semantic and BM25 scores
+    combined = 0.7 * _score_array(papers, "semantic") + 0.3 * _score_array(papers, "bm25")
+    return _sort_by_scores(papers, combined)
+
 
+def hybrid_search(
+    title_query: str,
+    description_query: str,
+    filters: SearchFilters,
+    k: int = 20,
+    fusion: Optional[str] = None,
+    latency_budget: Optional[float] = None,
+) -> List[Paper]:
+    """Perform hybrid search, running the semantic and title legs concurrently.
 
-def hybrid_search(title_query: str, description_query: str, filters: SearchFilters, k: int = 20) -> List[Paper]:
-    """Perform hybrid search combining semantic and title-based search"""
+    Legs still running when `latency_budget` seconds have passed are abandoned
+    (as long as at least one leg has finished), so latency is roughly max(legs).
+    `fusion` is "linear" (score-normalized blend) or "rrf" (reciprocal rank fusion).
+    """
     start_time = time.time()
+    config = get_search_config()
+    fusion = fusion or config.hybrid_fusion
+    budget = latency_budget if latency_budget is not None else config.hybrid_latency_budget
     
     # Prioritize description if provided, otherwise use title
     if description_query.strip():
@@ -218,13 +241,6 @@ def hybrid_search(title_query: str, description_query: str, filters: SearchFilte
         # Fall back to title query
         semantic_query = title_query.strip()
     
-    # Get semantic results using enhanced query
-    try:
-        semantic_papers = semantic_search(semantic_query, filters, k=k)
-    except Exception as e:
-        logger.warning(f"Semantic search failed: {e}, falling back to title search only")
-        semantic_papers = []
-    
     # Get title-based results (using existing search)
     from ..agents.search_agent import run_search
     from ..models import Filters
@@ -239,8 +255,29 @@ def hybrid_search(title_query: str, description_query: str, filters: SearchFilte
         limit=k
     )
     
-    # Use title query for traditional search
-    title_papers = run_search(title_query, legacy_filters)
+    # Run both legs concurrently; the executor is not joined so a slow leg cannot hold us up
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hybrid")
+    legs = {
+        executor.submit(semantic_search, semantic_query, filters, k): "semantic",
+        executor.submit(run_search, title_query, legacy_filters): "title",
+    }
+    done, pending = wait(legs, timeout=budget)
+    if not done:
+        # Nothing finished within budget: take whichever leg returns first
+        done, pending = wait(legs, return_when=FIRST_COMPLETED)
+    for future in pending:
+        future.cancel()
+        logger.warning(f"Hybrid {legs[future]} leg exceeded {budget:.1f}s budget; using other leg only")
+    executor.shutdown(wait=False, cancel_futures=True)
+    
+    results: Dict[str, List[Paper]] = {"semantic": [], "title": []}
+    for future in done:
+        try:
+            results[legs[future]] = future.result()
+        except Exception as e:
+            logger.warning(f"Hybrid {legs[future]} leg failed: {e}")
+    semantic_papers = results["semantic"]
+    title_papers = results["title"]
     
     # Combine and deduplicate
     all_papers = semantic_papers + title_papers
@@ -249,7 +286,10 @@ def hybrid_search(title_query: str, description_query: str, filters: SearchFilte
     
     # Re-rank with hybrid scoring
     description_provided = bool(description_query.strip())
-    hybrid_papers = _rank_hybrid_results(deduped_papers, semantic_query, semantic_papers, title_papers, description_provided)
+    if fusion == "rrf":
+        hybrid_papers = _rank_hybrid_rrf(deduped_papers, semantic_papers, title_papers, description_provided)
+    else:
+        hybrid_papers = _rank_hybrid_results(deduped_papers, semantic_query, semantic_papers, title_papers, description_provided)
     
     # Limit results
     final_papers = hybrid_papers[:k]
@@ -258,44 +298,73 @@ def hybrid_search(title_query: str, description_query: str, filters: SearchFilte
     return final_papers
 
 
+def _hybrid_weights(description_provided: bool) -> Tuple[float, float]:
+    """(semantic, title) weights for hybrid fusion"""
+    # When description is provided, give more weight to semantic search;
+    # when only title is provided, balance between both
+    return (0.8, 0.2) if description_provided else (0.6, 0.4)
+
+
+def _normalized_leg_scores(papers: List[Paper], score_fn: Callable[[Paper], float]) -> Dict[str, float]:
+    """Min-max normalize one leg's scores to [LEG_SCORE_FLOOR, 1], falling back to rank position when unscored"""
+    if not papers:
+        return {}
+    raw = np.fromiter((score_fn(p) for p in papers), dtype=float, count=len(papers))
+    if not raw.any():
+        # Legacy title search returns ranked papers without score components
+        raw = 1.0 - np.arange(len(papers)) / len(papers)
+    low, high = raw.min(), raw.max()
+    if len(papers) == 1 or high == low:
+        # A lone hit (or a tie) has no spread to scale against, so its own score stands
+        scaled = np.clip(raw, LEG_SCORE_FLOOR, 1.0)
+    else:
+        scaled = LEG_SCORE_FLOOR + (1.0 - LEG_SCORE_FLOOR) * (raw - low) / (high - low)
+    return {p.id: float(score) for p, score in zip(papers, scaled)}
+
+
 def _rank_hybrid_results(papers: List[Paper], query: str, semantic_papers: List[Paper], title_papers: List[Paper], description_provided: bool = False) -> List[Paper]:
-    """Rank hybrid search results with weighted fusion"""
-    # Create lookup for semantic and title scores
-    semantic_scores = {p.id: _get_semantic_score(p) for p in semantic_papers}
-    title_scores = {p.id: _get_title_score(p) for p in title_papers}
+    """Rank hybrid search results with a score-normalized linear blend"""
+    if not papers:
+        return papers
     
-    for paper in papers:
+    # Create lookup for normalized semantic and title scores
+    semantic_scores = _normalized_leg_scores(semantic_papers, _get_semantic_score)
+    title_scores = _normalized_leg_scores(title_papers, _get_title_score)
+    semantic = np.fromiter((semantic_scores.get(p.id, 0.0) for p in papers), dtype=float, count=len(papers))
+    title = np.fromiter((title_scores.get(p.id, 0.0) for p in papers), dtype=float, count=len(papers))
+    
+    w_semantic, w_title = _hybrid_weights(description_provided)
+    hybrid = w_semantic * semantic + w_title * title
+    return _apply_hybrid_scores(papers, hybrid)
+
+
+def _rank_hybrid_rrf(papers: List[Paper], semantic_papers: List[Paper], title_papers: List[Paper], description_provided: bool = False, k: int = 60) -> List[Paper]:
+    """Rank hybrid search results with weighted reciprocal rank fusion over both legs"""
+    if not papers:
+        return papers
+    
+    w_semantic, w_title = _hybrid_weights(description_provided)
+    rrf: Dict[str, float] = defaultdict(float)
+    for weight, leg in ((w_semantic, semantic_papers), (w_title, title_papers)):
+        for rank, paper in enumerate(leg):
+            rrf[paper.id] += weight / (k + rank + 1)
+    
+    hybrid = np.fromiter((rrf.get(p.id, 0.0) for p in papers), dtype=float, count=len(papers))
+    return _apply_hybrid_scores(papers, hybrid)
+
+
+def _apply_hybrid_scores(papers: List[Paper], hybrid: np.ndarray) -> List[Paper]:
+    for paper, score in zip(papers, hybrid.tolist()):
         if not paper.score_components:
-            from ..models import ScoreComponents
             paper.score_components = ScoreComponents()
-        
-        # Get individual scores
-        semantic_score = semantic_scores.get(paper.id, 0.0)
-        title_score = title_scores.get(paper.id, 0.0)
-        
-        # Adjust weights based on whether description was provided
-        if description_provided:
-            # When description is provided, give more weight to semantic search
-            hybrid_score = 0.8 * semantic_score + 0.2 * title_score
-        else:
-            # When only title is provided, balance between both
-            hybrid_score = 0.6 * semantic_score + 0.4 * title_score
-        
-        paper.score_components.final = hybrid_score
+        paper.score_components.hybrid = score
     
-    # Sort by hybrid score
-    return sorted(papers, key=lambda p: p.score_components.final if p.score_components else 0, reverse=True)
+    return _sort_by_scores(papers, hybrid)
 
 
 def _get_semantic_score(paper: Paper) -> float:
-    """Extract semantic score from paper reasons"""
-    for reason in paper.reasons:
-        if "Semantic similarity:" in reason:
-            try:
-                return float(reason.split(":")[1].strip())
-            except (ValueError, IndexError):
-                pass
-    return 0.0
+    """Get the FAISS similarity recorded on the paper"""
+    return paper.score_components.semantic if paper.score_components else 0.0
 
 
 def _get_title_score(paper: Paper) -> float:
@@ -340,6 +409,9 @@ def populate_embedding_store(papers: List[Paper]) -> None:
         
         # Add to embedding store
         embedding_store = get_embedding_store()
+        if embedding_store is None:
+            logger.warning("Embedding store not available, skipping embedding population")
+            return
         embedding_store.add_papers(papers, all_embeddings)
         
         logger.info(f"Populated embedding store with {len(papers)} papers")
@@ -349,29 +421,9 @@ def populate_embedding_store(papers: List[Paper]) -> None:
 
 
 def ensure_embedding_store_populated() -> None:
-    """Ensure embedding store has papers by running a sample search if empty"""
+    """Synchronously seed the embedding store if it is empty (see warmup.start_background_warmup)"""
     try:
-        embedding_store = get_embedding_store()
-        if embedding_store is None:
-            logger.warning("Embedding store could not be initialized - FAISS may not be available")
-            return
-            
-        stats = embedding_store.get_stats()
-        
-        if stats["total_papers"] == 0:
-            logger.info("Embedding store is empty, populating with sample papers...")
-            
-            # Run a sample search to get papers
-            from ..agents.search_agent import run_search
-            from ..models import Filters
-            
-            sample_filters = Filters(limit=100)
-            sample_papers = run_search("machine learning", sample_filters)
-            
-            if sample_papers:
-                populate_embedding_store(sample_papers)
-            else:
-                logger.warning("Could not populate embedding store - no papers found in sample search")
+        warm_embedding_store(only_if_empty=True)
     except Exception as e:
         logger.warning(f"Could not ensure embedding store is populated: {e}")
 
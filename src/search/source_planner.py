@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import re
+import statistics
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from ..config_search import SearchConfig, get_search_config
+from ..models import SearchFilters
+from ..tools.circuit_breaker import get_breaker
+from ..tools.registry import SourceAdapter, get_adapter, source_names
+from ..utils.logging import get_logger
+from .query_builder import mesh_concepts
+from .source_stats import SourceRecord, get_source_stats
+
+logger = get_logger(__name__)
+
+# Result filters an adapter may honour itself, keyed by its capability flag
+PUSHDOWN_FILTERS = {"year_filter": "year", "venue_filter": "venue", "oa_filter": "oa"}
+
+# Topic words that place a query in a domain, alongside the MeSH concepts it mentions
+DOMAIN_TERMS = {
+    "cs": [
+        "machine learning", "deep learning", "neural network", "neural networks", "algorithm", "algorithms",
+        "software", "compiler", "database", "distributed systems", "computer vision", "natural language processing",
+        "nlp", "reinforcement learning", "graph neural", "transformer", "transformers", "language model",
+        "language models", "llm", "llms", "programming", "cryptography", "operating system", "robotics",
+    ],
+    "biomed": [
+        "clinical", "patient", "patients", "disease", "protein", "proteins", "gene", "genes", "genomic", "cell",
+        "cells", "medical", "biomedical", "hospital", "therapy", "drug", "vaccine", "epidemiology", "biology",
+    ],
+}
+# MeSH concepts that do not make a topic biomedical on their own
+NON_BIOMED_MESH = {"machine learning"}
+# Budget for sources kept but down-weighted by their statistics
+REDUCED_LIMIT_FACTOR = 0.5
+# A low-contribution source this many times slower than the median is skipped, not reduced
+SLOW_SOURCE_FACTOR = 2.0
+
+
+@dataclass
+class SourcePlan:
+    """How one source is queried: the filters it gets and what is left for post-filtering"""
+
+    name: str
+    filters: SearchFilters
+    pushed_down: List[str] = field(default_factory=list)
+    post_filter: List[str] = field(default_factory=list)
+    reduced: bool = False
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "limit": self.filters.limit,
+            "pushed_down": self.pushed_down,
+            "post_filter": self.post_filter,
+            "reduced": self.reduced,
+        }
+
+
+@dataclass(frozen=True)
+class TopicCluster:
+    """Coarse topic domain that source statistics are kept under"""
+
+    key: str
+    domains: FrozenSet[str]
+
+
+def topic_cluster(topic: str) -> TopicCluster:
+    """Classify a topic as cs, biomed, both, or general (no clear signal)"""
+    text = " " + " ".join(re.split(r"[^a-z0-9]+", topic.lower())) + " "
+    domains = {domain for domain, terms in DOMAIN_TERMS.items() if any(f" {term} " in text for term in terms)}
+    if any(concept not in NON_BIOMED_MESH for concept in mesh_concepts(topic)):
+        domains.add("biomed")
+    return TopicCluster("+".join(sorted(domains)) or "general", frozenset(domains))
+
+
+def _active_filters(filters: SearchFilters) -> List[str]:
+    active = []
+    if filters.start_year or filters.end_year:
+        active.append("year")
+    if filters.venues:
+        active.append("venue")
+    if filters.oa_only:
+        active.append("oa")
+    return active
+
+
+def _plan_source(adapter: SourceAdapter, filters: SearchFilters, active: List[str]) -> SourcePlan:
+    capabilities = adapter.capabilities
+    supported = {PUSHDOWN_FILTERS[flag] for flag in PUSHDOWN_FILTERS if getattr(capabilities, flag)}
+    pushed_down = [name for name in active if name in supported]
+    post_filter = [name for name in active if name not in supported]
+    # Results that will be thinned out after the fetch are worth a full page
+    limit = capabilities.max_page_size if post_filter else max(20, filters.limit)
+    source_filters = filters.model_copy(update={"limit": min(limit, capabilities.max_page_size)})
+    return SourcePlan(adapter.name, source_filters, pushed_down, post_filter)
+
+
+def _adapt(
+    adapter: SourceAdapter,
+    cluster: TopicCluster,
+    record: Optional[SourceRecord],
+    median_latency: float,
+    config: SearchConfig,
+) -> Tuple[Optional[str], str]:
+    """("skip" | "reduce" | None, reason) for one source in this topic cluster"""
+    if record is not None and record.runs >= config.source_min_runs:
+        if record.yield_avg < 1 or record.contribution_avg < config.source_skip_contribution:
+            return "skip", f"contributed {record.contribution_avg:.0%} of {cluster.key} results"
+        if record.contribution_avg < config.source_downbudget_contribution:
+            if median_latency and record.latency_avg > SLOW_SOURCE_FACTOR * median_latency:
+                return "skip", f"slow ({record.latency_avg:.1f}s) for {record.contribution_avg:.0%} of results"
+            return "reduce", f"contributed {record.contribution_avg:.0%} of {cluster.key} results"
+        return None, ""
+    # Not enough history yet: fall back to the topic's domain
+    domains = adapter.capabilities.domains
+    if cluster.domains and "general" not in domains and not domains & cluster.domains:
+        return "skip", f"outside {cluster.key} topics"
+    return None, ""
+
+
+def plan_sources(
+    filters: SearchFilters,
+    config: Optional[SearchConfig] = None,
+    skipped: Optional[Dict[str, str]] = None,
+    cluster: Optional[TopicCluster] = None,
+) -> List[SourcePlan]:
+    """Plan which enabled sources to query and with which filters pushed down.
+
+    `filters.enabled_sources`, if set, narrows the enabled sources further.
+    Sources that need a key which is not configured, or whose circuit breaker
+    is open, are left out (recorded in `skipped` with the reason). Filters a
+    source cannot apply itself are still applied by the orchestrator, and such
+    sources fetch a full page instead.
+
+    With a topic `cluster` and ADAPTIVE_SOURCES on, sources are also skipped or
+    given a reduced budget from their yield, latency and contribution history in
+    that cluster, or by domain until there is enough history. Every
+    SOURCE_EXPLORE_EVERY-th search in a cluster queries all sources, so
+    skipped ones can earn their place back.
+    """
+    config = config or get_search_config()
+    skipped = skipped if skipped is not None else {}
+    active = _active_filters(filters)
+    candidates = []
+    for name in source_names():
+        if not config.enable_sources.get(name, True):
+            continue
+        if filters.enabled_sources and name not in filters.enabled_sources:
+            continue
+        adapter = get_adapter(name)
+        if not adapter.available(config):
+            skipped[name] = "missing " + " or ".join(adapter.capabilities.requires_any)
+            continue
+        breaker = get_breaker(name)
+        if breaker.state == "open":
+            skipped[name] = f"circuit open, retry in {breaker.retry_in():.0f}s"
+            continue
+        candidates.append((adapter, _plan_source(adapter, filters, active)))
+
+    stats = get_source_stats(config.source_stats_path) if cluster and config.adaptive_sources else None
+    # An explicit source list is the caller's choice, not the planner's
+    if stats is None or filters.enabled_sources:
+        return [plan for _, plan in candidates]
+    if (stats.searches(cluster.key) + 1) % max(1, config.source_explore_every) == 0:
+        logger.info(f"Exploring all sources for {cluster.key} topics")
+        return [plan for _, plan in candidates]
+
+    records = stats.get(cluster.key)
+    latencies = [r.latency_avg for r in records.values() if r.runs >= config.source_min_runs]
+    median_latency = statistics.median(latencies) if latencies else 0.0
+    plans, adapted = [], {}
+    for adapter, plan in candidates:
+        action, reason = _adapt(adapter, cluster, records.get(adapter.name), median_latency, config)
+        if action == "skip":
+            adapted[adapter.name] = reason
+            continue
+        if action == "reduce":
+            plan.filters.limit = max(10, int(plan.filters.limit * REDUCED_LIMIT_FACTOR))
+            plan.reduced = True
+        plans.append(plan)
+    if not plans:
+        # Never plan an empty search; history that rules out everything is stale
+        return [plan for _, plan in candidates]
+    skipped.update(adapted)
+    if adapted:
+        logger.info(f"Skipping {', '.join(sorted(adapted))} for {cluster.key} topics")
+    return plans
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Weight of the newest observation in the moving averages
+EWMA_ALPHA = 0.3
+
+
+@dataclass(frozen=True)
+class SourceRecord:
+    """Moving averages for one source within one topic cluster"""
+
+    runs: int
+    yield_avg: float  # papers returned per search
+    latency_avg: float  # seconds per search (slowest query round)
+    contribution_avg: float  # share of the final ranked results it returned
+
+
+class SourceStats:
+    """SQLite store of per-(topic cluster, source) search outcomes"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS source_stats ("
+            " cluster TEXT, source TEXT, runs INTEGER, yield_avg REAL, latency_avg REAL,"
+            " contribution_avg REAL, updated_at REAL, PRIMARY KEY (cluster, source))"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS clusters (cluster TEXT PRIMARY KEY, searches INTEGER)")
+        self._conn.commit()
+
+    def get(self, cluster: str) -> Dict[str, SourceRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, runs, yield_avg, latency_avg, contribution_avg FROM source_stats WHERE cluster = ?",
+                (cluster,),
+            ).fetchall()
+        return {source: SourceRecord(*values) for source, *values in rows}
+
+    def searches(self, cluster: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT searches FROM clusters WHERE cluster = ?", (cluster,)).fetchone()
+        return row[0] if row else 0
+
+    def record(
+        self,
+        cluster: str,
+        yields: Dict[str, int],
+        latencies: Dict[str, float],
+        contributions: Dict[str, float],
+    ) -> None:
+        """Fold one search into the averages of every source that was queried"""
+        now = time.time()
+        with self._lock:
+            current = {
+                source: values
+                for source, *values in self._conn.execute(
+                    "SELECT source, runs, yield_avg, latency_avg, contribution_avg FROM source_stats WHERE cluster = ?",
+                    (cluster,),
+                )
+            }
+            rows = []
+            for source, count in yields.items():
+                observed = (float(count), latencies.get(source, 0.0), contributions.get(source, 0.0))
+                if source in current:
+                    runs, *averages = current[source]
+                    averages = [old + EWMA_ALPHA * (new - old) for old, new in zip(averages, observed)]
+                else:
+                    runs, averages = 0, list(observed)
+                rows.append((cluster, source, runs + 1, *averages, now))
+            self._conn.executemany("INSERT OR REPLACE INTO source_stats VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT INTO clusters VALUES (?, 1) ON CONFLICT(cluster) DO UPDATE SET searches = searches + 1",
+                (cluster,),
+            )
+            self._conn.commit()
+
+
+_stats: Optional[SourceStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_source_stats(path: str | Path) -> Optional[SourceStats]:
+    """Process-wide source statistics store (None if it cannot be opened)"""
+    global _stats
+    with _stats_lock:
+        if _stats is None or _stats.path != Path(path):
+            try:
+                _stats = SourceStats(path)
+            except Exception as e:  # pragma: no cover - filesystem
+                logger.warning(f"Source statistics unavailable: {e}")
+                return None
+        return _stats
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from ..models import Paper, Filters
+from ..config_search import get_search_config
+from ..utils.logging import get_logger
+from .embedding_store import get_embedding_store
+
+logger = get_logger(__name__)
+
+# Readiness flag checked by semantic_search on every request (O(1), no store access)
+_ready = threading.Event()
+_thread_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+_last_attempt: float = 0.0
+
+# Minimum delay before retrying a warm-up that left the store empty
+WARMUP_RETRY_SECONDS = 300
+
+
+def is_embedding_store_ready() -> bool:
+    """Return True once the embedding store holds searchable papers"""
+    return _ready.is_set()
+
+
+def load_corpus_file(path: str | Path) -> List[Paper]:
+    """Load papers from an offline corpus file (JSON array or JSONL of Paper dicts)"""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8").strip()
+    if not text:
+        return []
+
+    if text.startswith("["):
+        items = json.loads(text)
+    else:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    papers = []
+    for item in items:
+        try:
+            papers.append(Paper(**item))
+        except Exception as e:
+            logger.warning(f"Skipping invalid corpus record in {path}: {e}")
+    return papers
+
+
+def warm_embedding_store(
+    topics: Optional[Sequence[str]] = None,
+    corpus_path: Optional[str | Path] = None,
+    limit_per_topic: int = 100,
+    only_if_empty: bool = True,
+) -> int:
+    """Seed the embedding store from a corpus file and/or seed topics; returns store size"""
+    store = get_embedding_store()
+    if store is None:
+        logger.warning("Embedding store could not be initialized - FAISS may not be available")
+        return 0
+
+    total = store.get_stats()["total_papers"]
+    if total > 0 and only_if_empty:
+        _ready.set()
+        logger.info(f"Embedding store ready with {total} papers")
+        return total
+
+    config = get_search_config()
+    if topics is None:
+        topics = config.warmup_topics
+    if corpus_path is None:
+        corpus_path = config.warmup_corpus_path
+
+    papers: List[Paper] = []
+    if corpus_path:
+        try:
+            papers.extend(load_corpus_file(corpus_path))
+            logger.info(f"Loaded {len(papers)} papers from corpus {corpus_path}")
+        except Exception as e:
+            logger.warning(f"Could not load warm-up corpus {corpus_path}: {e}")
+
+    if topics:
+        from ..agents.search_agent import run_search
+
+        for topic in topics:
+            try:
+                papers.extend(run_search(topic, Filters(limit=limit_per_topic)))
+            except Exception as e:
+                logger.warning(f"Warm-up search for '{topic}' failed: {e}")
+
+    if papers:
+        from .semantic_search import populate_embedding_store
+        populate_embedding_store(papers)
+    else:
+        logger.warning("Could not populate embedding store - no warm-up papers found")
+
+    total = store.get_stats()["total_papers"]
+    if total > 0:
+        _ready.set()
+    return total
+
+
+def start_background_warmup() -> threading.Thread:
+    """Start the warm-up in a daemon thread (idempotent while running or recently attempted)"""
+    global _warmup_thread, _last_attempt
+    with _thread_lock:
+        if _warmup_thread is not None:
+            recently_tried = time.monotonic() - _last_attempt < WARMUP_RETRY_SECONDS
+            if _warmup_thread.is_alive() or _ready.is_set() or recently_tried:
+                return _warmup_thread
+
+        def _run() -> None:
+            try:
+                total = warm_embedding_store()
+                logger.info(f"Background embedding warm-up finished ({total} papers)")
+            except Exception as e:
+                logger.warning(f"Background embedding warm-up failed: {e}")
+
+        _last_attempt = time.monotonic()
+        _warmup_thread = threading.Thread(target=_run, name="embedding-warmup", daemon=True)
+        _warmup_thread.start()
+        return _warmup_thread
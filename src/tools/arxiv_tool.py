@@ -1,16 +1,78 @@
 from __future__ import annotations
 
-import httpx
 from typing import List
 from xml.etree import ElementTree as ET
 
 from ..models import Paper, Filters
 from ..utils.logging import get_logger
+from .http_client import SourceClient
 
 logger = get_logger(__name__)
 
 
 ARXIV_API = "https://export.arxiv.org/api/query"
+ARXIV_ID_BATCH = 100
+
+
+def _parse_feed(text: str) -> List[Paper]:
+    """Papers from an arXiv API Atom feed"""
+    papers: List[Paper] = []
+    root = ET.fromstring(text)
+    ns = {"a": "http://www.w3.org/2005/Atom"}
+    for entry in root.findall("a:entry", ns):
+        title = (entry.findtext("a:title", default="", namespaces=ns) or "").strip()
+        abstract = (entry.findtext("a:summary", default="", namespaces=ns) or "").strip()
+        authors = [
+            (a.findtext("a:name", default="", namespaces=ns) or "").strip()
+            for a in entry.findall("a:author", ns)
+        ]
+        link_pdf = None
+        link_url = None
+        for l in entry.findall("a:link", ns):
+            href = l.attrib.get("href")
+            if l.attrib.get("title") == "pdf" or l.attrib.get("type") == "application/pdf":
+                link_pdf = href
+            elif l.attrib.get("rel") == "alternate":
+                link_url = href
+        arxiv_id = (entry.findtext("a:id", default="", namespaces=ns) or "").strip()
+        year = None
+        published = entry.findtext("a:published", default="", namespaces=ns)
+        if published:
+            try:
+                year = int(published[:4])
+            except Exception:
+                year = None
+        papers.append(
+            Paper(
+                id=arxiv_id or title,
+                source="arxiv",
+                title=title,
+                abstract=abstract,
+                authors=[a for a in authors if a],
+                year=year,
+                venue="arXiv",
+                doi=None,
+                url=link_url,
+                pdf_url=link_pdf,
+                citations_count=None,
+                keywords=[],
+            )
+        )
+    return papers
+
+
+def fetch_arxiv_papers(arxiv_ids: List[str]) -> List[Paper]:
+    """Papers for arXiv IDs (e.g. "2101.00001", "cs/0112017"), via id_list in batches"""
+    papers: List[Paper] = []
+    for start in range(0, len(arxiv_ids), ARXIV_ID_BATCH):
+        chunk = arxiv_ids[start:start + ARXIV_ID_BATCH]
+        params = {"id_list": ",".join(chunk), "max_results": len(chunk)}
+        try:
+            with SourceClient("arxiv") as client:
+                papers.extend(_parse_feed(client.get(ARXIV_API, params=params).text))
+        except Exception as e:  # pragma: no cover - network
+            logger.warning("arXiv lookup failed: %s", e)
+    return papers
 
 
 def search_arxiv(query: str, filters: Filters) -> List[Paper]:
@@ -23,50 +85,10 @@ def search_arxiv(query: str, filters: Filters) -> List[Paper]:
     }
     papers: List[Paper] = []
     try:
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("arxiv") as client:
             resp = client.get(ARXIV_API, params=params)
             resp.raise_for_status()
-            root = ET.fromstring(resp.text)
-            ns = {"a": "http://www.w3.org/2005/Atom"}
-            for entry in root.findall("a:entry", ns):
-                title = (entry.findtext("a:title", default="", namespaces=ns) or "").strip()
-                abstract = (entry.findtext("a:summary", default="", namespaces=ns) or "").strip()
-                authors = [
-                    (a.findtext("a:name", default="", namespaces=ns) or "").strip()
-                    for a in entry.findall("a:author", ns)
-                ]
-                link_pdf = None
-                link_url = None
-                for l in entry.findall("a:link", ns):
-                    href = l.attrib.get("href")
-                    if l.attrib.get("title") == "pdf" or l.attrib.get("type") == "application/pdf":
-                        link_pdf = href
-                    elif l.attrib.get("rel") == "alternate":
-                        link_url = href
-                arxiv_id = (entry.findtext("a:id", default="", namespaces=ns) or "").strip()
-                year = None
-                published = entry.findtext("a:published", default="", namespaces=ns)
-                if published:
-                    try:
-                        year = int(published[:4])
-                    except Exception:
-                        year = None
-                papers.append(
-                    Paper(
-                        id=arxiv_id or title,
-                        source="arxiv",
-                        title=title,
-                        abstract=abstract,
-                        authors=[a for a in authors if a],
-                        year=year,
-                        venue="arXiv",
-                        doi=None,
-                        url=link_url,
-                        pdf_url=link_pdf,
-                        citations_count=None,
-                        keywords=[],
-                    )
-                )
+            papers = _parse_feed(resp.text)
     except Exception as e:  # pragma: no cover - network
         logger.warning("arXiv search failed: %s", e)
     return papers
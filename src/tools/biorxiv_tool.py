@@ -2,11 +2,11 @@
 BioRxiv search tool for preprints
 """
 
-import requests
 import time
 from typing import List, Dict, Any
 from ..models import Paper, SearchFilters
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
@@ -30,7 +30,7 @@ def search_biorxiv(query: str, filters: SearchFilters) -> List[Paper]:
         if filters.end_year:
             params["toDate"] = f"{filters.end_year}-12-31"
         
-        response = requests.get(url, params=params, timeout=30)
+        response = source_get("biorxiv", url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional
+
+from ..config_search import get_search_config
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# Successful-call latencies kept per source for percentiles
+LATENCY_SAMPLES = 200
+
+
+class CircuitOpenError(RuntimeError):
+    """The source's circuit is open, so the request was not sent"""
+
+    def __init__(self, source: str, retry_in: float):
+        super().__init__(f"{source} circuit open (retry in {retry_in:.0f}s)")
+        self.source = source
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Per-source breaker over a sliding window of calls.
+
+    Closed: calls go through; once `min_calls` are in the window and the share
+    that failed or took longer than `slow_call` seconds reaches `failure_rate`,
+    it opens. Open: calls are refused for `open_seconds`. Half-open: a single
+    trial call decides between closed and open again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        slow_call: float = 10.0,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call = slow_call
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = failed or slow
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.times_opened = 0
+
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.open_seconds - self._clock())
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            if self._state == "open" and self._retry_in() == 0:
+                return "half_open"
+            return self._state
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return self._retry_in() if self._state == "open" else 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may be sent now (claims the trial slot when half-open)"""
+        with self._lock:
+            if self._state == "open":
+                if self._retry_in() > 0:
+                    return False
+                self._state = "half_open"
+                self._trial_in_flight = False
+            if self._state == "half_open":
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = self._clock()
+        self._trial_in_flight = False
+        self.times_opened += 1
+        logger.warning(f"Circuit for {self.name} opened for {self.open_seconds:.0f}s")
+
+    def record(self, ok: bool, latency: float) -> None:
+        failed = not ok or latency > self.slow_call
+        with self._lock:
+            if ok:
+                self._latencies.append(latency)
+            if self._state == "half_open":
+                if failed:
+                    self._open()
+                else:
+                    self._state = "closed"
+                    self._trial_in_flight = False
+                    self._outcomes.clear()
+                    logger.info(f"Circuit for {self.name} closed")
+                return
+            self._outcomes.append(failed)
+            if (
+                self._state == "closed"
+                and len(self._outcomes) >= self.min_calls
+                and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+
+    def latency_percentile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """Latency (seconds) below which a share `q` of recent successful calls finished"""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = len(self._outcomes)
+            failures = sum(self._outcomes)
+            retry_in = self._retry_in() if self._state == "open" else 0.0
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failure_rate": (failures / calls) if calls else 0.0,
+            "retry_in": retry_in,
+            "times_opened": self.times_opened,
+            "p50_latency": self.latency_percentile(0.5),
+            "p90_latency": self.latency_percentile(0.9),
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source: str) -> CircuitBreaker:
+    """Process-wide breaker for a source, shared by every request that queries it"""
+    breaker = _breakers.get(source)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(source)
+            if breaker is None:
+                config = get_search_config()
+                breaker = CircuitBreaker(
+                    source,
+                    failure_rate=config.breaker_failure_rate,
+                    min_calls=config.breaker_min_calls,
+                    window=config.breaker_window,
+                    slow_call=config.breaker_slow_call,
+                    open_seconds=config.breaker_open_seconds,
+                )
+                _breakers[source] = breaker
+    return breaker
+
+
+def breaker_states(sources: List[str]) -> Dict[str, Dict[str, Any]]:
+    return {source: get_breaker(source).snapshot() for source in sources}
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import httpx
 
 from ..models import Paper, Filters
+from ..config_search import get_search_config
+from ..utils.cache import PersistentCache
 from ..utils.logging import get_logger
+from .http_client import SourceClient
 
 logger = get_logger(__name__)
 
@@ -12,35 +18,162 @@ logger = get_logger(__name__)
 CROSSREF = "https://api.crossref.org/works"
 
 
+ENRICH_SELECT = "DOI,title,author,issued,container-title,URL"
+DOI_BATCH_SIZE = 20
+
+_doi_cache: Optional[PersistentCache] = None
+_doi_cache_lock = threading.Lock()
+
+
+def _get_doi_cache() -> Optional[PersistentCache]:
+    """Persistent DOI -> Crossref metadata cache (None if it cannot be opened)"""
+    global _doi_cache
+    if _doi_cache is None:
+        with _doi_cache_lock:
+            if _doi_cache is None:
+                config = get_search_config()
+                try:
+                    _doi_cache = PersistentCache(config.crossref_cache_path, ttl=config.crossref_cache_ttl)
+                except Exception as e:  # pragma: no cover - filesystem
+                    logger.warning("Crossref DOI cache unavailable: %s", e)
+    return _doi_cache
+
+
+def _doi_key(doi: str) -> str:
+    return doi.lower().strip()
+
+
+def _needs_enrichment(paper: Paper) -> bool:
+    """Only papers with a DOI and at least one field Crossref would fill"""
+    return bool(paper.doi) and not (paper.year and paper.venue and paper.authors and paper.url)
+
+
+def _apply_crossref_item(paper: Paper, item: Dict[str, Any]) -> Paper:
+    title = (item.get("title") or [paper.title])[0]
+    year = None
+    if item.get("issued", {}).get("date-parts"):
+        year = item["issued"]["date-parts"][0][0]
+    venue = (item.get("container-title") or [paper.venue or None])[0]
+    authors = [
+        " ".join([a.get("given", ""), a.get("family", "")]).strip()
+        for a in item.get("author", [])
+    ] or paper.authors
+    url = item.get("URL", paper.url)
+    return paper.model_copy(update={
+        "title": title,
+        "year": year or paper.year,
+        "venue": venue or paper.venue,
+        "authors": authors,
+        "url": url,
+    })
+
+
+def _fetch_doi_batch(client: httpx.Client, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch metadata for several DOIs in one filter query"""
+    params = {
+        "filter": ",".join(f"doi:{doi}" for doi in dois),
+        "select": ENRICH_SELECT,
+        "rows": len(dois),
+    }
+    r = client.get(CROSSREF, params=params)
+    r.raise_for_status()
+    items = r.json().get("message", {}).get("items", [])
+    return {_doi_key(it["DOI"]): it for it in items if it.get("DOI")}
+
+
+def fetch_crossref_metadata(dois: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Resolve DOIs to Crossref work metadata via the cache, then concurrent batch queries"""
+    keys = list(dict.fromkeys(_doi_key(d) for d in dois if d))
+    if not keys:
+        return {}
+
+    cache = _get_doi_cache()
+    cached = cache.get_many(keys) if cache else {}
+    missing = [k for k in keys if k not in cached]
+
+    fetched: Dict[str, Dict[str, Any]] = {}
+    answered: List[str] = []
+    if missing:
+        config = get_search_config()
+        batches = [missing[i:i + DOI_BATCH_SIZE] for i in range(0, len(missing), DOI_BATCH_SIZE)]
+        workers = max(1, min(config.crossref_concurrency, len(batches)))
+        with httpx.Client(timeout=30) as client, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_fetch_doi_batch, client, batch): batch for batch in batches}
+            for future, batch in futures.items():
+                try:
+                    fetched.update(future.result())
+                    answered.extend(batch)
+                except Exception as e:  # pragma: no cover - network
+                    logger.warning("Crossref DOI batch lookup failed: %s", e)
+        if cache:
+            # Remember misses too (as empty dicts) so unknown DOIs are not re-queried until expiry
+            cache.set_many({k: fetched.get(k, {}) for k in answered})
+
+    results = {k: v for k, v in cached.items() if v}
+    results.update(fetched)
+    return results
+
+
+def enrich_papers_with_crossref(papers: List[Paper]) -> List[Paper]:
+    """Bulk-enrich papers missing year/venue/authors/url from Crossref (order preserved)"""
+    targets = [p.doi for p in papers if _needs_enrichment(p)]
+    if not targets:
+        return list(papers)
+    try:
+        metadata = fetch_crossref_metadata(targets)
+    except Exception as e:  # pragma: no cover - network
+        logger.warning("Crossref bulk enrich failed: %s", e)
+        return list(papers)
+    logger.info("Crossref enriched %d of %d papers", sum(1 for d in targets if _doi_key(d) in metadata), len(papers))
+    return [
+        _apply_crossref_item(p, metadata[_doi_key(p.doi)])
+        if _needs_enrichment(p) and _doi_key(p.doi) in metadata else p
+        for p in papers
+    ]
+
+
 def enrich_with_crossref(paper: Paper) -> Paper:
     if paper.doi:
         try:
-            with httpx.Client(timeout=30) as client:
-                r = client.get(f"{CROSSREF}/{paper.doi}")
-                if r.status_code == 200:
-                    item = r.json().get("message", {})
-                    title = item.get("title", [paper.title])[0]
-                    year = None
-                    if item.get("issued", {}).get("date-parts"):
-                        year = item["issued"]["date-parts"][0][0]
-                    venue = (item.get("container-title") or [paper.venue or None])[0]
-                    authors = [
-                        " ".join([a.get("given", ""), a.get("family", "")]).strip()
-                        for a in item.get("author", [])
-                    ] or paper.authors
-                    url = item.get("URL", paper.url)
-                    return paper.model_copy(update={
-                        "title": title,
-                        "year": year or paper.year,
-                        "venue": venue or paper.venue,
-                        "authors": authors,
-                        "url": url,
-                    })
+            item = fetch_crossref_metadata([paper.doi]).get(_doi_key(paper.doi))
+            if item:
+                return _apply_crossref_item(paper, item)
         except Exception as e:  # pragma: no cover - network
             logger.warning("Crossref enrich DOI failed: %s", e)
     return paper
 
 
+def parse_crossref_item(it: Dict[str, Any]) -> Paper:
+    """Paper from a Crossref work item (API result or public data file record)"""
+    title = (it.get("title") or [""])[0]
+    year = None
+    if it.get("issued", {}).get("date-parts"):
+        year = it["issued"]["date-parts"][0][0]
+    venue = (it.get("container-title") or [None])[0]
+    authors = [
+        " ".join([a.get("given", ""), a.get("family", "")]).strip()
+        for a in it.get("author", [])
+    ]
+    doi = it.get("DOI")
+    url = it.get("URL")
+    # Abstracts, where deposited, are JATS XML
+    abstract = re.sub(r"<[^>]+>", " ", it["abstract"]).strip() if it.get("abstract") else None
+    return Paper(
+        id=doi or title,
+        source="crossref",
+        title=title,
+        abstract=re.sub(r"\s+", " ", abstract) if abstract else None,
+        authors=authors,
+        year=year,
+        venue=venue,
+        doi=doi,
+        url=url,
+        pdf_url=None,
+        citations_count=it.get("is-referenced-by-count"),
+        keywords=[],
+    )
+
+
 def search_crossref(query: str, filters: Filters) -> List[Paper]:
     params = {
         "query": query,
@@ -51,38 +184,12 @@ def search_crossref(query: str, filters: Filters) -> List[Paper]:
     }
     results: List[Paper] = []
     try:
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("crossref") as client:
             r = client.get(CROSSREF, params=params)
             r.raise_for_status()
             items = r.json().get("message", {}).get("items", [])
             for it in items:
-                title = (it.get("title") or [""])[0]
-                year = None
-                if it.get("issued", {}).get("date-parts"):
-                    year = it["issued"]["date-parts"][0][0]
-                venue = (it.get("container-title") or [None])[0]
-                authors = [
-                    " ".join([a.get("given", ""), a.get("family", "")]).strip()
-                    for a in it.get("author", [])
-                ]
-                doi = it.get("DOI")
-                url = it.get("URL")
-                results.append(
-                    Paper(
-                        id=doi or title,
-                        source="crossref",
-                        title=title,
-                        abstract=None,
-                        authors=authors,
-                        year=year,
-                        venue=venue,
-                        doi=doi,
-                        url=url,
-                        pdf_url=None,
-                        citations_count=None,
-                        keywords=[],
-                    )
-                )
+                results.append(parse_crossref_item(it))
     except Exception as e:  # pragma: no cover - network
         logger.warning("Crossref search failed: %s", e)
     return results
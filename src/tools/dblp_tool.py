@@ -2,11 +2,11 @@
 DBLP search tool for computer science literature
 """
 
-import requests
 import time
 from typing import List, Dict, Any
 from ..models import Paper, SearchFilters
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
@@ -22,7 +22,7 @@ def search_dblp(query: str, filters: SearchFilters) -> List[Paper]:
             "h": min(filters.limit, 50)  # DBLP uses 'h' for hit count
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = source_get("dblp", url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import time
 from typing import List, Dict, Any
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..models import Paper, SearchFilters
 from ..config_search import get_search_config
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
@@ -35,13 +34,9 @@ def _build_europe_pmc_query(query: str, filters: SearchFilters) -> str:
     return epmc_query
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def _make_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Make HTTP request with retry logic"""
-    with httpx.Client(timeout=30) as client:
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    """GET JSON through the shared HTTP layer (circuit breaker + retries)"""
+    return source_get("europe_pmc", url, params=params).json()
 
 
 def search_europe_pmc(query: str, filters: SearchFilters) -> List[Paper]:
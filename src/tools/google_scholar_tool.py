@@ -2,13 +2,13 @@
 Google Scholar search tool using web scraping
 """
 
-import requests
 from bs4 import BeautifulSoup
 import time
 import re
 from typing import List, Dict, Any
 from ..models import Paper, SearchFilters
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
@@ -37,7 +37,7 @@ def search_google_scholar(query: str, filters: SearchFilters) -> List[Paper]:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = source_get("google_scholar", url, params=params, headers=headers)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -101,7 +101,7 @@ def search_google_scholar(query: str, filters: SearchFilters) -> List[Paper]:
                 
                 paper = Paper(
                     id=url or title,
-                    source="scholar",
+                    source="google_scholar",
                     title=title,
                     abstract=abstract,
                     authors=authors,
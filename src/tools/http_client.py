@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from ..config_search import SearchConfig, get_search_config
+from ..utils.logging import get_logger
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker
+
+logger = get_logger(__name__)
+
+# Longest pause between retries; a provider that needs more is treated as down
+MAX_RETRY_WAIT = 4.0
+# Successful calls a source needs before its p90 is trusted as a hedging deadline
+HEDGE_MIN_SAMPLES = 20
+# Never hedge sooner than this, however fast the source usually is
+HEDGE_MIN_DELAY = 0.05
+# Unused hedges a source may save up
+HEDGE_BURST = 5.0
+HEDGE_WORKERS = 32
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _shared_client() -> httpx.Client:
+    # One pooled client for every adapter, so connections are reused across searches
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=30, follow_redirects=True)
+    return _client
+
+
+def _retryable(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+class HedgeBudget:
+    """Per-source allowance of duplicate requests.
+
+    Every request earns `ratio` of a hedge (up to `burst` saved), and a hedge
+    spends a whole one, so at most `ratio` of a source's requests are hedged.
+    """
+
+    def __init__(self, ratio: float, burst: float = HEDGE_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0  # hedges that answered before the original request
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def won(self) -> None:
+        with self._lock:
+            self.wins += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "wins": self.wins,
+                "win_rate": (self.wins / self.hedged) if self.hedged else 0.0,
+            }
+
+
+_budgets: Dict[str, HedgeBudget] = {}
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _budget(source: str, ratio: float) -> HedgeBudget:
+    with _client_lock:
+        budget = _budgets.get(source)
+        if budget is None or budget.ratio != ratio:
+            budget = _budgets[source] = HedgeBudget(ratio)
+        return budget
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _client_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+        return _hedge_pool
+
+
+def hedge_stats() -> Dict[str, Dict[str, Any]]:
+    """Requests, hedges sent and hedges won per hedged source"""
+    with _client_lock:
+        budgets = dict(_budgets)
+    return {source: budget.snapshot() for source, budget in budgets.items()}
+
+
+Outcome = Tuple[Optional[httpx.Response], Optional[Exception], float]
+
+
+def _attempt(method: str, url: str, started: Optional[threading.Event] = None, **kwargs: Any) -> Outcome:
+    """One request, never raising: (response, error, seconds it took)"""
+    if started is not None:
+        started.set()
+    start = time.monotonic()
+    try:
+        return _shared_client().request(method, url, **kwargs), None, time.monotonic() - start
+    except Exception as e:
+        return None, e, time.monotonic() - start
+
+
+def _settle(breaker: CircuitBreaker, outcome: Outcome) -> httpx.Response:
+    # Any error settles the call; an unrecorded half-open trial would block the source for good
+    response, error, latency = outcome
+    breaker.record(error is None and not _retryable(response), latency)
+    if error is not None:
+        raise error
+    return response
+
+
+def _send(breaker: CircuitBreaker, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    return _settle(breaker, _attempt(method, url, **kwargs))
+
+
+def _hedged_send(
+    source: str, breaker: CircuitBreaker, config: SearchConfig, method: str, url: str, **kwargs: Any
+) -> httpx.Response:
+    """_send, duplicated once if the first request outlives the source's p90 latency.
+
+    Only the answer that is used is recorded against the breaker; the twin
+    that lost (or never started) says nothing about the source.
+    """
+    if method != "GET" or source not in config.hedge_sources or config.hedge_budget <= 0:
+        return _send(breaker, method, url, **kwargs)
+    budget = _budget(source, config.hedge_budget)
+    budget.deposit()
+    p90 = breaker.latency_percentile(0.9, min_samples=HEDGE_MIN_SAMPLES)
+    if p90 is None or breaker.state != "closed":
+        return _send(breaker, method, url, **kwargs)
+
+    started = threading.Event()
+    primary = _pool().submit(_attempt, method, url, started=started, **kwargs)
+    # The deadline runs from when the request went out, not from when it was queued
+    started.wait()
+    try:
+        outcome = primary.result(timeout=max(HEDGE_MIN_DELAY, p90))
+    except FutureTimeout:
+        outcome = None
+    if outcome is not None:
+        return _settle(breaker, outcome)
+    if not budget.withdraw():
+        return _settle(breaker, primary.result())
+    hedge = _pool().submit(_attempt, method, url, **kwargs)
+    pending = {primary, hedge}
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        answered = [f for f in (primary, hedge) if f in done and f.result()[1] is None]
+        # A request that failed outright leaves the answer to the other one
+        if answered or not pending:
+            future = answered[0] if answered else done.pop()
+            for twin in pending:
+                twin.cancel()
+            if answered and future is hedge:
+                budget.won()
+                logger.debug(f"Hedged {source} request answered first")
+            return _settle(breaker, future.result())
+
+
+def source_request(
+    source: str,
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    json: Any = None,
+    timeout: float = 30.0,
+) -> httpx.Response:
+    """Send a request through the source's circuit breaker with bounded retries.
+
+    Transport errors, 429 and 5xx responses count against the breaker and are
+    retried (RETRY_ATTEMPTS, RETRY_DELAY doubling up to MAX_RETRY_WAIT) while
+    the circuit stays closed; other 4xx responses raise immediately. Raises
+    CircuitOpenError without sending anything when the circuit is open.
+
+    GETs to HEDGE_SOURCES are hedged: once a request has taken longer than
+    the source's p90 latency, a duplicate is sent (within HEDGE_BUDGET) and
+    whichever answers first is used.
+    """
+    config = get_search_config()
+    breaker = get_breaker(source)
+    attempts = max(1, config.retry_attempts)
+    error: Exception = CircuitOpenError(source, breaker.retry_in())
+    for attempt in range(attempts):
+        if not breaker.allow():
+            raise CircuitOpenError(source, breaker.retry_in())
+        try:
+            response = _hedged_send(
+                source, breaker, config, method, url, params=params, headers=headers, json=json, timeout=timeout
+            )
+        except httpx.TransportError as e:
+            error = e
+        else:
+            if not _retryable(response):
+                response.raise_for_status()
+                return response
+            error = httpx.HTTPStatusError(
+                f"{source} returned {response.status_code}", request=response.request, response=response
+            )
+        if attempt + 1 < attempts:
+            time.sleep(min(MAX_RETRY_WAIT, config.retry_delay * 2 ** attempt))
+    raise error
+
+
+def source_get(
+    source: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30.0,
+) -> httpx.Response:
+    return source_request(source, "GET", url, params=params, headers=headers, timeout=timeout)
+
+
+class SourceClient:
+    """Drop-in for `with httpx.Client() as client: client.get(...)` that goes through source_request"""
+
+    def __init__(self, source: str, timeout: float = 30.0):
+        self.source = source
+        self.timeout = timeout
+
+    def __enter__(self) -> "SourceClient":
+        return self
+
+    def __exit__(self, *exc: Tuple[Any, ...]) -> None:
+        return None
+
+    def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        return source_request(self.source, "GET", url, params=params, headers=headers, timeout=self.timeout)
+
+    def post(self, url: str, json: Any = None, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        return source_request(self.source, "POST", url, headers=headers, json=json, timeout=self.timeout)
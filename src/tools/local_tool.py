@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import List
+
+from ..models import Paper, SearchFilters
+from ..config_search import get_search_config
+from ..search.local_corpus import get_local_corpus
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def search_local(query: str, filters: SearchFilters) -> List[Paper]:
+    """Search the offline corpus (LOCAL_CORPUS_PATH); empty if nothing has been ingested"""
+    corpus = get_local_corpus(get_search_config().local_corpus_path)
+    if corpus is None:
+        return []
+    try:
+        papers = corpus.search(query, filters)
+    except Exception as e:
+        logger.warning(f"Local corpus search failed: {e}")
+        return []
+    logger.info(f"Local corpus returned {len(papers)} papers")
+    return papers
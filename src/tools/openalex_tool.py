@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import time
 from typing import List, Dict, Any
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..models import Paper, SearchFilters
 from ..config_search import get_search_config
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
 OPENALEX_API = "https://api.openalex.org/works"
+# Values OR'ed into one filter (the API allows up to 100)
+OPENALEX_FILTER_BATCH = 50
 
 
 def _reconstruct_abstract(abstract_inverted_index: Dict[str, List[int]]) -> str:
@@ -30,19 +31,69 @@ def _reconstruct_abstract(abstract_inverted_index: Dict[str, List[int]]) -> str:
     return " ".join([word for _, word in word_positions])
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def _make_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Make HTTP request with retry logic"""
+    """GET JSON through the shared HTTP layer (circuit breaker + retries)"""
     config = get_search_config()
     
     headers = {
         "User-Agent": f"LiteratureReviewAgent/1.0 (mailto:{config.openalex_email})"
     } if config.openalex_email else {"User-Agent": "LiteratureReviewAgent/1.0"}
     
-    with httpx.Client(timeout=30) as client:
-        response = client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    return source_get("openalex", url, params=params, headers=headers).json()
+
+
+def parse_openalex_work(item: Dict[str, Any]) -> Paper:
+    """Paper from an OpenAlex work record (API result or snapshot line)"""
+    # Extract authors
+    authors = []
+    for author in item.get("authorships", []):
+        author_name = (author.get("author") or {}).get("display_name", "")
+        if author_name:
+            authors.append(author_name)
+    
+    # Get venue information
+    venue = ""
+    if (item.get("primary_location") or {}).get("source"):
+        venue = item["primary_location"]["source"].get("display_name", "")
+    
+    # Get PDF URL if available (do not require OA unless requested)
+    pdf_url = None
+    for location in item.get("locations") or []:
+        if location.get("pdf_url"):
+            pdf_url = location["pdf_url"]
+            break
+    
+    # Reconstruct abstract
+    abstract = _reconstruct_abstract(item.get("abstract_inverted_index") or {})
+    
+    return Paper(
+        id=(item.get("id") or "").replace("https://openalex.org/", ""),
+        source="openalex",
+        title=item.get("title") or "",
+        abstract=abstract,
+        authors=authors,
+        year=item.get("publication_year"),
+        venue=venue,
+        doi=item.get("doi"),
+        url=item.get("id"),
+        pdf_url=pdf_url,
+        citations_count=item.get("cited_by_count", 0),
+        keywords=[],
+        reasons=[f"OpenAlex relevance score: {item.get('relevance_score') or 0:.3f}"],
+    )
+
+
+def fetch_openalex_works(filter_name: str, values: List[str]) -> List[Paper]:
+    """Works matching any of `values` for one filter ("ids.openalex" IDs or "doi" DOIs), batched"""
+    papers: List[Paper] = []
+    for start in range(0, len(values), OPENALEX_FILTER_BATCH):
+        chunk = values[start:start + OPENALEX_FILTER_BATCH]
+        params = {"filter": f"{filter_name}:{'|'.join(chunk)}", "per-page": len(chunk)}
+        try:
+            papers.extend(parse_openalex_work(item) for item in _make_request(OPENALEX_API, params).get("results", []))
+        except Exception as e:
+            logger.warning(f"OpenAlex lookup failed: {e}")
+    return papers
 
 
 def search_openalex(query: str, filters: SearchFilters) -> List[Paper]:
@@ -92,43 +143,7 @@ def search_openalex(query: str, filters: SearchFilters) -> List[Paper]:
             if not results:
                 break
             for item in results:
-                # Extract authors
-                authors = []
-                for author in item.get("authorships", []):
-                    author_name = author.get("author", {}).get("display_name", "")
-                    if author_name:
-                        authors.append(author_name)
-                
-                # Get venue information
-                venue = ""
-                if item.get("primary_location", {}).get("source"):
-                    venue = item["primary_location"]["source"].get("display_name", "")
-                
-                # Get PDF URL if available (do not require OA unless requested)
-                pdf_url = None
-                for location in item.get("locations", []):
-                    if location.get("pdf_url"):
-                        pdf_url = location["pdf_url"]
-                        break
-                
-                # Reconstruct abstract
-                abstract = _reconstruct_abstract(item.get("abstract_inverted_index", {}))
-                
-                paper = Paper(
-                    id=item.get("id", "").replace("https://openalex.org/", ""),
-                    source="openalex",
-                    title=item.get("title", ""),
-                    abstract=abstract,
-                    authors=authors,
-                    year=item.get("publication_year"),
-                    venue=venue,
-                    doi=item.get("doi"),
-                    url=item.get("id"),
-                    pdf_url=pdf_url,
-                    citations_count=item.get("cited_by_count", 0),
-                    keywords=[],
-                    reasons=[f"OpenAlex relevance score: {item.get('relevance_score', 0):.3f}"]
-                )
+                paper = parse_openalex_work(item)
                 
                 # Apply must_have_pdf post-filter
                 if filters.must_have_pdf and not paper.pdf_url:
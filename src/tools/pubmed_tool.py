@@ -1,17 +1,74 @@
 from __future__ import annotations
 
 from typing import List, Optional
-import httpx
 from xml.etree import ElementTree as ET
 
 from ..models import Paper, SearchFilters
 from ..utils.logging import get_logger
+from .http_client import SourceClient
 
 logger = get_logger(__name__)
 
 
 ESARCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 ESUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+EFETCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+# PMIDs per efetch call (E-utilities recommend POST beyond ~200)
+EFETCH_BATCH = 200
+
+
+def parse_pubmed_article(article: ET.Element) -> Optional[Paper]:
+    """Paper from a <PubmedArticle> element (efetch XML or a baseline/update file)"""
+    citation = article.find("MedlineCitation")
+    if citation is None:
+        return None
+    uid = (citation.findtext("PMID") or "").strip()
+    node = citation.find("Article")
+    if node is None:
+        return None
+    title_node = node.find("ArticleTitle")
+    title = "".join(title_node.itertext()).strip() if title_node is not None else ""
+    if not title:
+        return None
+    abstract = " ".join(
+        "".join(part.itertext()).strip() for part in node.findall("Abstract/AbstractText")
+    ).strip() or None
+    authors: List[str] = []
+    for a in node.findall("AuthorList/Author"):
+        name = " ".join(filter(None, [a.findtext("ForeName"), a.findtext("LastName")])) or a.findtext("CollectiveName")
+        if name:
+            authors.append(name.strip())
+    year: Optional[int] = None
+    pub_date = node.find("Journal/JournalIssue/PubDate")
+    if pub_date is not None:
+        txt = (pub_date.findtext("Year") or pub_date.findtext("MedlineDate") or "").strip()
+        if txt[:4].isdigit():
+            year = int(txt[:4])
+    doi = next(
+        (e.text.strip() for e in node.findall("ELocationID") if e.attrib.get("EIdType") == "doi" and e.text),
+        None,
+    ) or next(
+        (
+            e.text.strip()
+            for e in article.findall("PubmedData/ArticleIdList/ArticleId")
+            if e.attrib.get("IdType") == "doi" and e.text
+        ),
+        None,
+    )
+    return Paper(
+        id=uid or title,
+        source="pubmed",
+        title=title,
+        abstract=abstract,
+        authors=authors,
+        year=year,
+        venue=node.findtext("Journal/Title"),
+        doi=doi,
+        url=f"https://pubmed.ncbi.nlm.nih.gov/{uid}/" if uid else None,
+        pdf_url=None,
+        citations_count=None,
+        keywords=[],
+    )
 
 
 def _fetch_summaries(ids: List[str]) -> List[Paper]:
@@ -20,7 +77,7 @@ def _fetch_summaries(ids: List[str]) -> List[Paper]:
     params = {"db": "pubmed", "id": ",".join(ids), "retmode": "xml"}
     papers: List[Paper] = []
     try:
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("pubmed") as client:
             r = client.get(ESUMMARY, params=params)
             r.raise_for_status()
             root = ET.fromstring(r.text)
@@ -68,6 +125,21 @@ def _fetch_summaries(ids: List[str]) -> List[Paper]:
     return papers
 
 
+def fetch_pubmed_articles(pmids: List[str]) -> List[Paper]:
+    """Full records (with abstracts) for PMIDs, via efetch in batches"""
+    papers: List[Paper] = []
+    for start in range(0, len(pmids), EFETCH_BATCH):
+        params = {"db": "pubmed", "id": ",".join(pmids[start:start + EFETCH_BATCH]), "retmode": "xml"}
+        try:
+            with SourceClient("pubmed") as client:
+                r = client.get(EFETCH, params=params)
+                root = ET.fromstring(r.text)
+            papers.extend(p for p in map(parse_pubmed_article, root.findall("PubmedArticle")) if p is not None)
+        except Exception as e:  # pragma: no cover - network
+            logger.warning("PubMed efetch failed: %s", e)
+    return papers
+
+
 def search_pubmed(query: str, filters: SearchFilters) -> List[Paper]:
     term = query
     if filters.start_year or filters.end_year:
@@ -77,7 +149,7 @@ def search_pubmed(query: str, filters: SearchFilters) -> List[Paper]:
     params = {"db": "pubmed", "term": term, "retmax": max(20, filters.limit), "retmode": "xml"}
     ids: List[str] = []
     try:
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("pubmed") as client:
             r = client.get(ESARCH, params=params)
             r.raise_for_status()
             root = ET.fromstring(r.text)
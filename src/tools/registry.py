@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Literal, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from ..models import Paper
+
+SearchTool = Callable[..., List["Paper"]]
+
+CostClass = Literal["free", "keyed", "paid"]
+
+
+@dataclass(frozen=True)
+class SourceCapabilities:
+    """What an adapter can do itself, so the orchestrator does not have to after the fetch"""
+
+    year_filter: bool = False  # honours start_year/end_year
+    venue_filter: bool = False  # honours venues
+    oa_filter: bool = False  # honours oa_only
+    max_page_size: int = 50  # most results one call returns
+    requests_per_second: Optional[float] = None  # the adapter's own throttle, if any
+    cost: CostClass = "free"
+    domains: FrozenSet[str] = frozenset({"general"})  # e.g. "cs", "biomed", "physics", "general"
+    # SearchConfig fields of which at least one must be set (API keys); empty = always usable
+    requires_any: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class SourceAdapter:
+    """A search source: its name in enable_sources, search function and capabilities.
+
+    `search` is either a callable or "module:function" (relative to src.tools
+    unless the module path is dotted), imported the first time it is searched.
+    `paper_sources` are the Paper.source values it produces (default: its name).
+    A `mirrors_sources` adapter returns papers other sources produced (e.g. a
+    store of their results), keeping their source; see produced_by().
+    """
+
+    name: str
+    search: Union[str, SearchTool]
+    capabilities: SourceCapabilities = field(default_factory=SourceCapabilities)
+    paper_sources: Tuple[str, ...] = ()
+    mirrors_sources: bool = False
+
+    def produces(self) -> Tuple[str, ...]:
+        if self.mirrors_sources:
+            return self.paper_sources
+        return self.paper_sources or (self.name,)
+
+    def available(self, config: Any) -> bool:
+        """False if the adapter needs a key that is not configured"""
+        required = self.capabilities.requires_any
+        return not required or any(getattr(config, attr, None) for attr in required)
+
+
+_SCHOLARLY = frozenset({"general"})
+_CS = frozenset({"cs"})
+_BIOMED = frozenset({"biomed"})
+
+# Registration order is also the default query order
+_adapters: Dict[str, SourceAdapter] = {}
+_loaded: Dict[str, SearchTool] = {}
+_paper_sources: FrozenSet[str] = frozenset()
+_lock = threading.Lock()
+
+
+def register_source(adapter: SourceAdapter) -> None:
+    """Add (or replace) a source adapter; call reload() on config afterwards to pick up ENABLE_<NAME>"""
+    global _paper_sources
+    with _lock:
+        _adapters[adapter.name] = adapter
+        _loaded.pop(adapter.name, None)
+        _paper_sources = frozenset(source for a in _adapters.values() for source in a.produces())
+
+
+for _adapter in [
+    # Offline corpus of dump imports and every source's search results; papers keep their origin
+    SourceAdapter("local", "local_tool:search_local", SourceCapabilities(
+        year_filter=True, venue_filter=True, oa_filter=True, max_page_size=200, domains=_SCHOLARLY,
+    ), mirrors_sources=True),
+    SourceAdapter("openalex", "openalex_tool:search_openalex", SourceCapabilities(
+        year_filter=True, venue_filter=True, oa_filter=True, max_page_size=200, requests_per_second=10,
+        domains=_SCHOLARLY,
+    )),
+    SourceAdapter("semanticscholar", "semantic_scholar_tool:search_semantic_scholar", SourceCapabilities(
+        year_filter=True, venue_filter=True, oa_filter=True, max_page_size=100, requests_per_second=10,
+        domains=_SCHOLARLY,
+    )),
+    SourceAdapter("crossref", "crossref_tool:search_crossref", SourceCapabilities(
+        max_page_size=100, domains=_SCHOLARLY,
+    )),
+    SourceAdapter("arxiv", "arxiv_tool:search_arxiv", SourceCapabilities(
+        max_page_size=100, domains=frozenset({"cs", "physics"}),
+    )),
+    SourceAdapter("europe_pmc", "europe_pmc_tool:search_europe_pmc", SourceCapabilities(
+        year_filter=True, venue_filter=True, max_page_size=100, requests_per_second=10, domains=_BIOMED,
+    )),
+    SourceAdapter("biorxiv", "biorxiv_tool:search_biorxiv", SourceCapabilities(
+        year_filter=True, max_page_size=50, domains=_BIOMED,
+    )),
+    SourceAdapter("medrxiv", "medrxiv_tool:search_medrxiv", SourceCapabilities(
+        year_filter=True, max_page_size=50, domains=_BIOMED,
+    )),
+    SourceAdapter("dblp", "dblp_tool:search_dblp", SourceCapabilities(
+        year_filter=True, max_page_size=50, domains=_CS,
+    )),
+    SourceAdapter("scholar", "scholar_provider:search_scholar", SourceCapabilities(
+        year_filter=True, max_page_size=20, requests_per_second=2, cost="paid", domains=_SCHOLARLY,
+        requires_any=("serpapi_key", "serper_api_key"),
+    )),
+    SourceAdapter("google_scholar", "google_scholar_tool:search_google_scholar", SourceCapabilities(
+        year_filter=True, max_page_size=20, domains=_SCHOLARLY,
+    )),
+    SourceAdapter("pubmed", "pubmed_tool:search_pubmed", SourceCapabilities(
+        year_filter=True, max_page_size=100, domains=_BIOMED,
+    )),
+]:
+    register_source(_adapter)
+
+
+def source_names() -> List[str]:
+    return list(_adapters)
+
+
+def get_adapter(name: str) -> SourceAdapter:
+    try:
+        return _adapters[name]
+    except KeyError:
+        raise KeyError(f"Unknown source: {name}") from None
+
+
+def paper_sources() -> FrozenSet[str]:
+    """Every value Paper.source may take"""
+    return _paper_sources
+
+
+def produced_by(name: str) -> FrozenSet[str]:
+    """Paper.source values a source's results may carry"""
+    adapter = get_adapter(name)
+    if adapter.mirrors_sources:
+        return _paper_sources
+    return frozenset(adapter.produces())
+
+
+def get_tool(name: str) -> SearchTool:
+    """Search function for a source, importing its module on first use"""
+    tool = _loaded.get(name)
+    if tool is None:
+        target = get_adapter(name).search
+        if isinstance(target, str):
+            module, attr = target.split(":")
+            package = None if "." in module else __package__
+            tool = getattr(import_module(module if package is None else f"{package}.{module}"), attr)
+        else:
+            tool = target
+        with _lock:
+            _loaded[name] = tool
+    return tool
+
+
+def lazy_tool(name: str) -> SearchTool:
+    """Callable standing in for a source's search function until it is first called"""
+    target = get_adapter(name).search
+
+    def search(*args: Any, **kwargs: Any) -> List["Paper"]:
+        return get_tool(name)(*args, **kwargs)
+
+    search.__name__ = search.__qualname__ = target.split(":")[1] if isinstance(target, str) else target.__name__
+    return search
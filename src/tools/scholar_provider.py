@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import time
 from typing import List, Dict, Any, Optional
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..models import Paper, SearchFilters
 from ..config_search import get_search_config
 from ..utils.logging import get_logger
+from .http_client import SourceClient
 
 logger = get_logger(__name__)
 
@@ -44,7 +43,7 @@ def _search_serpapi(query: str, filters: SearchFilters) -> List[Paper]:
         # Rate limiting
         time.sleep(0.5)  # 2 requests per second max for SerpAPI
         
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("scholar") as client:
             response = client.get(SERPAPI_URL, params=search_params)
             response.raise_for_status()
             data = response.json()
@@ -121,7 +120,7 @@ def _search_serper(query: str, filters: SearchFilters) -> List[Paper]:
         # Rate limiting
         time.sleep(0.5)  # 2 requests per second max for Serper
         
-        with httpx.Client(timeout=30) as client:
+        with SourceClient("scholar") as client:
             response = client.post(SERPER_URL, json=search_params, headers=headers)
             response.raise_for_status()
             data = response.json()
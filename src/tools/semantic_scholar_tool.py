@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import time
-from typing import List, Dict, Any
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import List, Dict, Any, Optional
 
 from ..models import Paper, SearchFilters
 from ..config_search import get_search_config
 from ..utils.logging import get_logger
+from .http_client import source_get, source_request
 
 logger = get_logger(__name__)
 
 S2_API = "https://api.semanticscholar.org/graph/v1/paper/search"
+S2_BATCH_API = "https://api.semanticscholar.org/graph/v1/paper/batch"
+S2_FIELDS = "paperId,title,abstract,authors,year,venue,doi,url,openAccessPdf,citationCount,isOpenAccess"
+# Most IDs one /paper/batch call accepts
+S2_BATCH_SIZE = 500
 
 
 def _build_s2_query(query: str, filters: SearchFilters) -> str:
@@ -35,19 +38,62 @@ def _build_s2_query(query: str, filters: SearchFilters) -> str:
     return s2_query
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def _make_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Make HTTP request with retry logic"""
+def _headers() -> Dict[str, str]:
     config = get_search_config()
+    return {"x-api-key": config.s2_api_key} if config.s2_api_key else {}
+
+
+def _make_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """GET JSON through the shared HTTP layer (circuit breaker + retries)"""
+    return source_get("semanticscholar", url, params=params, headers=_headers()).json()
+
+
+def parse_s2_paper(item: Dict[str, Any], reasons: Optional[List[str]] = None) -> Paper:
+    """Paper from a Semantic Scholar Graph API paper record"""
+    # Extract authors
+    authors = []
+    for author in item.get("authors") or []:
+        author_name = author.get("name", "")
+        if author_name:
+            authors.append(author_name)
     
-    headers = {}
-    if config.s2_api_key:
-        headers["x-api-key"] = config.s2_api_key
+    # Get PDF URL
+    pdf_url = None
+    if (item.get("openAccessPdf") or {}).get("url"):
+        pdf_url = item["openAccessPdf"]["url"]
     
-    with httpx.Client(timeout=30) as client:
-        response = client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    return Paper(
+        id=item.get("paperId", ""),
+        source="semanticscholar",
+        title=item.get("title") or "",
+        abstract=item.get("abstract", ""),
+        authors=authors,
+        year=item.get("year"),
+        venue=item.get("venue", ""),
+        doi=item.get("doi"),
+        url=item.get("url"),
+        pdf_url=pdf_url,
+        citations_count=item.get("citationCount", 0),
+        keywords=[],
+        reasons=reasons or [],
+    )
+
+
+def fetch_s2_papers(ids: List[str]) -> List[Optional[Paper]]:
+    """Papers for S2 IDs (paperId, "DOI:...", "ARXIV:...", "PMID:..."), aligned with `ids` (None = not found)"""
+    papers: List[Optional[Paper]] = []
+    for start in range(0, len(ids), S2_BATCH_SIZE):
+        chunk = ids[start:start + S2_BATCH_SIZE]
+        try:
+            response = source_request(
+                "semanticscholar", "POST", S2_BATCH_API,
+                params={"fields": S2_FIELDS}, headers=_headers(), json={"ids": chunk},
+            )
+            papers.extend(parse_s2_paper(item) if item else None for item in response.json())
+        except Exception as e:
+            logger.warning(f"Semantic Scholar batch lookup failed: {e}")
+            papers.extend([None] * len(chunk))
+    return papers
 
 
 def search_semantic_scholar(query: str, filters: SearchFilters) -> List[Paper]:
@@ -63,7 +109,7 @@ def search_semantic_scholar(query: str, filters: SearchFilters) -> List[Paper]:
     base_params = {
         "query": _build_s2_query(query, filters),
         "limit": min(100, limit),
-        "fields": "paperId,title,abstract,authors,year,venue,doi,url,openAccessPdf,citationCount,isOpenAccess"
+        "fields": S2_FIELDS
     }
     
     try:
@@ -79,33 +125,7 @@ def search_semantic_scholar(query: str, filters: SearchFilters) -> List[Paper]:
             if not data:
                 break
             for item in data:
-                # Extract authors
-                authors = []
-                for author in item.get("authors", []):
-                    author_name = author.get("name", "")
-                    if author_name:
-                        authors.append(author_name)
-                
-                # Get PDF URL
-                pdf_url = None
-                if item.get("openAccessPdf", {}).get("url"):
-                    pdf_url = item["openAccessPdf"]["url"]
-                
-                paper = Paper(
-                    id=item.get("paperId", ""),
-                    source="semanticscholar",
-                    title=item.get("title", ""),
-                    abstract=item.get("abstract", ""),
-                    authors=authors,
-                    year=item.get("year"),
-                    venue=item.get("venue", ""),
-                    doi=item.get("doi"),
-                    url=item.get("url"),
-                    pdf_url=pdf_url,
-                    citations_count=item.get("citationCount", 0),
-                    keywords=[],
-                    reasons=[f"Semantic Scholar match for: {query}"]
-                )
+                paper = parse_s2_paper(item, reasons=[f"Semantic Scholar match for: {query}"])
                 # Apply OA/PDF post-filtering
                 if filters.must_have_pdf and not paper.pdf_url:
                     pass
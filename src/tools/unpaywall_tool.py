@@ -2,31 +2,26 @@ from __future__ import annotations
 
 import time
 from typing import List, Dict, Any, Optional
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..models import Paper
 from ..config_search import get_search_config
 from ..utils.logging import get_logger
+from .http_client import source_get
 
 logger = get_logger(__name__)
 
 UNPAYWALL_API = "https://api.unpaywall.org/v2"
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def _make_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Make HTTP request with retry logic"""
+    """GET JSON through the shared HTTP layer (circuit breaker + retries)"""
     config = get_search_config()
     
     headers = {}
     if config.unpaywall_email:
         params["email"] = config.unpaywall_email
     
-    with httpx.Client(timeout=30) as client:
-        response = client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    return source_get("unpaywall", url, params=params, headers=headers).json()
 
 
 def resolve_open_access(doi: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,16 @@
+import pytest
+
+from src import config
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Set environment variables for one test; settings are memoized, so reload around it"""
+
+    def setenv(name, value):
+        monkeypatch.setenv(name, value)
+        config.reload()
+
+    yield setenv
+    monkeypatch.undo()
+    config.reload()
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.models import Paper, ScoreComponents
+
+
+@pytest.fixture
+def client():
+    api_main._get_result_cache().clear()
+    yield TestClient(api_main.app)
+    api_main._get_result_cache().clear()
+
+
+def _papers(n):
+    return [
+        Paper(id=f"p{i}", source="openalex", title=f"Paper {i}", abstract="Long abstract.",
+              score_components=ScoreComponents(final=1.0 - i / 10))
+        for i in range(n)
+    ]
+
+
+def test_pages_and_projections_reuse_cached_result_set(client):
+    with patch.object(api_main, "run_search_v2", return_value=(_papers(5), None)) as search:
+        first = client.get("/api/search", params={"q": "graph networks", "k": 5, "page_size": 2}).json()
+        second = client.get(
+            "/api/search",
+            params={"q": "Graph  Networks", "k": 5, "page_size": 2, "cursor": first["next_cursor"],
+                    "fields": "title,year", "include_abstract": "false"},
+        ).json()
+        last = client.get(
+            "/api/search", params={"q": "graph networks", "k": 5, "page_size": 2, "cursor": second["next_cursor"]}
+        ).json()
+
+    assert search.call_count == 1
+    assert [p["id"] for p in first["papers"]] == ["p0", "p1"]
+    assert second["papers"] == [{"id": "p2", "title": "Paper 2", "year": None}, {"id": "p3", "title": "Paper 3", "year": None}]
+    assert [p["id"] for p in last["papers"]] == ["p4"] and last["next_cursor"] is None
+    assert first["total_results"] == 5
+
+
+def test_etag_revalidation_returns_not_modified(client):
+    with patch.object(api_main, "run_search_v2", return_value=(_papers(3), None)):
+        response = client.get("/api/search", params={"q": "graph networks"})
+        etag = response.headers["etag"]
+        again = client.get("/api/search", params={"q": "graph networks"}, headers={"If-None-Match": etag})
+        other = client.get(
+            "/api/search", params={"q": "graph networks", "include_abstract": "false"}, headers={"If-None-Match": etag}
+        )
+
+    assert again.status_code == 304 and again.headers["etag"] == etag
+    assert other.status_code == 200 and other.headers["etag"] != etag
+
+
+def test_cursor_from_another_query_is_rejected(client):
+    with patch.object(api_main, "run_search_v2", return_value=(_papers(3), None)):
+        cursor = client.get("/api/search", params={"q": "graph networks", "page_size": 1}).json()["next_cursor"]
+        response = client.get("/api/search", params={"q": "protein folding", "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_sources_override_is_per_request(client):
+    with patch.object(api_main, "run_search_v2", return_value=(_papers(3), None)) as search:
+        client.get("/api/search", params={"q": "graph networks", "sources": "arxiv"})
+        client.get("/api/search", params={"q": "graph networks"})
+        bad = client.get("/api/search", params={"q": "graph networks", "sources": "nowhere"})
+
+    assert search.call_count == 2
+    narrowed, default = (call.kwargs["config"] for call in search.call_args_list)
+    assert [name for name, enabled in narrowed.enable_sources.items() if enabled] == ["arxiv"]
+    assert default is None
+    assert bad.status_code == 400
@@ -0,0 +1,61 @@
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from src.models import Filters, Paper, ScoreComponents
+from src.jobs.store import get_job_store
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_search_stream_emits_stages_then_results():
+    papers = [Paper(id="p1", source="openalex", title="Graph networks", score_components=ScoreComponents(final=0.9))]
+
+    def fake_search(topic, filters, on_event=None, config=None):
+        on_event("source", {"source": "openalex", "query_type": "domain", "count": 1})
+        on_event("dedupe", {"before": 1, "after": 1})
+        on_event("provisional", {"papers": papers})
+        on_event("ranking", {"count": 1})
+        return papers, None
+
+    api_main._get_result_cache().clear()
+    client = TestClient(api_main.app)
+    with patch.object(api_main, "run_search_v2", side_effect=fake_search):
+        response = client.get("/api/search/stream", params={"q": "graph networks", "k": 5})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [name for name, _ in events] == ["source", "dedupe", "provisional", "ranking", "results"]
+    assert events[2][1]["papers"][0]["id"] == "p1"
+    assert events[-1][1]["total_results"] == 1
+
+
+def test_search_stream_reports_errors_as_events():
+    api_main._get_result_cache().clear()
+    client = TestClient(api_main.app)
+    with patch.object(api_main, "run_search_v2", side_effect=RuntimeError("boom")):
+        response = client.get("/api/search/stream", params={"q": "graph networks"})
+
+    assert _events(response.text) == [("error", {"detail": "Search failed: boom"})]
+
+
+def test_job_events_stream_until_terminal_status(tmp_path, env):
+    env("JOB_DB_PATH", str(tmp_path / "jobs.sqlite"))
+    store = get_job_store()
+    job = store.create("topic", Filters())
+    store.claim_next()
+    store.finish(job["job_id"], "done", markdown_path="r.md")
+
+    response = TestClient(api_main.app).get(f"/jobs/{job['job_id']}/events")
+
+    events = _events(response.text)
+    assert [name for name, _ in events] == ["progress", "end"]
+    assert events[0][1]["status"] == "done" and events[0][1]["markdown_path"] == "r.md"
@@ -0,0 +1,97 @@
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.bench.cassette import Cassette, request_key, use_cassette
+from src.bench.harness import (
+    BENCH_TOPICS, DEFAULT_TARGETS, compare_to_baseline, format_report, load_baseline, run_benchmarks, topic_slug,
+)
+
+BENCHMARKS = Path(__file__).resolve().parent.parent / "benchmarks"
+
+WORKS = {
+    "results": [
+        {
+            "id": f"https://openalex.org/W{i}",
+            "title": f"Graph networks for molecules, part {i}",
+            "publication_year": 2020 + i % 4,
+            "cited_by_count": 10 * i,
+            "abstract_inverted_index": {"Graph": [0], "networks": [1], "predict": [2], "molecules": [3]},
+        }
+        for i in range(1, 8)
+    ]
+}
+
+
+@pytest.fixture
+def live(monkeypatch):
+    """Stand-in for the network while recording: OpenAlex answers, every other host 404s"""
+    sent = []
+
+    def handle_request(transport, request):
+        sent.append(request)
+        if request.url.host == "api.openalex.org":
+            return httpx.Response(200, json=WORKS if request.url.params.get("page", "1") == "1" else {"results": []})
+        return httpx.Response(404)
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle_request)
+    return sent
+
+
+def test_cassette_records_then_replays_with_latency(tmp_path, live):
+    path = tmp_path / "topic.json"
+    with use_cassette(Cassette(path, "record")):
+        with httpx.Client() as client:
+            client.get("https://api.openalex.org/works", params={"search": "graphs", "mailto": "me@example.org"})
+    assert len(live) == 1
+    assert "me@example.org" not in path.read_text()
+
+    cassette = Cassette(path, "replay", latency=0.05)
+    with use_cassette(cassette), httpx.Client() as client:
+        start = time.perf_counter()
+        response = client.get("https://api.openalex.org/works", params={"mailto": "other@example.org", "search": "graphs"})
+        assert time.perf_counter() - start >= 0.05
+        assert response.json() == WORKS
+        with pytest.raises(httpx.ConnectError):
+            client.get("https://api.openalex.org/works", params={"search": "trees"})
+    assert len(live) == 1
+    assert cassette.hits == 1
+    assert cassette.misses == [request_key("GET", httpx.URL("https://api.openalex.org/works?search=trees"), b"")]
+
+
+def test_search_benchmark_replays_offline_and_flags_regressions(tmp_path, live):
+    fixtures = tmp_path / "cassettes"
+    run_benchmarks(fixtures, topics=["graph networks"], targets=["search_v2"], mode="record")
+    recorded = len(live)
+    assert recorded > 0
+
+    report = run_benchmarks(fixtures, topics=["graph networks"], targets=["search_v2"], repeat=2, latency=0.01)
+    assert len(live) == recorded  # nothing went out while replaying
+    result = report["results"]["search_v2:graph-networks"]
+    assert result["papers"] == 7
+    assert result["misses"] == []
+    assert result["requests"] > 0 and result["peak_kib"] > 0
+    assert {"sources", "rank_provisional", "rank_dense", "finalize"} <= set(result["stages"])
+    assert result["stages"]["sources"] >= 0.01
+    assert "search_v2:graph-networks" in format_report(report)
+
+    assert compare_to_baseline(report, report) == []
+    faster = {"results": {"search_v2:graph-networks": dict(result, wall=result["wall"] / 2, papers=9)}}
+    regressions = compare_to_baseline(report, faster)
+    assert any(line.startswith("search_v2:graph-networks wall") for line in regressions)
+    assert "search_v2:graph-networks papers: 9 -> 7" in regressions
+
+
+def test_committed_cassettes_replay_every_default_target_offline(live):
+    topic = BENCH_TOPICS[0]
+    report = run_benchmarks(BENCHMARKS / "cassettes", topics=[topic], repeat=1)
+    baseline = load_baseline(BENCHMARKS / "baseline.json")
+
+    assert live == []
+    for target in DEFAULT_TARGETS:
+        key = f"{target}:{topic_slug(topic)}"
+        result = report["results"][key]
+        assert result["misses"] == [] and result["requests"] > 0
+        assert result["papers"] == baseline["results"][key]["papers"] > 0
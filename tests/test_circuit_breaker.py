@@ -0,0 +1,225 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config_search import get_search_config
+from src.models import SearchFilters
+from src.search.source_planner import plan_sources
+from src.tools import circuit_breaker, http_client
+from src.tools.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def breakers():
+    with patch.dict(circuit_breaker._breakers, clear=True), patch.dict(http_client._budgets, clear=True):
+        yield circuit_breaker._breakers
+
+
+def _trip(breaker, calls=5):
+    for _ in range(calls):
+        assert breaker.allow()
+        breaker.record(False, 0.1)
+
+
+def test_breaker_opens_then_half_opens_and_closes_on_a_good_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker("openalex", min_calls=5, open_seconds=30, clock=clock)
+
+    _trip(breaker)
+    assert breaker.state == "open" and not breaker.allow()
+    assert breaker.retry_in() == 30
+
+    clock.now = 31
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial call at a time
+    breaker.record(True, 0.2)
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_trial_reopens_and_slow_calls_count_as_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker("openalex", min_calls=4, slow_call=2.0, open_seconds=10, clock=clock)
+
+    for _ in range(4):
+        breaker.allow()
+        breaker.record(True, 5.0)
+    assert breaker.state == "open"
+
+    clock.now = 11
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+    assert breaker.state == "open" and breaker.times_opened == 2
+    assert breaker.snapshot()["p90_latency"] == 5.0
+
+
+def test_source_request_stops_sending_once_the_circuit_opens():
+    sent = []
+
+    def handler(request):
+        sent.append(request.url)
+        return httpx.Response(503, request=request)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    config = get_search_config().with_overrides(retry_attempts=3, retry_delay=0, breaker_min_calls=2)
+    with patch.object(http_client, "_shared_client", return_value=client), \
+            patch.object(http_client, "get_search_config", return_value=config), \
+            patch.object(circuit_breaker, "get_search_config", return_value=config):
+        with pytest.raises(CircuitOpenError):
+            http_client.source_get("openalex", "https://api.openalex.org/works")
+        with pytest.raises(CircuitOpenError):
+            http_client.source_get("openalex", "https://api.openalex.org/works")
+
+    assert len(sent) == 2
+    assert get_breaker("openalex").state == "open"
+
+
+def test_non_retryable_errors_raise_without_retrying():
+    sent = []
+
+    def handler(request):
+        sent.append(request.url)
+        return httpx.Response(404, request=request)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch.object(http_client, "_shared_client", return_value=client):
+        with pytest.raises(httpx.HTTPStatusError):
+            http_client.source_get("crossref", "https://api.crossref.org/works")
+
+    assert len(sent) == 1
+    assert get_breaker("crossref").state == "closed"
+
+
+def test_planner_skips_open_circuits_and_health_reports_them():
+    _trip(get_breaker("dblp"))
+    skipped = {}
+
+    plans = plan_sources(SearchFilters(), get_search_config(), skipped)
+
+    assert "dblp" not in {p.name for p in plans}
+    assert skipped["dblp"].startswith("circuit open")
+
+    from api.main import app
+
+    health = TestClient(app).get("/health/sources").json()
+    assert health["dblp"]["state"] == "open"
+    assert health["openalex"]["state"] == "closed"
+
+
+def _slow_first_client(delay):
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            calls.append(request.url)
+            first = len(calls) == 1
+        if first:
+            time.sleep(delay)
+        return httpx.Response(200, json={"first": first}, request=request)
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), calls
+
+
+def _warm(source, latency=0.01):
+    breaker = get_breaker(source)
+    for _ in range(http_client.HEDGE_MIN_SAMPLES):
+        breaker.record(True, latency)
+
+
+def test_slow_request_is_hedged_and_the_hedge_wins():
+    client, calls = _slow_first_client(0.5)
+    config = get_search_config().with_overrides(hedge_sources=["openalex"], hedge_budget=1.0)
+    _warm("openalex")
+    with patch.object(http_client, "_shared_client", return_value=client), \
+            patch.object(http_client, "get_search_config", return_value=config):
+        start = time.monotonic()
+        response = http_client.source_get("openalex", "https://api.openalex.org/works")
+        elapsed = time.monotonic() - start
+
+    assert response.json() == {"first": False}
+    assert elapsed < 0.4 and len(calls) == 2
+    assert http_client.hedge_stats()["openalex"] == {"requests": 1, "hedged": 1, "wins": 1, "win_rate": 1.0}
+
+
+def test_hedging_respects_the_budget_and_source_list():
+    config = get_search_config().with_overrides(hedge_sources=["openalex"], hedge_budget=0.1)
+    _warm("openalex")
+    _warm("crossref")
+    for source in ("openalex", "crossref"):
+        client, calls = _slow_first_client(0.2)
+        with patch.object(http_client, "_shared_client", return_value=client), \
+                patch.object(http_client, "get_search_config", return_value=config):
+            assert http_client.source_get(source, "https://example.org").json() == {"first": True}
+        assert len(calls) == 1
+
+    assert http_client.hedge_stats() == {"openalex": {"requests": 1, "hedged": 0, "wins": 0, "win_rate": 0.0}}
+
+
+def test_a_half_open_trial_that_raises_a_non_transport_error_still_settles_the_breaker():
+    def handler(request):
+        if request.url.path.startswith("/loop"):
+            return httpx.Response(302, headers={"Location": "/loop"}, request=request)
+        return httpx.Response(503, request=request)
+
+    clock = FakeClock()
+    breaker = circuit_breaker._breakers["dblp"] = CircuitBreaker("dblp", min_calls=5, open_seconds=30, clock=clock)
+    client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+    config = get_search_config().with_overrides(retry_attempts=5, retry_delay=0)
+    with patch.object(http_client, "_shared_client", return_value=client), \
+            patch.object(http_client, "get_search_config", return_value=config):
+        with pytest.raises(httpx.HTTPStatusError):
+            http_client.source_get("dblp", "https://dblp.org/search")
+        assert breaker.state == "open"
+
+        clock.now = 31
+        with pytest.raises(httpx.TooManyRedirects):
+            http_client.source_get("dblp", "https://dblp.org/loop")
+        assert breaker.state == "open" and breaker.times_opened == 2
+
+        clock.now = 62
+        with pytest.raises(httpx.TooManyRedirects):
+            http_client.source_get("dblp", "https://dblp.org/loop")
+    assert breaker.times_opened == 3
+
+
+def test_hedging_deadline_excludes_queue_time_and_only_the_winner_is_recorded():
+    config = get_search_config().with_overrides(hedge_sources=["openalex"], hedge_budget=1.0)
+    breaker = get_breaker("openalex")
+    _warm("openalex")
+
+    # A request stuck behind a busy pool is not hedged just for waiting its turn
+    client, calls = _slow_first_client(0)
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.submit(time.sleep, 0.3)
+    with patch.object(http_client, "_shared_client", return_value=client), \
+            patch.object(http_client, "_hedge_pool", pool), \
+            patch.object(http_client, "get_search_config", return_value=config):
+        http_client.source_get("openalex", "https://api.openalex.org/works")
+    pool.shutdown()
+    assert len(calls) == 1
+    assert http_client.hedge_stats()["openalex"]["hedged"] == 0
+
+    # The slow original finishing later leaves no trace on the breaker's latencies
+    client, calls = _slow_first_client(0.3)
+    recorded = len(breaker._latencies)
+    with patch.object(http_client, "_shared_client", return_value=client), \
+            patch.object(http_client, "get_search_config", return_value=config):
+        assert http_client.source_get("openalex", "https://api.openalex.org/works").json() == {"first": False}
+        time.sleep(0.4)
+    assert len(calls) == 2
+    assert len(breaker._latencies) == recorded + 1
+    assert max(breaker._latencies) < 0.3
@@ -0,0 +1,47 @@
+from src import config
+from src.config import get_settings
+from src.config_search import get_search_config
+
+
+def test_settings_are_memoized_until_reload(env):
+    first = get_settings()
+    assert get_settings() is first
+    assert get_search_config() is get_search_config()
+
+    env("JOB_MAX_CONCURRENT", "7")
+
+    assert get_settings() is not first
+    assert get_settings().job_max_concurrent == 7
+
+
+def test_reload_rereads_env_file_without_overriding_real_environment(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("SUMMARY_BATCH_TOKENS=111\nJOB_MAX_CONCURRENT=3\n")
+    monkeypatch.setattr(config, "env_file_path", lambda: env_file)
+    monkeypatch.setattr(config, "_dotenv_values", {})
+    monkeypatch.delenv("SUMMARY_BATCH_TOKENS", raising=False)
+    monkeypatch.setenv("JOB_MAX_CONCURRENT", "5")
+    hooks = []
+    monkeypatch.setattr(config, "_reload_hooks", [lambda: hooks.append("ran")])
+    try:
+        settings = config.reload()
+        assert (settings.summary_batch_tokens, settings.job_max_concurrent) == (111, 5)
+
+        env_file.write_text("SUMMARY_BATCH_TOKENS=222\nJOB_MAX_CONCURRENT=3\n")
+        settings = config.reload()
+        assert (settings.summary_batch_tokens, settings.job_max_concurrent) == (222, 5)
+        assert hooks == ["ran", "ran"]
+    finally:
+        monkeypatch.undo()
+        config.reload()
+
+
+def test_with_overrides_leaves_shared_config_untouched():
+    shared = get_search_config()
+    narrowed = shared.with_overrides(enable_sources={name: name == "arxiv" for name in shared.enable_sources})
+
+    assert narrowed.enable_sources["arxiv"] and not any(
+        enabled for name, enabled in narrowed.enable_sources.items() if name != "arxiv"
+    )
+    assert get_search_config() is shared
+    assert get_settings().with_overrides(job_max_concurrent=9).job_max_concurrent == 9
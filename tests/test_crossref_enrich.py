@@ -0,0 +1,51 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.models import Paper
+from src.tools import crossref_tool
+from src.utils.cache import PersistentCache
+
+
+@pytest.fixture
+def doi_cache(tmp_path, monkeypatch):
+    cache = PersistentCache(tmp_path / "crossref.sqlite", ttl=3600)
+    monkeypatch.setattr(crossref_tool, "_doi_cache", cache)
+    return cache
+
+
+def _response(items):
+    r = MagicMock()
+    r.json.return_value = {"message": {"items": items}}
+    r.raise_for_status = lambda: None
+    return r
+
+
+def test_bulk_enrich_skips_complete_papers_and_uses_cache(doi_cache):
+    complete = Paper(id="c", source="pubmed", title="Complete", doi="10.1/C", year=2020,
+                     venue="J", authors=["A"], url="https://x")
+    partial = Paper(id="p", source="arxiv", title="Partial", doi="10.1/P")
+    no_doi = Paper(id="n", source="arxiv", title="No DOI")
+    item = {"DOI": "10.1/p", "title": ["Partial"], "issued": {"date-parts": [[2021]]},
+            "container-title": ["Conf"], "author": [{"given": "B", "family": "C"}], "URL": "https://doi.org/10.1/p"}
+
+    with patch("httpx.Client.get", return_value=_response([item])) as mock_get:
+        enriched = crossref_tool.enrich_papers_with_crossref([complete, partial, no_doi])
+        again = crossref_tool.enrich_papers_with_crossref([partial])
+
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.kwargs["params"]["filter"] == "doi:10.1/p"
+    assert [p.id for p in enriched] == ["c", "p", "n"]
+    assert enriched[0] is complete
+    assert enriched[1].year == 2021 and enriched[1].venue == "Conf" and enriched[1].authors == ["B C"]
+    assert again[0].venue == "Conf"
+
+
+def test_unknown_dois_are_negatively_cached(doi_cache):
+    paper = Paper(id="u", source="arxiv", title="Unknown", doi="10.1/unknown")
+
+    with patch("httpx.Client.get", return_value=_response([])) as mock_get:
+        assert crossref_tool.enrich_papers_with_crossref([paper])[0] is paper
+        assert crossref_tool.enrich_papers_with_crossref([paper])[0] is paper
+
+    assert mock_get.call_count == 1
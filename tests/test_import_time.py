@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Heavy dependencies that must only load when a request/command actually needs them
+DEFERRED = ["langgraph", "langchain_core", "langchain_openai", "langchain_anthropic", "rank_bm25", "bs4", "numpy"]
+
+# Cumulative import time budgets (microseconds), generous enough for slow CI machines;
+# fastapi itself accounts for most of api.main
+BUDGETS = {"api.main": 1_500_000, "src.cli.main": 600_000}
+
+
+def _importtime(module: str):
+    """{module: cumulative microseconds} from `python -X importtime -c "import <module>"`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_startup_imports_stay_lazy_and_within_budget(module):
+    times = _importtime(module)
+
+    loaded = sorted({name.split(".")[0] for name in times} & set(DEFERRED))
+    assert loaded == [], f"{module} imports {loaded} at startup"
+    assert times[module] < BUDGETS[module], f"{module} took {times[module] / 1000:.0f}ms to import"
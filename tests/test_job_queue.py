@@ -0,0 +1,181 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+from src.models import Filters, Paper
+from src.jobs.store import JobStore, process_owner
+from src.search import corpus_writer
+from src.search.corpus_writer import get_corpus_writer
+from src.jobs import worker
+from src.jobs.worker import JobDispatcher, execute_job
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _job_that_crashes_its_worker(db_path, job_id):
+    # Runs in a spawned worker process: "crash" dies mid-job, like an OOM-killed review
+    store = JobStore(db_path)
+    if store.get(job_id)["topic"] == "crash":
+        os._exit(1)
+    store.finish(job_id, "done")
+    return "done"
+
+
+def test_claim_order_uses_priority_then_client_fairness(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    a1 = store.create("a1", Filters(), client="alice")
+    a2 = store.create("a2", Filters(), client="alice")
+    b1 = store.create("b1", Filters(), client="bob")
+    urgent = store.create("urgent", Filters(), client="alice", priority=5)
+
+    order = [store.claim_next()["job_id"] for _ in range(4)]
+
+    # Once alice's urgent job is running, bob's job goes ahead of her older ones
+    assert order == [urgent["job_id"], b1["job_id"], a1["job_id"], a2["job_id"]]
+    assert store.claim_next() is None
+    assert store.count_running() == 4
+
+
+def test_jobs_survive_reopen_and_interrupted_jobs_are_requeued(tmp_path):
+    path = tmp_path / "jobs.sqlite"
+    store = JobStore(path)
+    job = store.create("topic", Filters(limit=3))
+    store.claim_next()
+
+    reopened = JobStore(path)
+    assert reopened.get(job["job_id"])["filters"].limit == 3
+    assert reopened.requeue_interrupted() == 1
+    assert reopened.get(job["job_id"])["status"] == "queued"
+
+
+def test_only_jobs_of_gone_dispatchers_are_requeued(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    live, dead, hung = (store.create(topic, Filters()) for topic in ("live", "dead", "hung"))
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    host = process_owner().rpartition(":")[0]
+    store.claim_next(process_owner())
+    store.claim_next(f"{host}:{exited.pid}")
+    store.claim_next("other-host:1234")
+
+    # Another worker process of this API (here: ourselves) is still running its job
+    assert store.requeue_interrupted() == 1
+    assert [store.get(j["job_id"])["status"] for j in (live, dead, hung)] == ["running", "queued", "running"]
+
+    # A dispatcher elsewhere that stopped sending heartbeats is treated as gone
+    time.sleep(0.1)
+    store.heartbeat(process_owner())
+    assert store.requeue_interrupted(stale_after=0.05) == 1
+    assert store.get(hung["job_id"])["status"] == "queued"
+    assert store.get(hung["job_id"])["owner"] is None
+    assert store.get(live["job_id"])["status"] == "running"
+
+
+def test_cancel_queued_job_is_immediate(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    job = store.create("topic", Filters())
+
+    assert store.request_cancel(job["job_id"])["status"] == "cancelled"
+    assert store.claim_next() is None
+
+
+def test_dispatcher_runs_jobs_with_progress_and_concurrency_limit(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_stream(topic, filters, thread_id, streaming=False, on_progress=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        for stage in ("search_node", "summarize_node"):
+            time.sleep(0.05)
+            yield stage
+        with lock:
+            active[0] -= 1
+
+    with patch("src.graph.run_graph.stream_review", side_effect=fake_stream), \
+         patch("src.graph.run_graph.review_stage_count", return_value=2), \
+         patch("src.graph.run_graph.review_state", return_value={"report_md": "r.md", "report_json": "r.json"}):
+        jobs = [store.create(f"t{i}", Filters()) for i in range(3)]
+        dispatcher = JobDispatcher(store, max_concurrent=2, mode="thread", poll_interval=0.05)
+        dispatcher.start()
+        try:
+            assert _wait_for(lambda: all(store.get(j["job_id"])["status"] == "done" for j in jobs))
+        finally:
+            dispatcher.stop(wait=True)
+
+    record = store.get(jobs[0]["job_id"])
+    assert record["progress"] == 1.0 and record["stage"] == "summarize_node"
+    assert record["markdown_path"] == "r.md"
+    assert peak[0] == 2
+
+
+def test_running_job_stops_at_next_stage_when_cancelled(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    job = store.create("topic", Filters())
+    store.claim_next()
+    stages = []
+
+    def fake_stream(topic, filters, thread_id, streaming=False, on_progress=None):
+        for stage in ("search_node", "summarize_node", "matrix_node"):
+            stages.append(stage)
+            if stage == "search_node":
+                store.request_cancel(thread_id)
+            yield stage
+
+    with patch("src.graph.run_graph.stream_review", side_effect=fake_stream), \
+         patch("src.graph.run_graph.review_stage_count", return_value=3):
+        status = execute_job(str(store.path), job["job_id"])
+
+    assert status == "cancelled"
+    assert stages == ["search_node"]
+    assert store.get(job["job_id"])["status"] == "cancelled"
+    assert store.requeue(job["job_id"])["status"] == "queued"
+
+
+def test_job_writes_its_search_results_to_the_corpus_before_returning(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite")
+    job = store.create("topic", Filters())
+    store.claim_next()
+
+    with patch.dict(corpus_writer._writers, clear=True):
+        writer = get_corpus_writer(tmp_path / "corpus.sqlite", flush_seconds=0.2)
+
+        def fake_stream(topic, filters, thread_id, streaming=False, on_progress=None):
+            writer.submit([Paper(id="p1", source="arxiv", title="Graph networks")])
+            yield "search_node"
+
+        with patch("src.graph.run_graph.stream_review", side_effect=fake_stream), \
+             patch("src.graph.run_graph.review_stage_count", return_value=1), \
+             patch("src.graph.run_graph.review_state", return_value={}):
+            # A worker process exits right after its job, without running atexit hooks
+            assert execute_job(str(store.path), job["job_id"]) == "done"
+        assert writer.written == 1
+
+
+def test_dispatcher_survives_a_worker_process_dying_mid_job(tmp_path, monkeypatch):
+    monkeypatch.setattr(worker, "execute_job", _job_that_crashes_its_worker)
+    store = JobStore(tmp_path / "jobs.sqlite")
+    crash = store.create("crash", Filters())
+    dispatcher = JobDispatcher(store, max_concurrent=1, mode="process", poll_interval=0.05)
+    dispatcher.start()
+    try:
+        assert _wait_for(lambda: store.get(crash["job_id"])["status"] == "failed", timeout=30)
+        # The pool is broken now; the next job still runs, on a new pool
+        ok = store.create("ok", Filters())
+        dispatcher.notify()
+        assert _wait_for(lambda: store.get(ok["job_id"])["status"] == "done", timeout=30)
+        assert dispatcher._thread.is_alive()
+    finally:
+        dispatcher.stop(wait=True)
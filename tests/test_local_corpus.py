@@ -0,0 +1,158 @@
+import gzip
+import json
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from typer.testing import CliRunner
+
+from src.cli.main import app
+from src.models import Paper, Provenance, SearchFilters
+from src.search.corpus_ingest import detect_format, ingest_paths
+from src.search.corpus_writer import CorpusWriter
+from src.search.local_corpus import fts_query, get_local_corpus
+from src.tools.registry import get_tool
+
+OPENALEX_WORKS = [
+    {
+        "id": "https://openalex.org/W1",
+        "doi": "https://doi.org/10.1000/GNN",
+        "title": "Graph neural networks for molecules",
+        "publication_year": 2021,
+        "authorships": [{"author": {"display_name": "Ada Lovelace"}}],
+        "primary_location": {"source": {"display_name": "NeurIPS"}},
+        "locations": [{"pdf_url": "https://example.org/gnn.pdf"}],
+        "cited_by_count": 42,
+    },
+    {
+        "id": "https://openalex.org/W2",
+        "title": "Convolutional networks for images",
+        "publication_year": 2015,
+        "abstract_inverted_index": {"Image": [0], "classification": [1]},
+        "authorships": [],
+        "primary_location": {"source": {"display_name": "CVPR"}},
+        "locations": [],
+        "cited_by_count": 7,
+    },
+]
+
+CROSSREF_ITEMS = {
+    "items": [
+        {
+            "DOI": "10.1000/gnn",
+            "title": ["Graph neural networks for molecules"],
+            "abstract": "<jats:p>Message passing on molecular graphs.</jats:p>",
+            "author": [{"given": "Ada", "family": "Lovelace"}],
+            "issued": {"date-parts": [[2021]]},
+            "container-title": ["NeurIPS"],
+            "URL": "https://doi.org/10.1000/gnn",
+        }
+    ]
+}
+
+PUBMED_XML = """<?xml version="1.0"?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>123</PMID>
+      <Article>
+        <Journal><Title>Nature Medicine</Title><JournalIssue><PubDate><Year>2020</Year></PubDate></JournalIssue></Journal>
+        <ArticleTitle>Graph models of protein interaction networks</ArticleTitle>
+        <Abstract><AbstractText>Proteins interact.</AbstractText></Abstract>
+        <AuthorList><Author><LastName>Curie</LastName><ForeName>Marie</ForeName></Author></AuthorList>
+        <ELocationID EIdType="doi">10.2000/protein</ELocationID>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+def _dumps(tmp_path):
+    tmp_path.mkdir()
+    with gzip.open(tmp_path / "part_000.gz", "wt") as f:
+        f.write("\n".join(json.dumps(work) for work in OPENALEX_WORKS))
+    (tmp_path / "crossref-0.json").write_text(json.dumps(CROSSREF_ITEMS))
+    (tmp_path / "pubmed25n0001.xml").write_text(PUBMED_XML)
+    return tmp_path
+
+
+def test_fts_query_drops_operators_and_stopwords():
+    assert fts_query('("graph neural" AND networks) OR GNN-based') == '"graph" OR "neural" OR "networks" OR "gnn"'
+    assert fts_query("the of and") == ""
+
+
+def test_ingest_dumps_merges_by_doi_and_searches_with_filters(tmp_path):
+    dumps = _dumps(tmp_path / "dumps")
+    assert detect_format(dumps / "part_000.gz") == "openalex"
+    corpus = get_local_corpus(tmp_path / "corpus.sqlite", create=True)
+
+    assert ingest_paths(corpus, [dumps]) == 4
+    # The OpenAlex and Crossref records of the same DOI are one paper, with the Crossref abstract filled in
+    assert corpus.count() == 3
+
+    papers = corpus.search("graph networks", SearchFilters(limit=10))
+    assert papers[0].title == "Graph neural networks for molecules"
+    assert papers[0].abstract == "Message passing on molecular graphs."
+    assert papers[0].pdf_url == "https://example.org/gnn.pdf" and papers[0].citations_count == 42
+    assert {p.source for p in papers} == {"crossref", "pubmed", "openalex"}
+
+    assert [p.id for p in corpus.search("networks", SearchFilters(start_year=2020, venues=["nature"]))] == ["123"]
+    assert [p.year for p in corpus.search("networks", SearchFilters(oa_only=True))] == [2021]
+
+    # Unchanged files are skipped on the next run
+    assert ingest_paths(corpus, [dumps]) == 0
+
+
+def test_local_source_searches_configured_corpus(tmp_path, env):
+    path = tmp_path / "corpus.sqlite"
+    env("LOCAL_CORPUS_PATH", str(path))
+    assert get_tool("local")("graph", SearchFilters()) == []
+
+    get_local_corpus(path, create=True).upsert([Paper(id="W9", source="openalex", title="Graph kernels")])
+    start = time.perf_counter()
+    papers = get_tool("local")("graph kernels", SearchFilters())
+    assert time.perf_counter() - start < 0.05
+    assert [p.id for p in papers] == ["W9"]
+
+
+def test_ingest_command(tmp_path):
+    dumps = _dumps(tmp_path / "dumps")
+    result = CliRunner().invoke(
+        app, ["ingest", str(dumps / "pubmed25n0001.xml"), "--corpus", str(tmp_path / "c.sqlite")]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Ingested 1 papers; corpus holds 1" in result.output
+
+
+def test_writer_ingests_search_results_in_the_background(tmp_path):
+    path = tmp_path / "kb.sqlite"
+    writer = CorpusWriter(path, flush_seconds=0.05)
+    arxiv = Paper(
+        id="2101.00001", source="arxiv", title="Graph transformers", doi="10.48550/arXiv.2101.00001",
+        provenance=[Provenance(source="arxiv", rank_in_source=0, query_id="domain")],
+    )
+    writer.submit([arxiv])
+    writer.submit([arxiv.model_copy(update={"id": "W7", "source": "openalex", "citations_count": 3})])
+    assert writer.flush(timeout=5)
+
+    corpus = get_local_corpus(path)
+    found = corpus.lookup(["2101.00001", "W7", "https://doi.org/10.48550/arxiv.2101.00001", "unknown"])
+    assert set(found) == {"2101.00001", "W7", "https://doi.org/10.48550/arxiv.2101.00001"}
+    assert found["W7"].citations_count == 3 and corpus.count() == 1
+
+
+def test_qa_resolves_known_papers_without_searching(tmp_path, env):
+    path = tmp_path / "kb.sqlite"
+    env("LOCAL_CORPUS_PATH", str(path))
+    get_local_corpus(path, create=True).upsert(
+        [Paper(id="W1", source="openalex", title="A randomized trial of graph methods", abstract="A randomized trial.")]
+    )
+    from api import main as api_main
+
+    with patch.object(api_main, "run_search", side_effect=AssertionError("searched")):
+        response = TestClient(api_main.app).post(
+            "/api/qa", json={"question": "randomized graph trial", "paper_ids": ["W1"]}
+        )
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()["citations"]] == ["W1"]
@@ -0,0 +1,104 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.models import Paper
+from src.search.local_corpus import get_local_corpus
+from src.search.paper_resolver import classify_id, resolve_papers
+from src.tools import circuit_breaker, http_client
+from src.tools.openalex_tool import fetch_openalex_works
+from src.tools.semantic_scholar_tool import fetch_s2_papers
+
+
+@pytest.fixture
+def corpus_path(tmp_path, env):
+    path = tmp_path / "kb.sqlite"
+    env("LOCAL_CORPUS_PATH", str(path))
+    env("INGEST_FLUSH_SECONDS", "0.01")
+    return path
+
+
+def test_classify_id():
+    assert classify_id("https://doi.org/10.1000/ABC") == ("doi", "10.1000/abc")
+    assert classify_id("https://openalex.org/w123") == ("openalex", "W123")
+    assert classify_id("http://arxiv.org/abs/2101.00001v2") == ("arxiv", "2101.00001")
+    assert classify_id("cs/0112017") == ("arxiv", "cs/0112017")
+    assert classify_id("31452104") == ("pmid", "31452104")
+    assert classify_id("649def34f8be52c8b66281af98ae884c09aef38b")[0] == "s2"
+    assert classify_id("A title, not an identifier") == ("unknown", "A title, not an identifier")
+
+
+def test_resolve_batches_by_kind_and_writes_back(corpus_path):
+    get_local_corpus(corpus_path, create=True).upsert([Paper(id="W1", source="openalex", title="Known")])
+    calls = []
+
+    def openalex(filter_name, values):
+        calls.append((filter_name, values))
+        if filter_name == "ids.openalex":
+            return [Paper(id=v, source="openalex", title=f"Work {v}") for v in values]
+        return []
+
+    def s2(ids):
+        calls.append(("s2", ids))
+        return [Paper(id="abc", source="semanticscholar", title="From S2", doi="10.1/missing"), None]
+
+    def pubmed(pmids):
+        calls.append(("pubmed", pmids))
+        return [Paper(id=pmid, source="pubmed", title=f"PMID {pmid}") for pmid in pmids]
+
+    with patch("src.tools.openalex_tool.fetch_openalex_works", side_effect=openalex), \
+            patch("src.tools.semantic_scholar_tool.fetch_s2_papers", side_effect=s2), \
+            patch("src.tools.pubmed_tool.fetch_pubmed_articles", side_effect=pubmed):
+        found = resolve_papers(["W1", "W2", "w3", "123", "10.1/missing", "10.1/gone", "Some title"])
+
+    assert set(found) == {"W1", "W2", "w3", "123", "10.1/missing"}
+    assert found["w3"].title == "Work W3"
+    # One batched call per ID kind; the local hit is never fetched; unknown DOIs go on to S2
+    assert sorted(calls, key=str) == sorted(
+        [("ids.openalex", ["W2", "W3"]), ("doi", ["10.1/missing", "10.1/gone"]), ("pubmed", ["123"]),
+         ("s2", ["DOI:10.1/missing", "DOI:10.1/gone"])],
+        key=str,
+    )
+
+    from src.search.corpus_writer import flush_corpus_writers
+
+    flush_corpus_writers()
+    assert set(get_local_corpus(corpus_path).lookup(["W2", "123", "10.1/missing"])) == {"W2", "123", "10.1/missing"}
+
+
+def _client(handler):
+    return patch.object(http_client, "_shared_client", return_value=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_provider_batch_requests():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.host == "api.semanticscholar.org":
+            body = json.loads(request.content)
+            return httpx.Response(200, json=[{"paperId": body["ids"][0], "title": "Found"}, None], request=request)
+        return httpx.Response(200, json={"results": [{"id": "https://openalex.org/W2", "title": "Two"}]})
+
+    with patch.dict(circuit_breaker._breakers, clear=True), _client(handler):
+        assert [p and p.id for p in fetch_s2_papers(["abc", "def"])] == ["abc", None]
+        assert [p.id for p in fetch_openalex_works("ids.openalex", ["W1", "W2"])] == ["W2"]
+
+    assert requests[0].method == "POST" and requests[0].url.path == "/graph/v1/paper/batch"
+    assert requests[1].url.params["filter"] == "ids.openalex:W1|W2"
+
+
+def test_qa_uses_resolution_instead_of_search(corpus_path):
+    from api import main as api_main
+
+    paper = Paper(id="W5", source="openalex", title="A cohort study of graph methods", abstract="A cohort study.")
+    with patch("src.tools.openalex_tool.fetch_openalex_works", return_value=[paper]) as fetch, \
+            patch.object(api_main, "run_search", side_effect=AssertionError("searched")):
+        response = TestClient(api_main.app).post("/api/qa", json={"question": "cohort graph", "paper_ids": ["W5"]})
+
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()["citations"]] == ["W5"]
+    fetch.assert_called_once_with("ids.openalex", ["W5"])
@@ -0,0 +1,47 @@
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.models import Filters, Paper, Summary
+from src.graph import build_graph as graph_module
+from src.graph.build_graph import build_graph
+
+
+def _papers(n):
+    return [
+        Paper(id=f"p{i}", source="arxiv", title=f"Paper {i}", abstract="We propose a novel method.", year=2023)
+        for i in range(n)
+    ]
+
+
+def test_review_graph_runs_independent_stages_in_parallel(tmp_path: Path, monkeypatch, env):
+    monkeypatch.chdir(tmp_path)
+    env("SUMMARY_CACHE", "false")
+
+    spans = []
+
+    def slow(real):
+        def wrapper(*args, **kwargs):
+            start = time.monotonic()
+            time.sleep(0.2)
+            spans.append((start, time.monotonic()))
+            return real(*args, **kwargs)
+        return wrapper
+
+    nodes = {name: slow(node) for name, node in graph_module.EXPORT_NODES.items()}
+    with patch("src.graph.build_graph.run_search", return_value=_papers(3)), \
+         patch("src.agents.summarize_agent._llm_summary", return_value=Summary(tldr="t", results="r")), \
+         patch.dict(graph_module.EXPORT_NODES, nodes), \
+         patch.dict(graph_module._checkpointers, clear=True):
+        g = build_graph(str(tmp_path / "checkpoints.sqlite"))
+        out = g.invoke({"topic": "parallel test", "filters": Filters(limit=3)}, {"configurable": {"thread_id": "t1"}})
+
+    # The three exporters overlap rather than running back to back
+    assert len(spans) == 3
+    assert max(start for start, _ in spans) < min(end for _, end in spans)
+    assert Path(out["report_md"]).exists()
+    assert Path(out["report_json"]).exists()
+    assert Path(out["report_csv"]).exists()
+    assert len(out["reviews"]) == 3
+    assert all(r.critique is not None for r in out["reviews"])
+    assert out["synthesis"].executive_summary
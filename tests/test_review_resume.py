@@ -0,0 +1,46 @@
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import get_settings
+from src.models import Filters, Paper, Summary
+from src.graph import build_graph as graph_module
+from src.graph import run_graph
+
+
+def test_failed_export_resumes_without_redoing_search_or_summaries(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    settings = replace(
+        get_settings(), checkpoint_path=str(tmp_path / "checkpoints.sqlite"), summary_cache_enabled=False
+    )
+    papers = [Paper(id=f"p{i}", source="arxiv", title=f"Paper {i}", abstract="Text.") for i in range(2)]
+    search = MagicMock(return_value=papers)
+    summarize = MagicMock(return_value=Summary(tldr="t"))
+    attempts = []
+    real_export = graph_module.export_json_node
+
+    def flaky_export(state):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+        return real_export(state)
+
+    with patch("src.graph.run_graph.get_settings", return_value=settings), \
+         patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch("src.graph.build_graph.run_search", search), \
+         patch("src.agents.summarize_agent._llm_summary", summarize), \
+         patch.dict(graph_module.EXPORT_NODES, {"export_json_node": flaky_export}), \
+         patch.dict(graph_module._checkpointers, clear=True), \
+         patch.dict(run_graph._graphs, clear=True):
+        with pytest.raises(OSError):
+            run_graph.run_review("resume test", Filters(limit=2), thread_id="job-1")
+        md, js = run_graph.run_review("resume test", Filters(limit=2), thread_id="job-1")
+        # A finished thread just returns its reports
+        assert run_graph.resume_review("job-1") == (md, js)
+
+    assert search.call_count == 1
+    assert summarize.call_count == 2
+    assert len(attempts) == 2
+    assert Path(md).exists() and Path(js).exists()
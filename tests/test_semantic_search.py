@@ -0,0 +1,122 @@
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.models import Paper, ScoreComponents, SearchFilters
+from src.search import query_cache
+from src.search.fusion import calculate_dense_scores
+from src.search.semantic_search import (
+    LEG_SCORE_FLOOR, hybrid_search, _get_semantic_score, _get_title_score, _normalized_leg_scores,
+    _rank_semantic_results, _rank_hybrid_results,
+)
+
+
+def _paper(pid, semantic=0.0, bm25=0.0):
+    return Paper(
+        id=pid,
+        source="arxiv",
+        title=f"Paper {pid}",
+        score_components=ScoreComponents(semantic=semantic, bm25=bm25),
+        reasons=["unrelated reason: not a number"],
+    )
+
+
+def test_rank_semantic_results_uses_numeric_components():
+    papers = [_paper("a", semantic=0.2, bm25=1.0), _paper("b", semantic=0.9, bm25=0.0), _paper("c", semantic=0.5)]
+
+    ranked = _rank_semantic_results(papers, "query")
+
+    assert [p.id for p in ranked] == ["b", "a", "c"]
+    assert ranked[0].score_components.final == 0.7 * 0.9
+    assert ranked[1].score_components.final == 0.7 * 0.2 + 0.3 * 1.0
+
+
+def test_rank_hybrid_results_fills_hybrid_component():
+    semantic = [_paper("s", semantic=0.9)]
+    title = [_paper("t", bm25=2.0)]
+
+    ranked = _rank_hybrid_results(semantic + title, "q", semantic, title, description_provided=True)
+
+    # A lone hit keeps its own score (clipped to [LEG_SCORE_FLOOR, 1]) before the weighted blend
+    assert [p.id for p in ranked] == ["s", "t"]
+    assert ranked[0].score_components.hybrid == ranked[0].score_components.final == pytest.approx(0.8 * 0.9)
+    assert ranked[1].score_components.hybrid == pytest.approx(0.2)
+
+
+def test_leg_scores_keep_the_weakest_hit_above_an_absent_paper():
+    leg = [_paper("a", semantic=0.9), _paper("b", semantic=0.5), _paper("c", semantic=0.1)]
+
+    scores = _normalized_leg_scores(leg, _get_semantic_score)
+
+    assert scores["a"] == 1.0 and scores["c"] == pytest.approx(LEG_SCORE_FLOOR)
+    assert scores["a"] > scores["b"] > scores["c"] > 0
+    assert _normalized_leg_scores([_paper("lone", semantic=0.3)], _get_semantic_score) == {"lone": 0.3}
+    assert _normalized_leg_scores([_paper("weak", semantic=0.01)], _get_semantic_score) == {"weak": LEG_SCORE_FLOOR}
+    assert _normalized_leg_scores([_paper("unscored")], _get_title_score) == {"unscored": 1.0}
+
+    # The last title hit still counts: it lifts "c" above "d", which ties with it semantically
+    semantic = [_paper("a", semantic=0.9), _paper("d", semantic=0.1), _paper("c", semantic=0.1)]
+    title = [_paper("t", bm25=3.0), _paper("c", bm25=1.0)]
+    ranked = _rank_hybrid_results([*semantic, title[0]], "q", semantic, title)
+    assert [p.id for p in ranked].index("c") < [p.id for p in ranked].index("d")
+
+
+def test_hybrid_search_runs_legs_concurrently_within_budget():
+    def slow_title_leg(query, filters):
+        time.sleep(1.0)
+        return [_paper("late")]
+
+    semantic = [_paper("s1", semantic=0.9), _paper("s2", semantic=0.4)]
+    start = time.time()
+    with patch("src.search.semantic_search.semantic_search", return_value=semantic), \
+         patch("src.agents.search_agent.run_search", side_effect=slow_title_leg):
+        papers = hybrid_search("title", "", SearchFilters(), k=5, latency_budget=0.2)
+
+    assert time.time() - start < 0.9
+    assert [p.id for p in papers] == ["s1", "s2"]
+
+
+def test_hybrid_search_rrf_fuses_both_legs():
+    semantic = [_paper("both", semantic=0.9), _paper("s_only", semantic=0.5)]
+    title = [_paper("t_only"), _paper("both")]
+    with patch("src.search.semantic_search.semantic_search", return_value=semantic), \
+         patch("src.agents.search_agent.run_search", return_value=title):
+        papers = hybrid_search("title", "", SearchFilters(), k=5, fusion="rrf")
+
+    assert papers[0].id == "both"
+    assert {p.id for p in papers} == {"both", "s_only", "t_only"}
+
+
+def test_query_embedding_cache_is_shared_across_callers():
+    query_cache.clear_query_caches()
+    response = MagicMock()
+    response.data = [MagicMock(embedding=[1.0, 0.0])]
+    settings = MagicMock(openai_api_key="sk-test")
+
+    with patch("openai.embeddings.create", return_value=response) as mock_create, \
+         patch("src.config.get_settings", return_value=settings):
+        first = query_cache.embed_text(" graph  neural networks")
+        second = query_cache.embed_text("graph neural networks")
+        calculate_dense_scores([], "graph neural networks")
+        assert mock_create.call_count == 1
+        # The cached vector is that of the text its key stands for
+        assert mock_create.call_args.kwargs["input"] == "graph neural networks"
+
+        # Case changes what gets embedded, so it is part of the key
+        query_cache.embed_text("Graph Neural Networks")
+
+    assert mock_create.call_count == 2
+    assert mock_create.call_args.kwargs["input"] == "Graph Neural Networks"
+    assert first is second
+    query_cache.clear_query_caches()
+
+
+def test_translation_cache_skips_repeat_llm_calls():
+    query_cache.clear_query_caches()
+    translate = MagicMock(return_value="cell annotation")
+
+    assert query_cache.cached_translation("注释 细胞", translate) == "cell annotation"
+    assert query_cache.cached_translation("注释  细胞", translate) == "cell annotation"
+    assert translate.call_count == 1
+    query_cache.clear_query_caches()
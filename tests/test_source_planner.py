@@ -0,0 +1,64 @@
+from src.config_search import get_search_config
+from src.models import SearchFilters
+from src.search.source_planner import plan_sources, topic_cluster
+from src.search.source_stats import get_source_stats
+
+BIOMED_ONLY = {"europe_pmc", "biorxiv", "medrxiv", "pubmed"}
+
+
+def _config(tmp_path, **overrides):
+    return get_search_config().with_overrides(
+        source_stats_path=str(tmp_path / "stats.sqlite"), serpapi_key="key", adaptive_sources=True, **overrides
+    )
+
+
+def test_topic_cluster_uses_domain_terms_and_mesh_concepts():
+    assert topic_cluster("transformer language models").key == "cs"
+    assert topic_cluster("cancer immunotherapy outcomes").key == "biomed"
+    assert topic_cluster("machine learning in healthcare").key == "biomed+cs"
+    assert topic_cluster("history of cartography").key == "general"
+
+
+def test_domain_prior_skips_out_of_domain_sources_without_history(tmp_path):
+    config = _config(tmp_path)
+    skipped = {}
+
+    cs = {p.name for p in plan_sources(SearchFilters(), config, skipped, topic_cluster("graph neural networks"))}
+    biomed = {p.name for p in plan_sources(SearchFilters(), config, {}, topic_cluster("cancer immunotherapy"))}
+    general = {p.name for p in plan_sources(SearchFilters(), config, {}, topic_cluster("history of cartography"))}
+
+    assert not cs & BIOMED_ONLY and {"openalex", "dblp", "arxiv"} <= cs
+    assert set(skipped) == BIOMED_ONLY
+    assert "dblp" not in biomed and BIOMED_ONLY <= biomed
+    assert general == set(config.enable_sources)
+
+
+def test_history_skips_or_reduces_low_contribution_sources(tmp_path):
+    config = _config(tmp_path, source_explore_every=100)
+    cluster = topic_cluster("graph neural networks")
+    stats = get_source_stats(config.source_stats_path)
+    for _ in range(config.source_min_runs):
+        stats.record(
+            cluster.key,
+            yields={"openalex": 80, "dblp": 40, "arxiv": 30, "pubmed": 20, "crossref": 50},
+            latencies={"openalex": 1.0, "dblp": 1.0, "arxiv": 1.0, "pubmed": 1.0, "crossref": 5.0},
+            contributions={"openalex": 0.6, "dblp": 0.0, "arxiv": 0.05, "pubmed": 0.3, "crossref": 0.05},
+        )
+
+    skipped = {}
+    plans = {p.name: p for p in plan_sources(SearchFilters(limit=50), config, skipped, cluster)}
+
+    assert "dblp" in skipped and "dblp" not in plans
+    assert plans["arxiv"].reduced and plans["arxiv"].filters.limit == 25
+    # Low contribution and much slower than its peers: dropped for tail latency
+    assert "crossref" in skipped and skipped["crossref"].startswith("slow")
+    # Enough history overrides the domain prior
+    assert "pubmed" in plans and not plans["openalex"].reduced
+
+
+def test_exploration_round_queries_every_source(tmp_path):
+    config = _config(tmp_path, source_explore_every=1)
+
+    plans = plan_sources(SearchFilters(), config, {}, topic_cluster("graph neural networks"))
+
+    assert {p.name for p in plans} == set(config.enable_sources)
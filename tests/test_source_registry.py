@@ -0,0 +1,64 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config_search import get_search_config
+from src.models import Paper, SearchFilters
+from src.search.source_planner import plan_sources
+from src.tools import registry
+from src.tools.registry import (
+    SourceAdapter, SourceCapabilities, get_tool, paper_sources, produced_by, register_source, source_names,
+)
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_adapters", dict(registry._adapters))
+    monkeypatch.setattr(registry, "_loaded", dict(registry._loaded))
+    monkeypatch.setattr(registry, "_paper_sources", registry._paper_sources)
+
+
+def test_paper_source_is_validated_against_registry():
+    assert Paper(id="g1", source="google_scholar", title="T").source == "google_scholar"
+    with pytest.raises(ValidationError):
+        Paper(id="x1", source="nowhere", title="T")
+    assert set(get_search_config().enable_sources) == set(source_names())
+
+
+def test_registered_plugin_is_searchable_and_a_valid_paper_source(isolated_registry):
+    def search_local(query, filters):
+        return [Paper(id="l1", source="local", title=query)]
+
+    register_source(SourceAdapter("local", search_local, SourceCapabilities(year_filter=True)))
+
+    assert [p.title for p in get_tool("local")("graphs", SearchFilters())] == ["graphs"]
+
+
+def test_local_corpus_may_return_papers_of_every_source(isolated_registry):
+    assert produced_by("local") == paper_sources()
+    assert {"arxiv", "semanticscholar", "openalex"} <= produced_by("local")
+    assert "local" not in paper_sources()
+
+    register_source(SourceAdapter("zenodo", lambda query, filters: []))
+    assert "zenodo" in produced_by("local")
+    assert produced_by("zenodo") == {"zenodo"}
+
+
+def test_plan_pushes_down_supported_filters_and_skips_unusable_sources():
+    config = get_search_config().with_overrides(serpapi_key=None, serper_api_key=None)
+    filters = SearchFilters(start_year=2020, venues=["NeurIPS"], limit=30)
+    skipped = {}
+
+    plans = {plan.name: plan for plan in plan_sources(filters, config, skipped)}
+
+    assert plans["openalex"].pushed_down == ["year", "venue"] and plans["openalex"].post_filter == []
+    assert plans["openalex"].filters.limit == 30
+    # Crossref can apply neither, so it fetches a full page for post-filtering
+    assert plans["crossref"].post_filter == ["year", "venue"] and plans["crossref"].filters.limit == 100
+    assert "scholar" not in plans and "serpapi_key" in skipped["scholar"]
+    assert filters.limit == 30  # per-source copies, the caller's filters are untouched
+
+
+def test_plan_honours_requested_sources():
+    plans = plan_sources(SearchFilters(enabled_sources=["arxiv", "dblp"]), get_search_config())
+
+    assert [plan.name for plan in plans] == ["arxiv", "dblp"]
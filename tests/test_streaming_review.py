@@ -0,0 +1,137 @@
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config import get_settings
+from src.models import Filters, Paper, Summary
+from src.agents import search_agent, summarize_agent
+from src.agents.summarize_agent import StreamingSummarizer
+from src.graph import build_graph as graph_module
+from src.graph.build_graph import build_graph
+
+
+def _paper(pid, title=None):
+    return Paper(id=pid, source="arxiv", title=title or f"Graph networks {pid}", abstract=f"Abstract about {pid}.")
+
+
+def _source(papers, delay):
+    def search(topic, filters):
+        time.sleep(delay)
+        return papers
+    return search
+
+
+def test_iter_search_yields_provisional_then_final_ranking():
+    fast, slow = [_paper("a"), _paper("b")], [_paper("c")]
+    sources = [_source(fast, 0.0), _source([], 0.05), _source(slow, 0.2)]
+    filters = Filters(limit=5)
+    with patch.object(search_agent, "SOURCES", sources), \
+         patch.object(search_agent, "enrich_papers_with_crossref", side_effect=lambda ps: ps):
+        start = time.time()
+        stream = search_agent.iter_search("graph networks", filters)
+        first, is_final = next(stream)
+        first_at = time.time() - start
+        rest = list(stream)
+        expected = search_agent.run_search("graph networks", filters)
+
+    assert not is_final and first_at < 0.15
+    assert {p.id for p in first} == {"a", "b"}
+    final, is_final = rest[-1]
+    assert is_final
+    assert [p.id for p in final] == [p.id for p in expected]
+
+
+def test_streaming_summarizer_cancels_queued_papers_that_drop_out():
+    settings = replace(get_settings(), summary_timeout=2.0, summary_cache_enabled=False)
+    started = []
+    gate = threading.Event()
+
+    def fake_summary(paper, chain=None):
+        started.append(paper.id)
+        gate.wait(1)
+        return Summary(tldr=f"llm {paper.id}")
+
+    a, b, c, d = (_paper(x) for x in "abcd")
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_get_chain", return_value=None), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=fake_summary):
+        summarizer = StreamingSummarizer(max_concurrency=1)
+        summarizer.update([a, b, c, d])  # a runs, b is queued
+        summarizer.update([a, c, d])  # b fell out before it started
+        gate.set()
+        summaries = summarizer.finish([a, c, d])
+
+    assert summarizer.cancelled == 1
+    assert "b" not in started
+    assert [s.tldr for s in summaries] == ["llm a", "llm c", "llm d"]
+
+
+def test_streaming_summarizer_reuses_summaries_of_papers_enriched_before_the_final_ranking():
+    settings = replace(get_settings(), summary_timeout=2.0, summary_cache_enabled=False)
+    started = []
+
+    def fake_summary(paper, chain=None):
+        started.append(paper.id)
+        return Summary(tldr=f"llm {paper.id}")
+
+    a = _paper("a")
+    enriched = a.model_copy(update={"title": "A, as Crossref spells it", "venue": "Nature", "year": 2021})
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_get_chain", return_value=None), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=fake_summary):
+        summarizer = StreamingSummarizer(max_concurrency=1)
+        summarizer.update([a])
+        summaries = summarizer.finish([enriched])
+
+    assert started == ["a"]
+    assert [s.tldr for s in summaries] == ["llm a"]
+
+
+def test_streaming_graph_reviews_final_ranking(tmp_path: Path, monkeypatch, env):
+    monkeypatch.chdir(tmp_path)
+    env("SUMMARY_CACHE", "false")
+    a, b, c = _paper("a"), _paper("b"), _paper("c")
+
+    def fake_iter_search(topic, filters):
+        yield [a, b], False
+        yield [c, a], True
+
+    with patch("src.graph.build_graph.iter_search", side_effect=fake_iter_search), \
+         patch("src.agents.summarize_agent._llm_summary", side_effect=lambda p, chain=None: Summary(tldr=p.id)), \
+         patch.dict(graph_module._checkpointers, clear=True):
+        graph = build_graph(str(tmp_path / "checkpoints.sqlite"), streaming=True)
+        out = graph.invoke({"topic": "stream", "filters": Filters(limit=2)}, {"configurable": {"thread_id": "t1"}})
+
+    assert [p.id for p in out["raw_papers"]] == ["c", "a"]
+    assert [r.summary.tldr for r in out["reviews"]] == ["c", "a"]
+    assert Path(out["report_md"]).exists()
+
+
+def test_streaming_node_drops_queued_summaries_when_the_search_fails(env):
+    env("SUMMARY_CACHE", "false")
+    started = []
+    gate = threading.Event()
+
+    def fake_summary(paper, chain=None):
+        started.append(paper.id)
+        gate.wait(1)
+        return Summary(tldr=paper.id)
+
+    def failing_iter_search(topic, filters):
+        yield [_paper(x) for x in "abcd"], False
+        raise RuntimeError("search failed")
+
+    with patch("src.graph.build_graph.iter_search", side_effect=failing_iter_search), \
+         patch.object(summarize_agent, "_get_chain", return_value=None), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=fake_summary), \
+         patch.object(graph_module, "StreamingSummarizer", lambda: StreamingSummarizer(max_concurrency=1)):
+        with pytest.raises(RuntimeError, match="search failed"):
+            graph_module.stream_search_summarize_node({"topic": "stream", "filters": Filters(limit=4)})
+        gate.set()
+        time.sleep(0.1)
+
+    assert started == ["a"]
@@ -0,0 +1,108 @@
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from src import llm
+from src.config import get_settings
+from src.models import Paper, Summary
+from src.agents import summarize_agent
+from src.agents.summarize_agent import summarize_papers
+from src.agents.summary_cache import SummaryCache
+
+
+@pytest.fixture
+def fast_settings():
+    settings = replace(
+        get_settings(), summary_timeout=0.3, summary_concurrency_openai=4, llm_provider="openai",
+        summary_cache_enabled=False,
+    )
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings):
+        yield settings
+
+
+def _papers(n):
+    return [Paper(id=f"p{i}", source="arxiv", title=f"T{i}", abstract=f"Abstract {i}.") for i in range(n)]
+
+
+def test_summarize_papers_is_concurrent_and_ordered(fast_settings):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_summary(paper, chain=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05 if paper.id != "p0" else 0.1)
+        with lock:
+            active[0] -= 1
+        return Summary(tldr=paper.id)
+
+    with patch.object(summarize_agent, "_llm_summary", side_effect=fake_summary):
+        summaries = summarize_papers(_papers(8))
+
+    assert [s.tldr for s in summaries] == [f"p{i}" for i in range(8)]
+    assert 1 < peak[0] <= 4
+
+
+def test_summarize_papers_falls_back_to_heuristic_on_timeout(fast_settings):
+    def hanging_summary(paper, chain=None):
+        if paper.id == "p1":
+            time.sleep(2)
+        return Summary(tldr="llm")
+
+    with patch.object(summarize_agent, "_llm_summary", side_effect=hanging_summary):
+        start = time.time()
+        summaries = summarize_papers(_papers(2))
+
+    assert time.time() - start < 1.5
+    assert summaries[0].tldr == "llm"
+    assert summaries[1].tldr == "Abstract 1."
+
+
+def test_llm_client_and_chain_are_built_once_per_model(fast_settings):
+    llm.clear_chat_models()
+    summarize_agent._chains.clear()
+    with patch("src.llm._build_chat_model", side_effect=lambda *key: object()) as mock_build, \
+         patch("src.agents.summarize_agent.PROMPT") as mock_prompt:
+        first = summarize_agent._get_chain()
+        second = summarize_agent._get_chain()
+
+    assert first is second
+    assert mock_build.call_count == 1
+    assert mock_prompt.__or__.call_count == 1
+    llm.clear_chat_models()
+    summarize_agent._chains.clear()
+
+
+def test_summary_cache_skips_llm_for_seen_papers(fast_settings, tmp_path):
+    settings = replace(fast_settings, summary_cache_enabled=True, summary_cache_path=str(tmp_path / "s.sqlite"))
+    calls = []
+
+    def fake_summary(paper, chain=None):
+        calls.append(paper.id)
+        return Summary(tldr=f"llm {paper.id}")
+
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=fake_summary):
+        first = summarize_papers(_papers(3))
+        # Same content under a different id (e.g. re-fetched from another source) still hits
+        again = _papers(4)
+        again[0] = again[0].model_copy(update={"id": "other"})
+        second = summarize_papers(again)
+
+    assert [s.tldr for s in first] == ["llm p0", "llm p1", "llm p2"]
+    assert [s.tldr for s in second] == ["llm p0", "llm p1", "llm p2", "llm p3"]
+    assert sorted(calls) == ["p0", "p1", "p2", "p3"]
+
+
+def test_summary_cache_invalidates_on_prompt_change(tmp_path):
+    path = tmp_path / "s.sqlite"
+    paper = _papers(1)[0]
+    SummaryCache(path, "v1").put_many([(paper, Summary(tldr="old"))], "openai:m")
+
+    assert SummaryCache(path, "v1").get_many([paper], "openai:m")[0].tldr == "old"
+    assert SummaryCache(path, "v1").get_many([paper], "openai:other") == {}
+    assert SummaryCache(path, "v2").get_many([paper], "openai:m") == {}
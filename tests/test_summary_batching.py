@@ -0,0 +1,199 @@
+import json
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import get_settings
+from src.models import Paper, Summary
+from src.agents import summarize_agent
+from src.agents.summarize_agent import _pack_batches, summarize_papers
+
+
+def _papers(n, abstract_len=40):
+    return [
+        Paper(id=f"p{i}", source="arxiv", title=f"T{i}", abstract=f"Abstract {i}. " + "x" * abstract_len)
+        for i in range(n)
+    ]
+
+
+def _settings(**overrides):
+    return replace(
+        get_settings(), llm_provider="openai", summary_timeout=2.0, summary_cache_enabled=False, **overrides
+    )
+
+
+def test_pack_batches_respects_token_budget():
+    papers = _papers(5, abstract_len=400)
+    batches = _pack_batches(list(range(5)), papers, token_budget=2 * summarize_agent._estimate_tokens(papers[0]))
+
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_prompt_batching_retries_invalid_elements_individually():
+    settings = _settings(summary_batch_mode="prompt", summary_batch_tokens=10_000)
+    batch_chain = MagicMock()
+    # Element 1 is missing a valid grounding_score, element 2 is absent altogether
+    batch_chain.invoke.return_value = MagicMock(content=json.dumps([
+        {"index": 0, "tldr": "batched 0"},
+        {"index": 1, "tldr": "batched 1", "grounding_score": "n/a"},
+    ]))
+    single_chain = MagicMock()
+
+    def get_chain(prompt=None):
+        return batch_chain if prompt is summarize_agent.BATCH_PROMPT else single_chain
+
+    retried = []
+
+    def single(paper, chain=None):
+        retried.append(paper.id)
+        return Summary(tldr=f"single {paper.id}")
+
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_get_chain", side_effect=get_chain), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=single):
+        summaries = summarize_papers(_papers(3))
+
+    assert batch_chain.invoke.call_count == 1
+    assert [s.tldr for s in summaries] == ["batched 0", "single p1", "single p2"]
+    assert sorted(retried) == ["p1", "p2"]
+
+
+def test_batch_prompt_summaries_are_cached_apart_from_single_paper_ones(tmp_path):
+    cached = dict(summary_cache_enabled=True, summary_cache_path=str(tmp_path / "s.sqlite"))
+    batch_chain = MagicMock()
+    batch_chain.invoke.return_value = MagicMock(content=json.dumps([
+        {"index": 0, "tldr": "batched 0"}, {"index": 1, "tldr": "batched 1"},
+    ]))
+
+    def get_chain(prompt=None):
+        return batch_chain if prompt is summarize_agent.BATCH_PROMPT else MagicMock()
+
+    def single(paper, chain=None):
+        return Summary(tldr=f"single {paper.id}")
+
+    def run(**overrides):
+        settings = replace(_settings(summary_batch_tokens=10_000, **overrides), **cached)
+        with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+             patch.object(summarize_agent, "_get_chain", side_effect=get_chain), \
+             patch.object(summarize_agent, "_llm_summary", side_effect=single) as llm_summary:
+            return [s.tldr for s in summarize_papers(_papers(2))], llm_summary.call_count
+
+    assert run(summary_batch_mode="prompt") == (["batched 0", "batched 1"], 0)
+    # A per-paper run never gets batch-prompt output back
+    assert run(summary_batch_mode="off") == (["single p0", "single p1"], 2)
+    # Batch runs prefer the per-paper summaries now cached, and do not call the LLM again
+    assert run(summary_batch_mode="prompt") == (["single p0", "single p1"], 0)
+    assert batch_chain.invoke.call_count == 1
+
+
+class _StubBatchAPI(BaseHTTPRequestHandler):
+    """Minimal OpenAI + Anthropic batch endpoints; each batch reports in-progress once"""
+
+    polls: dict = {}
+    uploads: dict = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload, raw=False):
+        body = payload.encode() if raw else json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    @staticmethod
+    def _summary(custom_id):
+        return json.dumps({"tldr": f"batch {custom_id}", "grounding_score": 0.9})
+
+    def do_POST(self):
+        body = self._body()
+        if self.path == "/files":
+            # Pull the JSONL payload out of the multipart body
+            lines = [line for line in body.decode().splitlines() if line.startswith("{")]
+            self.uploads["file-1"] = [json.loads(line) for line in lines]
+            self._send({"id": "file-1"})
+        elif self.path == "/batches":
+            self._send({"id": "batch-1", "status": "validating"})
+        elif self.path == "/v1/messages/batches":
+            self.uploads["msgbatch-1"] = json.loads(body)["requests"]
+            self._send({"id": "msgbatch-1", "processing_status": "in_progress"})
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        if self.path == "/batches/batch-1":
+            self.polls["batch-1"] = self.polls.get("batch-1", 0) + 1
+            done = self.polls["batch-1"] > 1
+            self._send({
+                "id": "batch-1",
+                "status": "completed" if done else "in_progress",
+                "output_file_id": "file-out" if done else None,
+            })
+        elif self.path == "/files/file-out/content":
+            lines = []
+            for request in self.uploads["file-1"]:
+                content = self._summary(request["custom_id"])
+                lines.append(json.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+                    "error": None,
+                }))
+            self._send("\n".join(lines), raw=True)
+        elif self.path == "/v1/messages/batches/msgbatch-1":
+            host, port = self.server.server_address
+            self._send({
+                "id": "msgbatch-1",
+                "processing_status": "ended",
+                "results_url": f"http://{host}:{port}/v1/messages/batches/msgbatch-1/results",
+            })
+        elif self.path == "/v1/messages/batches/msgbatch-1/results":
+            lines = []
+            for n, request in enumerate(self.uploads["msgbatch-1"]):
+                # The last request errors and must fall back to a live call
+                if n == len(self.uploads["msgbatch-1"]) - 1:
+                    result = {"type": "errored"}
+                else:
+                    text = self._summary(request["custom_id"])
+                    result = {"type": "succeeded", "message": {"content": [{"type": "text", "text": text}]}}
+                lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+            self._send("\n".join(lines), raw=True)
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubBatchAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_openai_batch_api_mode(stub_server):
+    settings = _settings(summary_batch_mode="batch_api", summary_batch_poll_interval=0.01, openai_base_url=stub_server)
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=AssertionError("no live calls")):
+        summaries = summarize_papers(_papers(3))
+
+    assert [s.tldr for s in summaries] == ["batch paper-0", "batch paper-1", "batch paper-2"]
+
+
+def test_anthropic_batch_api_mode_retries_failed_requests(stub_server):
+    settings = replace(
+        _settings(summary_batch_mode="batch_api", summary_batch_poll_interval=0.01, anthropic_base_url=stub_server),
+        llm_provider="anthropic",
+    )
+    with patch("src.agents.summarize_agent.get_settings", return_value=settings), \
+         patch.object(summarize_agent, "_get_chain", return_value=None), \
+         patch.object(summarize_agent, "_llm_summary", side_effect=lambda p, chain=None: Summary(tldr="live")):
+        summaries = summarize_papers(_papers(3))
+
+    assert [s.tldr for s in summaries] == ["batch paper-0", "batch paper-1", "live"]
@@ -0,0 +1,71 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.models import Paper, SearchFilters
+from src.search import warmup
+from src.search.semantic_search import semantic_search
+
+
+@pytest.fixture(autouse=True)
+def reset_ready_flag():
+    warmup._ready.clear()
+    yield
+    warmup._ready.clear()
+
+
+def _paper_dict(i):
+    return {"id": f"p{i}", "source": "arxiv", "title": f"Paper {i}", "abstract": "Text", "year": 2023}
+
+
+def test_load_corpus_file_supports_json_and_jsonl(tmp_path):
+    jsonl = tmp_path / "corpus.jsonl"
+    jsonl.write_text("\n".join(json.dumps(_paper_dict(i)) for i in range(3)), encoding="utf-8")
+    as_array = tmp_path / "corpus.json"
+    as_array.write_text(json.dumps([_paper_dict(i) for i in range(2)]), encoding="utf-8")
+
+    assert [p.id for p in warmup.load_corpus_file(jsonl)] == ["p0", "p1", "p2"]
+    assert len(warmup.load_corpus_file(as_array)) == 2
+
+
+def test_warm_embedding_store_seeds_from_corpus_and_sets_ready(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text("\n".join(json.dumps(_paper_dict(i)) for i in range(2)), encoding="utf-8")
+
+    store = MagicMock()
+    store.get_stats.side_effect = [{"total_papers": 0}, {"total_papers": 2}]
+
+    with patch("src.search.warmup.get_embedding_store", return_value=store), \
+         patch("src.search.semantic_search.populate_embedding_store") as mock_populate:
+        total = warmup.warm_embedding_store(topics=[], corpus_path=corpus)
+
+    assert total == 2
+    assert warmup.is_embedding_store_ready()
+    seeded = mock_populate.call_args[0][0]
+    assert [p.id for p in seeded] == ["p0", "p1"]
+
+
+def test_warm_embedding_store_skips_populated_store():
+    store = MagicMock()
+    store.get_stats.return_value = {"total_papers": 5}
+
+    with patch("src.search.warmup.get_embedding_store", return_value=store), \
+         patch("src.search.semantic_search.populate_embedding_store") as mock_populate:
+        assert warmup.warm_embedding_store(topics=["ml"]) == 5
+
+    mock_populate.assert_not_called()
+    assert warmup.is_embedding_store_ready()
+
+
+def test_semantic_search_does_not_block_on_cold_store():
+    fallback = [Paper(id="f1", source="arxiv", title="Fallback")]
+
+    with patch("src.search.semantic_search.start_background_warmup") as mock_start, \
+         patch("src.search.semantic_search._fallback_to_traditional_search", return_value=fallback), \
+         patch("src.search.semantic_search.get_embedding_store") as mock_store:
+        papers = semantic_search("graph neural networks", SearchFilters(), k=5)
+
+    assert papers == fallback
+    mock_start.assert_called_once()
+    mock_store.assert_not_called()